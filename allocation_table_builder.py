@@ -0,0 +1,314 @@
+from bisect import bisect_right
+from configparser import ConfigParser
+from copy import copy
+from cresp_optimizer import CrespOptimizer, CrespResult
+from numpy import arange, concatenate, dtype, float64, full, int64, load, save, searchsorted, zeros
+from pathlib import Path
+from time import time
+from sys import exit
+
+
+# ONE RECORD PER (OPTIMIZATION PROBLEM, φ OR τ BUCKET, M); RECORDS ARE SORTED BY THESE THREE FIELDS
+ALLOCATION_TABLE_DTYPE = dtype([("problem", "i1"),
+                                ("bound", "f8"),
+                                ("M", "i8"),
+                                ("m", "i4"),
+                                ("R", "i4"),
+                                ("Nu", "i4"),
+                                ("T3", "f8"),
+                                ("C", "f8")])
+
+
+class AllocationTable:
+    # READ-ONLY VIEW (MEMORY-MAPPED) OF A TABLE BUILT BY AllocationTableBuilder. A QUERY RETURNS:
+    # - AN EXACT HIT, IF ITS M AND ITS φ (OR τ) ARE ON THE GRID;
+    # - OTHERWISE A SAFE NEIGHBOUR: THE ALLOCATION OF THE CLOSEST GRID BUCKET BELOW ITS φ (OR τ), TAKEN FROM THE
+    #   CLOSEST GRID M VALUES AND RE-EVALUATED FOR ITS OWN M, WHICH MUST STILL MEET ITS φ (OR τ) CONSTRAINT;
+    # - OTHERWISE A LIVE SOLVE, WITH THE GIVEN CrespOptimizer (LOADED AS IN AllocationTableBuilder's main, I.E., ITS υ
+    #   STILL PER HOUR)
+    def __init__(self,
+                 allocation_table_file_path: Path,
+                 cresp_optimizer: CrespOptimizer,
+                 mode: str = "structured") -> None:
+        self.allocation_table_file_path = allocation_table_file_path
+        self.allocation_table_metadata_file_path = allocation_table_file_path.with_suffix(".cfg")
+        self.cresp_optimizer = cresp_optimizer
+        self.mode = mode
+        self.records = None
+        self.bounds = {}
+        self.exact_hits = 0
+        self.neighbour_hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.allocation_table_metadata_file_path, encoding="utf-8")
+        if cp.get("metadata", "fingerprint", fallback=None) == \
+                AllocationTableBuilder.get_fingerprint(self.cresp_optimizer):
+            # STALE TABLES (OTHER β PARAMETERS, γ, υ, BOUNDS OR UNITS) ARE IGNORED: EVERY QUERY IS SOLVED LIVE
+            self.records = load(self.allocation_table_file_path, mmap_mode="r")
+            self.bounds = {1: [float(phi) for phi in cp.get("metadata", "φ").split(", ")],
+                           2: [float(tau) for tau in cp.get("metadata", "τ").split(", ")],
+                           3: [0.0]}
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    def get_bucket_records(self,
+                           optimization_problem: int,
+                           bound: float):
+        first = searchsorted(self.records["problem"], optimization_problem, side="left")
+        last = searchsorted(self.records["problem"], optimization_problem, side="right")
+        problem_records = self.records[first:last]
+        first = searchsorted(problem_records["bound"], bound, side="left")
+        last = searchsorted(problem_records["bound"], bound, side="right")
+        return problem_records[first:last]
+
+    def solve_live(self,
+                   M: int,
+                   optimization_problem: int,
+                   Phi: float,
+                   Tau: float) -> CrespResult:
+        self.misses += 1
+        scenario_optimizer = copy(self.cresp_optimizer)
+        scenario_optimizer.optimization_problem = optimization_problem
+        parameters = scenario_optimizer.get_scenario_parameters(M,
+                                                                self.cresp_optimizer.Gamma,
+                                                                self.cresp_optimizer.Upsilon,
+                                                                Phi,
+                                                                Tau)
+        return self.cresp_optimizer.solve(parameters, self.mode)
+
+    def get_allocation(self,
+                       M: int,
+                       optimization_problem: int,
+                       Phi: float = 0.0,
+                       Tau: float = 0.0) -> CrespResult:
+        if self.records is None:
+            return self.solve_live(M, optimization_problem, Phi, Tau)
+        bounds = self.bounds[optimization_problem]
+        query_bound = {1: Phi, 2: Tau, 3: 0.0}[optimization_problem]
+        bucket_index = bisect_right(bounds, query_bound) - 1
+        if bucket_index < 0:
+            return self.solve_live(M, optimization_problem, Phi, Tau)
+        bucket_records = self.get_bucket_records(optimization_problem, bounds[bucket_index])
+        M_index = int(searchsorted(bucket_records["M"], M, side="left"))
+        if M_index < len(bucket_records) and bucket_records["M"][M_index] == M:
+            record = bucket_records[M_index]
+            if record["m"] > 0 and bounds[bucket_index] == query_bound:
+                self.exact_hits += 1
+                return CrespResult(int(record["m"]), int(record["R"]), float(record["T3"]), float(record["C"]),
+                                   int(record["Nu"]))
+            neighbour_records = [record]
+        else:
+            neighbour_records = [bucket_records[i] for i in (M_index - 1, M_index) if 0 <= i < len(bucket_records)]
+        # RE-EVALUATE THE NEIGHBOUR ALLOCATIONS FOR THE QUERIED M, KEEPING THE BEST ONE THAT MEETS THE CONSTRAINT
+        scenario_optimizer = copy(self.cresp_optimizer)
+        scenario_optimizer.optimization_problem = optimization_problem
+        parameters = scenario_optimizer.get_scenario_parameters(M,
+                                                                self.cresp_optimizer.Gamma,
+                                                                self.cresp_optimizer.Upsilon,
+                                                                Phi,
+                                                                Tau)
+        result = CrespResult()
+        for record in neighbour_records:
+            m, R = int(record["m"]), int(record["R"])
+            if m == 0:
+                continue
+            T3 = parameters.calculate_T3(m, R)
+            C = parameters.calculate_C(T3, m, R)
+            if optimization_problem != 3 and not parameters.is_constraint_not_violated(C, T3):
+                continue
+            if (T3 < result.T3) if optimization_problem == 1 else (C < result.C):
+                result = CrespResult(m, R, T3, C, parameters.calculate_optimal_number_of_vms(m, R))
+        if not result.is_feasible():
+            return self.solve_live(M, optimization_problem, Phi, Tau)
+        self.neighbour_hits += 1
+        return result
+
+    def get_statistics(self) -> dict:
+        return {"exact_hits": self.exact_hits,
+                "neighbour_hits": self.neighbour_hits,
+                "misses": self.misses}
+
+
+class AllocationTableBuilder:
+
+    def __init__(self) -> None:
+        self.allocation_table_builder_config_file_path = Path("config/allocation_table_builder.cfg")
+        self.allocation_table_file_path = None
+        self.M_values = None
+        self.Phi_buckets = []
+        self.Tau_buckets = []
+        self.records = None
+
+    def get_allocation_table_file_path(self,
+                                       config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'allocation_table_file' must be a valid path file!" \
+            .format(self.allocation_table_builder_config_file_path)
+        try:
+            allocation_table_file_path = Path(config_parser.get("general", "allocation_table_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return allocation_table_file_path
+
+    def get_M_values(self,
+                     config_parser: ConfigParser):
+        exception_message = "{0}: 'M' (number of Map tasks) must be a valid integer range " \
+                            "(with an optional positive step, e.g., 1...1000:10)!" \
+            .format(self.allocation_table_builder_config_file_path)
+        try:
+            M_range, _, M_step = config_parser.get("grid", "M").partition(":")
+            M_range_list = M_range.split("...")
+            M_lower = int(M_range_list[0])
+            M_higher = int(M_range_list[1])
+            M_step = int(M_step) if len(M_step) > 0 else 1
+            if M_lower <= 0 or M_higher < M_lower or M_step <= 0:
+                raise ValueError(exception_message)
+        except (ValueError, IndexError):
+            raise ValueError(exception_message)
+        return arange(M_lower, M_higher + 1, M_step, dtype=int64)
+
+    def get_buckets(self,
+                    config_parser: ConfigParser,
+                    bucket: str) -> list:
+        exception_message = "{0}: '{1}' buckets must be a list of float values higher than zero!" \
+            .format(self.allocation_table_builder_config_file_path, bucket)
+        try:
+            buckets = sorted(set(float(value) for value in config_parser.get("grid", bucket).split(",")))
+            if buckets[0] <= 0.0:
+                raise ValueError(exception_message)
+        except (ValueError, IndexError):
+            raise ValueError(exception_message)
+        return buckets
+
+    def load_general_settings(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.allocation_table_builder_config_file_path, encoding="utf-8")
+        self.allocation_table_file_path = self.get_allocation_table_file_path(cp)
+        self.M_values = self.get_M_values(cp)
+        self.Phi_buckets = self.get_buckets(cp, "φ")
+        self.Tau_buckets = self.get_buckets(cp, "τ")
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    @staticmethod
+    def get_fingerprint(cresp_optimizer: CrespOptimizer) -> str:
+        # EVERY SETTING, OTHER THAN THE GRID ITSELF, THAT THE TABULATED ALLOCATIONS DEPEND ON
+        return "{0}|{1}|{2}|{3}|{4}|{5}|{6}|{7}".format(cresp_optimizer.get_beta_parameters_fingerprint(),
+                                                        cresp_optimizer.Gamma,
+                                                        float(cresp_optimizer.Upsilon).hex(),
+                                                        cresp_optimizer.m_lower_bound,
+                                                        cresp_optimizer.m_upper_bound,
+                                                        cresp_optimizer.R_lower_bound,
+                                                        cresp_optimizer.R_upper_bound,
+                                                        cresp_optimizer.time_unit)
+
+    def build_allocation_table(self,
+                               cresp_optimizer: CrespOptimizer) -> None:
+        # EVERY (PROBLEM, BUCKET) PAIR IS ONE BATCH OF SCENARIOS, ONE PER M VALUE OF THE GRID
+        tables = []
+        for optimization_problem, buckets in ((1, self.Phi_buckets), (2, self.Tau_buckets), (3, [0.0])):
+            problem_optimizer = copy(cresp_optimizer)
+            problem_optimizer.optimization_problem = optimization_problem
+            for bound in buckets:
+                scenarios_count = len(self.M_values)
+                results = problem_optimizer.optimize_scenarios_batch(
+                    self.M_values,
+                    full(scenarios_count, cresp_optimizer.Gamma, dtype=int64),
+                    full(scenarios_count, cresp_optimizer.Upsilon, dtype=float64),
+                    full(scenarios_count, bound if optimization_problem == 1 else 1.0, dtype=float64),
+                    full(scenarios_count, bound if optimization_problem == 2 else 1.0, dtype=float64))
+                table = zeros(scenarios_count, dtype=ALLOCATION_TABLE_DTYPE)
+                table["problem"] = optimization_problem
+                table["bound"] = bound
+                table["M"] = self.M_values
+                for field in ("m", "R", "Nu", "T3", "C"):
+                    table[field] = results[field]
+                tables.append(table)
+        self.records = concatenate(tables)
+
+    def write_allocation_table(self,
+                               cresp_optimizer: CrespOptimizer) -> None:
+        self.allocation_table_file_path.parent.mkdir(parents=True, exist_ok=True)
+        save(self.allocation_table_file_path, self.records)
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp["metadata"] = {"fingerprint": self.get_fingerprint(cresp_optimizer),
+                          "φ": ", ".join(str(phi) for phi in self.Phi_buckets),
+                          "τ": ", ".join(str(tau) for tau in self.Tau_buckets)}
+        with open(self.allocation_table_file_path.with_suffix(".cfg"), "w", encoding="utf-8") as metadata_file:
+            cp.write(metadata_file)
+        del cp  # DELETE CONFIGPARSER OBJECT
+        print("Generated '{0}' file with {1} allocations ({2} M values × ({3} φ + {4} τ + 1) buckets)."
+              .format(self.allocation_table_file_path,
+                      len(self.records),
+                      len(self.M_values),
+                      len(self.Phi_buckets),
+                      len(self.Tau_buckets)))
+
+
+def main():
+    # INIT ALLOCATION TABLE BUILDER OBJECT
+    atb = AllocationTableBuilder()
+
+    # LOAD GENERAL SETTINGS (allocation table file path, M grid, φ and τ buckets)
+    atb.load_general_settings()
+
+    # INIT CRESP OPTIMIZER OBJECT
+    co = CrespOptimizer()
+
+    # INIT CONFIGPARSER OBJECT
+    cp = ConfigParser()
+
+    # PRESERVE OPTIONS NAMES' CASE
+    cp.optionxform = str
+
+    # READ CONFIG FILE
+    cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
+
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7)
+    co.load_beta_parameters(cp)
+
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
+    # LOAD INPUT PARAMETERS (M, γ, υ, φ, τ); ONLY γ AND υ ARE USED, M, φ AND τ COME FROM THE GRID
+    co.load_input_parameters(cp)
+
+    # LOAD m BOUNDS (lower, upper)
+    co.load_m_bounds(cp)
+
+    # LOAD R BOUNDS (lower, upper)
+    co.load_R_bounds(cp)
+
+    # LOAD MONETARY UNIT [USD]
+    co.load_monetary_unit(cp)
+
+    # LOAD TIME UNIT [second | minute | hour]
+    co.load_time_unit(cp)
+
+    # BUILD THE ALLOCATION TABLE
+    build_start_time = time()
+    atb.build_allocation_table(co)
+    print("Built the allocation table in {0} seconds.".format(time() - build_start_time))
+
+    # WRITE THE ALLOCATION TABLE (BINARY .npy RECORDS, MEMORY-MAPPED AT QUERY TIME) AND ITS METADATA
+    atb.write_allocation_table(co)
+
+    # DELETE CONFIGPARSER OBJECT
+    del cp
+
+    # DELETE CRESP OPTIMIZER OBJECT
+    del co
+
+    # DELETE ALLOCATION TABLE BUILDER OBJECT
+    del atb
+
+    # END
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
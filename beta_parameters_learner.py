@@ -1,19 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
-from math import log
-from numpy import array
+from csv import reader
+from json import loads
+from numpy import arange, argsort, array, asarray, bincount, concatenate, cumsum, empty, finfo, float64, int64, isnan, \
+    load as numpy_load, log, ndarray, newaxis, ones, quantile, savez, sqrt, str_, unique, zeros
+from numpy.linalg import eigh
+from numpy.random import SeedSequence, default_rng
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from scipy.optimize import nnls
 from sys import exit
 
 
+# EXPERIMENTS (THE 8 COLUMNS OF THE "A" MATRIX, THEN THE "b" VECTOR) SHARED BY THE RESAMPLING WORKER PROCESSES: EVERY
+# WORKER ATTACHES TO THE SAME SHARED MEMORY BLOCK ONCE, INSTEAD OF RECEIVING A PICKLED COPY WITH EVERY TASK
+shared_experiments = {}
+
+
 class BetaParametersLearner:
 
     def __init__(self) -> None:
         self.cresp_optimizer_config_file_path = Path("config/cresp_optimizer.cfg")
         self.beta_parameters_learner_config_file_path = Path("config/beta_parameters_learner.cfg")
         self.experiments_input_file_path = None
-        self.A_matrix = []
-        self.b_vector = []
+        self.experiments_columns = ["m", "r", "M", "execution_time_in_seconds"]
+        self.m_column = None
+        self.r_column = None
+        self.M_column = None
+        self.execution_time_column = None
+        self.default_profile = "default"
+        self.profiles = [self.default_profile]
+        self.profile_column = None
+        self.A_matrix = None
+        self.b_vector = None
+        self.learning_mode = "batch"
+        self.sufficient_statistics_file_path = None
+        self.forgetting_factor = 1.0
+        self.A_T_A = zeros((8, 8), dtype=float64)
+        self.A_T_b = zeros(8, dtype=float64)
+        self.b_T_b = 0.0
+        self.experiments_weight = 0.0
+        self.resampling_method = "bootstrap"
+        self.resamples = 0
+        self.folds = 5
+        self.confidence_level = 0.95
+        self.workers = 1
+        self.seed = None
+        self.beta_samples = None
+        self.confidence_intervals = None
+        self.out_of_sample_rmse = None
+        self.model_registry_file_path = None
+        self.model_registry = {}
         self.betaZero = 0.0
         self.betaOne = 0.0
         self.betaTwo = 0.0
@@ -33,11 +70,150 @@ class BetaParametersLearner:
             raise ValueError(exception_message)
         return experiments_input_file_path
 
+    def get_learning_mode(self,
+                          config_parser: ConfigParser) -> str:
+        exception_message = "{0}: supported 'learning_mode' values: batch | online." \
+            .format(self.beta_parameters_learner_config_file_path)
+        learning_mode = str(config_parser.get("general", "learning_mode", fallback="batch"))
+        if learning_mode not in ["batch", "online"]:
+            raise ValueError(exception_message)
+        return learning_mode
+
+    def get_sufficient_statistics_file_path(self,
+                                            config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'sufficient_statistics_file' must be a valid path file (required by the online " \
+                            "learning mode)!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        sufficient_statistics_file = str(config_parser.get("general", "sufficient_statistics_file", fallback=""))
+        if len(sufficient_statistics_file) == 0:
+            if self.learning_mode == "online":
+                raise ValueError(exception_message)
+            return None
+        return Path(sufficient_statistics_file)
+
+    def get_forgetting_factor(self,
+                              config_parser: ConfigParser) -> float:
+        exception_message = "{0}: 'forgetting_factor' (weight kept by the past experiments at every new one) " \
+                            "must be a float value higher than zero and lower or equal to one!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            forgetting_factor = float(config_parser.get("general", "forgetting_factor", fallback="1"))
+            if forgetting_factor <= 0.0 or forgetting_factor > 1.0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return forgetting_factor
+
+    def get_resampling_method(self,
+                              config_parser: ConfigParser) -> str:
+        exception_message = "{0}: supported 'resampling_method' values: bootstrap | k_fold." \
+            .format(self.beta_parameters_learner_config_file_path)
+        resampling_method = str(config_parser.get("resampling", "resampling_method", fallback="bootstrap"))
+        if resampling_method not in ["bootstrap", "k_fold"]:
+            raise ValueError(exception_message)
+        return resampling_method
+
+    def get_resamples(self,
+                      config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'resamples' (number of NNLS refits; 0: no confidence intervals) " \
+                            "must be a integer value equal or higher than zero!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            resamples = int(config_parser.get("resampling", "resamples", fallback="0"))
+            if resamples < 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        if resamples > 0 and self.learning_mode == "online":
+            # THE ONLINE β ARE LEARNED FROM THE SUFFICIENT STATISTICS OF EVERY EXPERIMENT FOLDED IN SO FAR, BUT ONLY THE
+            # NEW ONES COULD BE RESAMPLED: THEIR INTERVALS WOULD DESCRIBE ANOTHER FIT
+            raise ValueError("{0}: 'resamples' must be zero (no confidence intervals) in the online learning mode!"
+                             .format(self.beta_parameters_learner_config_file_path))
+        return resamples
+
+    def get_folds(self,
+                  config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'folds' (number of folds of the k_fold resampling method) " \
+                            "must be a integer value higher than one!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            folds = int(config_parser.get("resampling", "folds", fallback="5"))
+            if folds <= 1:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return folds
+
+    def get_confidence_level(self,
+                             config_parser: ConfigParser) -> float:
+        exception_message = "{0}: 'confidence_level' must be a float value higher than zero and lower than one!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            confidence_level = float(config_parser.get("resampling", "confidence_level", fallback="0.95"))
+            if confidence_level <= 0.0 or confidence_level >= 1.0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return confidence_level
+
+    def get_workers(self,
+                    config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'workers' (number of worker processes) must be a integer value higher than zero!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            workers = int(config_parser.get("resampling", "workers", fallback="1"))
+            if workers <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return workers
+
+    def get_seed(self,
+                 config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'seed' must be empty or a integer value equal or higher than zero!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        seed = str(config_parser.get("resampling", "seed", fallback=""))
+        if len(seed) == 0:
+            return None
+        try:
+            seed = int(seed)
+            if seed < 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return seed
+
+    def get_model_registry_file_path(self,
+                                     config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'model_registry_file' must be empty or a valid path file!" \
+            .format(self.beta_parameters_learner_config_file_path)
+        try:
+            model_registry_file = str(config_parser.get("general", "model_registry_file", fallback=""))
+            model_registry_file_path = Path(model_registry_file) if len(model_registry_file) > 0 else None
+        except ValueError:
+            raise ValueError(exception_message)
+        if model_registry_file_path is not None and self.learning_mode == "online":
+            # EACH ONLINE RUN LOADS ONLY THE NEW EXPERIMENTS: THEIR PER-PROFILE FITS WOULD OVERWRITE THE REGISTRY
+            # ENTRIES LEARNED FROM EVERY EXPERIMENT SEEN SO FAR
+            raise ValueError("{0}: 'model_registry_file' must be empty in the online learning mode!"
+                             .format(self.beta_parameters_learner_config_file_path))
+        return model_registry_file_path
+
     def load_general_settings(self) -> None:
         cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
         cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
         cp.read(self.beta_parameters_learner_config_file_path, encoding="utf-8")
         self.experiments_input_file_path = self.get_experiments_input_file_path(cp)
+        self.learning_mode = self.get_learning_mode(cp)
+        self.sufficient_statistics_file_path = self.get_sufficient_statistics_file_path(cp)
+        self.forgetting_factor = self.get_forgetting_factor(cp)
+        self.model_registry_file_path = self.get_model_registry_file_path(cp)
+        self.resampling_method = self.get_resampling_method(cp)
+        self.resamples = self.get_resamples(cp)
+        self.folds = self.get_folds(cp)
+        self.confidence_level = self.get_confidence_level(cp)
+        self.workers = self.get_workers(cp)
+        self.seed = self.get_seed(cp)
         del cp  # DELETE CONFIGPARSER OBJECT
 
     @staticmethod
@@ -45,73 +221,182 @@ class BetaParametersLearner:
         return 1
 
     @staticmethod
-    def calculate_x1(m: int,
-                     M: int) -> float:
+    def calculate_x1(m: ndarray,
+                     M: ndarray) -> ndarray:
         return M / m
 
     @staticmethod
-    def calculate_x2(m: int,
-                     r: int,
-                     M: int) -> float:
+    def calculate_x2(m: ndarray,
+                     r: ndarray,
+                     M: ndarray) -> ndarray:
         return (M * r) / m
 
     @staticmethod
-    def calculate_x3(m: int,
-                     r: int) -> float:
+    def calculate_x3(m: ndarray,
+                     r: ndarray) -> ndarray:
         return m / r
 
     @staticmethod
-    def calculate_x4(r: int,
-                     M: int) -> float:
+    def calculate_x4(r: ndarray,
+                     M: ndarray) -> ndarray:
         return (M * log(M)) / r
 
     @staticmethod
-    def calculate_x5(r: int,
-                     M: int) -> float:
+    def calculate_x5(r: ndarray,
+                     M: ndarray) -> ndarray:
         return M / r
 
     @staticmethod
-    def calculate_x6(M: int) -> float:
+    def calculate_x6(M: ndarray) -> ndarray:
         return M
 
     @staticmethod
-    def calculate_x7(r: int) -> float:
+    def calculate_x7(r: ndarray) -> ndarray:
         return r
 
+    @staticmethod
+    def iterate_ini_records(experiments_file):
+        # ONE RECORD PER [Experiment i] SECTION OF THE experiments_maker.py OUTPUT (THE ORIGINAL FORMAT)
+        record = None
+        for line in experiments_file:
+            line = line.strip()
+            if len(line) == 0 or line[0] in "#;":
+                continue
+            if line[0] == "[":
+                if record is not None:
+                    yield record
+                record = {}
+            elif record is not None and "=" in line:
+                key, value = line.split("=", 1)
+                record[key.strip()] = value.strip()
+        if record is not None:
+            yield record
+
+    @staticmethod
+    def iterate_csv_records(experiments_file):
+        # HEADER LINE WITH (AT LEAST) THE m, r, M AND execution_time_in_seconds COLUMNS, ONE EXPERIMENT PER LINE
+        rows = reader(experiments_file)
+        header = [column.strip() for column in next(rows, [])]
+        for row in rows:
+            if len(row) > 0:
+                yield dict(zip(header, row))
+
+    @staticmethod
+    def iterate_ndjson_records(experiments_file):
+        # ONE JSON OBJECT PER LINE, WITH (AT LEAST) THE m, r, M AND execution_time_in_seconds KEYS
+        for line in experiments_file:
+            if len(line.strip()) > 0:
+                yield loads(line)
+
+    def load_experiments_from_text_file(self,
+                                        iterate_records) -> None:
+        # ONE STREAMING PASS, STRAIGHT INTO NUMPY COLUMNS (WHOSE CAPACITY IS DOUBLED WHENEVER THEY ARE FULL)
+        exception_message = "Please fill all the '{0}' fields of '{1}' file!" \
+            .format("execution_time_in_seconds", self.experiments_input_file_path)
+        capacity = 1024
+        m_column, r_column, M_column = (empty(capacity, dtype=int64) for _ in range(3))
+        execution_time_column = empty(capacity, dtype=float64)
+        profile_column = empty(capacity, dtype=int64)
+        profile_codes = {}
+        experiments_count = 0
+        with open(self.experiments_input_file_path, "r", encoding="utf-8") as experiments_file:
+            for record in iterate_records(experiments_file):
+                if experiments_count == capacity:
+                    capacity *= 2
+                    m_column, r_column, M_column, execution_time_column, profile_column = \
+                        (self.get_resized_column(column, capacity)
+                         for column in (m_column, r_column, M_column, execution_time_column, profile_column))
+                try:
+                    m_column[experiments_count] = int(record["m"])
+                    r_column[experiments_count] = int(record["r"])
+                    M_column[experiments_count] = int(record["M"])
+                except (KeyError, ValueError):
+                    raise ValueError("{0}: experiment {1} must have integer 'm', 'r' and 'M' fields!"
+                                     .format(self.experiments_input_file_path, experiments_count + 1))
+                try:
+                    execution_time_column[experiments_count] = float(record["execution_time_in_seconds"])
+                except (KeyError, TypeError, ValueError):
+                    raise ValueError(exception_message)
+                # OPTIONAL APPLICATION / PROFILE TAG, STORED AS THE CODE OF ITS FIRST APPEARANCE ORDER
+                profile = str(record.get("profile") or self.default_profile).strip() or self.default_profile
+                profile_column[experiments_count] = profile_codes.setdefault(profile, len(profile_codes))
+                experiments_count += 1
+        self.m_column = m_column[:experiments_count]
+        self.r_column = r_column[:experiments_count]
+        self.M_column = M_column[:experiments_count]
+        self.execution_time_column = execution_time_column[:experiments_count]
+        self.profiles = list(profile_codes) or [self.default_profile]
+        self.profile_column = profile_column[:experiments_count]
+
+    @staticmethod
+    def get_resized_column(column,
+                           capacity: int):
+        resized_column = empty(capacity, dtype=column.dtype)
+        resized_column[:len(column)] = column
+        return resized_column
+
+    def load_experiments_from_binary_file(self) -> None:
+        # .npy: STRUCTURED ARRAY WITH THE m, r, M AND execution_time_in_seconds FIELDS (MEMORY-MAPPED);
+        # .npz: ONE ARRAY PER COLUMN, NAMED AFTER IT
+        exception_message = "{0}: the experiments must hold the '{1}' columns!" \
+            .format(self.experiments_input_file_path, ", ".join(self.experiments_columns))
+        if self.experiments_input_file_path.suffix.lower() == ".npy":
+            experiments = numpy_load(self.experiments_input_file_path, mmap_mode="r")
+            columns_names = experiments.dtype.names or ()
+        else:
+            experiments = numpy_load(self.experiments_input_file_path)
+            columns_names = experiments.files
+        if any(column not in columns_names for column in self.experiments_columns):
+            raise ValueError(exception_message)
+        self.m_column = array(experiments["m"], dtype=int64)
+        self.r_column = array(experiments["r"], dtype=int64)
+        self.M_column = array(experiments["M"], dtype=int64)
+        self.execution_time_column = array(experiments["execution_time_in_seconds"], dtype=float64)
+        if isnan(self.execution_time_column).any():
+            raise ValueError("Please fill all the '{0}' fields of '{1}' file!"
+                             .format("execution_time_in_seconds", self.experiments_input_file_path))
+        if "profile" in columns_names:
+            profiles, self.profile_column = unique(asarray(experiments["profile"]).astype(str_), return_inverse=True)
+            self.profiles = [str(profile) for profile in profiles]
+            self.profile_column = self.profile_column.astype(int64).ravel()
+        else:
+            self.profiles = [self.default_profile]
+            self.profile_column = zeros(len(self.execution_time_column), dtype=int64)
+
+    def load_experiments(self) -> None:
+        # THE FORMAT FOLLOWS THE FILE EXTENSION: .csv, .ndjson / .jsonl, .npy / .npz OR, FOR ANY OTHER ONE (E.G., THE
+        # experiments.txt FILE WRITTEN BY experiments_maker.py), THE ORIGINAL INI-STYLE FORMAT
+        suffix = self.experiments_input_file_path.suffix.lower()
+        if suffix in [".npy", ".npz"]:
+            self.load_experiments_from_binary_file()
+        elif suffix == ".csv":
+            self.load_experiments_from_text_file(self.iterate_csv_records)
+        elif suffix in [".ndjson", ".jsonl"]:
+            self.load_experiments_from_text_file(self.iterate_ndjson_records)
+        else:
+            self.load_experiments_from_text_file(self.iterate_ini_records)
+
     def load_A_matrix(self) -> None:
-        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
-        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
-        cp.read(self.experiments_input_file_path, encoding="utf-8")
-        for section in cp.sections():
-            m = int(cp.get(section, "m"))
-            r = int(cp.get(section, "r"))
-            M = int(cp.get(section, "M"))
-            self.A_matrix.append([self.calculate_x0(),
-                                  self.calculate_x1(m, M),
-                                  self.calculate_x2(m, r, M),
-                                  self.calculate_x3(m, r),
-                                  self.calculate_x4(r, M),
-                                  self.calculate_x5(r, M),
-                                  self.calculate_x6(M),
-                                  self.calculate_x7(r)])
-        del cp  # DELETE CONFIGPARSER OBJECT
+        # ONE WHOLE-COLUMN OPERATION PER FEATURE, WRITTEN INTO A SINGLE FORTRAN-ORDERED (COLUMN-MAJOR) ARRAY, AS nnls
+        # EXPECTS IT
+        m = self.m_column.astype(float64)
+        r = self.r_column.astype(float64)
+        M = self.M_column.astype(float64)
+        self.A_matrix = empty((len(M), 8), dtype=float64, order="F")
+        self.A_matrix[:, 0] = self.calculate_x0()
+        self.A_matrix[:, 1] = self.calculate_x1(m, M)
+        self.A_matrix[:, 2] = self.calculate_x2(m, r, M)
+        self.A_matrix[:, 3] = self.calculate_x3(m, r)
+        self.A_matrix[:, 4] = self.calculate_x4(r, M)
+        self.A_matrix[:, 5] = self.calculate_x5(r, M)
+        self.A_matrix[:, 6] = self.calculate_x6(M)
+        self.A_matrix[:, 7] = self.calculate_x7(r)
 
     def load_b_vector(self) -> None:
-        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
-        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE)
-        cp.read(self.experiments_input_file_path, encoding="utf-8")
-        for section in cp.sections():
-            exception_message = "Please fill all the '{0}' fields of '{1}' file!" \
-                .format("execution_time_in_seconds", self.experiments_input_file_path)
-            try:
-                execution_time_in_seconds = float(cp.get(section, "execution_time_in_seconds"))
-            except ValueError:
-                raise ValueError(exception_message)
-            self.b_vector.append(execution_time_in_seconds)
-        del cp  # DELETE CONFIGPARSER OBJECT
+        self.b_vector = asarray(self.execution_time_column, dtype=float64)
 
-    def solve_non_negative_least_squares_problem(self) -> None:
-        solution_array = nnls(array(self.A_matrix), array(self.b_vector))[0]
+    def set_beta_parameters(self,
+                            solution_array: ndarray) -> None:
         # SET THE BETA PARAMETERS LEARNED
         self.betaZero = solution_array[0]
         self.betaOne = solution_array[1]
@@ -122,6 +407,195 @@ class BetaParametersLearner:
         self.betaSix = solution_array[6]
         self.betaSeven = solution_array[7]
 
+    def solve_non_negative_least_squares_problem(self) -> None:
+        self.set_beta_parameters(nnls(self.A_matrix, self.b_vector)[0])
+
+    def load_sufficient_statistics(self) -> None:
+        # AᵀA (8×8), Aᵀb (8), bᵀb AND THE (FORGETTING-WEIGHTED) NUMBER OF EXPERIMENTS FOLDED IN SO FAR; ALL ZERO WHEN
+        # THE FILE DOES NOT EXIST YET
+        if not self.sufficient_statistics_file_path.exists():
+            return
+        with numpy_load(self.sufficient_statistics_file_path) as sufficient_statistics:
+            self.A_T_A = array(sufficient_statistics["A_T_A"], dtype=float64)
+            self.A_T_b = array(sufficient_statistics["A_T_b"], dtype=float64)
+            self.b_T_b = float(sufficient_statistics["b_T_b"])
+            self.experiments_weight = float(sufficient_statistics["experiments_weight"])
+
+    def save_sufficient_statistics(self) -> None:
+        # WRITTEN NEXT TO THE FILE, THEN RENAMED OVER IT (A CRASH NEVER LEAVES HALF-WRITTEN STATISTICS BEHIND). THE β
+        # PARAMETERS LEARNED FROM THEM ARE SAVED ALONG, FOR cresp_optimizer.cfg'S 'sufficient_statistics_file'
+        temporary_file_path = self.sufficient_statistics_file_path.with_name(self.sufficient_statistics_file_path.name
+                                                                             + ".tmp")
+        with open(temporary_file_path, "wb") as temporary_file:
+            savez(temporary_file,
+                  A_T_A=self.A_T_A,
+                  A_T_b=self.A_T_b,
+                  b_T_b=self.b_T_b,
+                  experiments_weight=self.experiments_weight,
+                  beta_parameters=array([self.betaZero, self.betaOne, self.betaTwo, self.betaThree,
+                                         self.betaFour, self.betaFive, self.betaSix, self.betaSeven],
+                                        dtype=float64))
+        temporary_file_path.replace(self.sufficient_statistics_file_path)
+        print("Updated '{0}' file with the sufficient statistics and the Beta parameters learned from '{1}' file."
+              .format(self.sufficient_statistics_file_path,
+                      self.experiments_input_file_path))
+
+    def fold_in_experiments(self) -> None:
+        # SAME AS FOLDING THE LOADED EXPERIMENTS ONE BY ONE, IN FILE ORDER, WITH WHOLE-COLUMN OPERATIONS: THE i-TH OF n
+        # EXPERIMENTS ENDS UP WITH WEIGHT forgetting_factor^(n-1-i), AND THE PREVIOUS STATISTICS WITH forgetting_factor^n
+        experiments_count = len(self.b_vector)
+        weights = self.forgetting_factor ** arange(experiments_count - 1, -1, -1, dtype=float64)
+        past_weight = self.forgetting_factor ** experiments_count
+        weighted_A_matrix = self.A_matrix * weights[:, newaxis]
+        self.A_T_A = past_weight * self.A_T_A + weighted_A_matrix.T @ self.A_matrix
+        self.A_T_b = past_weight * self.A_T_b + weighted_A_matrix.T @ self.b_vector
+        self.b_T_b = past_weight * self.b_T_b + float(weights @ (self.b_vector * self.b_vector))
+        self.experiments_weight = past_weight * self.experiments_weight + float(weights.sum())
+
+    def solve_non_negative_least_squares_problem_from_sufficient_statistics(self) -> None:
+        # ||Aβ - b||² = βᵀ(AᵀA)β - 2βᵀ(Aᵀb) + bᵀb. WITH AᵀA = VDVᵀ, IT EQUALS ||Lβ - y||² UP TO A CONSTANT, WHERE THE
+        # ROWS OF L ARE √dₖvₖᵀ AND yₖ = vₖᵀ(Aᵀb) / √dₖ (ONLY OVER THE dₖ > 0; Aᵀb HAS NO COMPONENT ALONG THE OTHERS),
+        # SO THE NNLS PROBLEM OVER ALL THE EXPERIMENTS IS SOLVED AS AN 8-VARIABLE, AT MOST 8-ROW ONE
+        eigenvalues, eigenvectors = eigh(self.A_T_A)
+        is_positive = eigenvalues > eigenvalues.max(initial=0.0) * 8 * finfo(float64).eps
+        if not is_positive.any():
+            self.set_beta_parameters(zeros(8, dtype=float64))
+            return
+        square_roots = sqrt(eigenvalues[is_positive])
+        L_matrix = square_roots[:, newaxis] * eigenvectors[:, is_positive].T
+        y_vector = (eigenvectors[:, is_positive].T @ self.A_T_b) / square_roots
+        self.set_beta_parameters(nnls(L_matrix, y_vector)[0])
+
+    @staticmethod
+    def attach_shared_experiments(shared_memory_name: str,
+                                  experiments_count: int) -> None:
+        # RUN ONCE BY EVERY WORKER PROCESS (AND BY THE MAIN ONE, WITHOUT A PROCESS POOL)
+        shared_memory = SharedMemory(name=shared_memory_name)
+        experiments = ndarray((experiments_count, 9), dtype=float64, buffer=shared_memory.buf, order="F")
+        shared_experiments["shared_memory"] = shared_memory
+        shared_experiments["A_matrix"] = experiments[:, :8]
+        shared_experiments["b_vector"] = experiments[:, 8]
+
+    @staticmethod
+    def refit_resample(training_experiments: ndarray,
+                       validation_experiments: ndarray) -> tuple:
+        # β OF THE TRAINING EXPERIMENTS, AND THE SUM OF SQUARED ERRORS OF ITS PREDICTIONS OF THE VALIDATION ONES
+        A_matrix, b_vector = shared_experiments["A_matrix"], shared_experiments["b_vector"]
+        solution_array = nnls(A_matrix[training_experiments], b_vector[training_experiments])[0]
+        errors = A_matrix[validation_experiments] @ solution_array - b_vector[validation_experiments]
+        return solution_array, float(errors @ errors), len(validation_experiments)
+
+    @staticmethod
+    def refit_bootstrap_resamples(seed_sequence: SeedSequence,
+                                  resamples: int) -> tuple:
+        # EXPERIMENTS DRAWN WITH REPLACEMENT; THE OUT-OF-BAG ONES (NEVER DRAWN) VALIDATE EACH REFIT
+        experiments_count = len(shared_experiments["b_vector"])
+        random_generator = default_rng(seed_sequence)
+        beta_samples = zeros((resamples, 8), dtype=float64)
+        squared_errors_sum, validations_count = 0.0, 0
+        for resample in range(resamples):
+            training_experiments = random_generator.integers(0, experiments_count, experiments_count)
+            is_out_of_bag = ones(experiments_count, dtype=bool)
+            is_out_of_bag[training_experiments] = False
+            beta_samples[resample], squared_errors, validations = \
+                BetaParametersLearner.refit_resample(training_experiments, is_out_of_bag.nonzero()[0])
+            squared_errors_sum += squared_errors
+            validations_count += validations
+        return beta_samples, squared_errors_sum, validations_count
+
+    @staticmethod
+    def refit_k_fold_resamples(seed_sequence: SeedSequence,
+                               folds: int) -> tuple:
+        # ONE RANDOM PARTITION INTO k FOLDS; EACH FOLD VALIDATES THE REFIT OVER THE OTHER ONES
+        experiments_count = len(shared_experiments["b_vector"])
+        permutation = default_rng(seed_sequence).permutation(experiments_count)
+        fold_bounds = [(fold * experiments_count) // folds for fold in range(folds + 1)]
+        beta_samples = zeros((folds, 8), dtype=float64)
+        squared_errors_sum, validations_count = 0.0, 0
+        for fold in range(folds):
+            validation_experiments = permutation[fold_bounds[fold]:fold_bounds[fold + 1]]
+            training_experiments = concatenate((permutation[:fold_bounds[fold]], permutation[fold_bounds[fold + 1]:]))
+            beta_samples[fold], squared_errors, validations = \
+                BetaParametersLearner.refit_resample(training_experiments, validation_experiments)
+            squared_errors_sum += squared_errors
+            validations_count += validations
+        return beta_samples, squared_errors_sum, validations_count
+
+    def estimate_confidence_intervals(self) -> None:
+        # bootstrap: resamples REFITS, IN CHUNKS OF 8; k_fold: ceil(resamples / folds) REPEATED k-FOLD PARTITIONS
+        # (THE TASKS DO NOT DEPEND ON THE NUMBER OF WORKERS, SO A GIVEN SEED ALWAYS YIELDS THE SAME INTERVALS)
+        if self.resampling_method == "bootstrap":
+            tasks_count = -(-self.resamples // 8)
+            tasks_sizes = [min(8, self.resamples - 8 * task) for task in range(tasks_count)]
+            refit_resamples = self.refit_bootstrap_resamples
+        else:
+            tasks_count = -(-self.resamples // self.folds)
+            tasks_sizes = [self.folds] * tasks_count
+            refit_resamples = self.refit_k_fold_resamples
+        seed_sequences = SeedSequence(self.seed).spawn(tasks_count)
+        experiments_count = len(self.b_vector)
+        shared_memory = SharedMemory(create=True, size=experiments_count * 9 * 8)
+        try:
+            experiments = ndarray((experiments_count, 9), dtype=float64, buffer=shared_memory.buf, order="F")
+            experiments[:, :8] = self.A_matrix
+            experiments[:, 8] = self.b_vector
+            del experiments
+            if self.workers == 1:
+                self.attach_shared_experiments(shared_memory.name, experiments_count)
+                partial_results = list(map(refit_resamples, seed_sequences, tasks_sizes))
+                shared_experiments.clear()
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers,
+                                         initializer=self.attach_shared_experiments,
+                                         initargs=(shared_memory.name, experiments_count)) as executor:
+                    partial_results = list(executor.map(refit_resamples, seed_sequences, tasks_sizes))
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+        self.beta_samples = concatenate([beta_samples for beta_samples, _, _ in partial_results])
+        self.confidence_intervals = quantile(self.beta_samples,
+                                             [(1 - self.confidence_level) / 2, (1 + self.confidence_level) / 2],
+                                             axis=0).T
+        self.out_of_sample_rmse = sqrt(sum(squared_errors for _, squared_errors, _ in partial_results) /
+                                       max(1, sum(validations for _, _, validations in partial_results)))
+
+    def fit_model_registry(self) -> None:
+        # ONE BATCHED PASS OVER THE "A" MATRIX ALREADY BUILT: ITS ROWS ARE GROUPED BY PROFILE WITH A SINGLE (STABLE)
+        # SORT, THEN EACH PROFILE IS FITTED OVER ITS OWN CONTIGUOUS SLICE
+        order = argsort(self.profile_column, kind="stable")
+        A_matrix = self.A_matrix[order]
+        b_vector = self.b_vector[order]
+        experiments_counts = bincount(self.profile_column, minlength=len(self.profiles))
+        bounds = concatenate(([0], cumsum(experiments_counts)))
+        for code, profile in enumerate(self.profiles):
+            rows = slice(bounds[code], bounds[code + 1])
+            self.model_registry[profile] = (nnls(A_matrix[rows], b_vector[rows])[0], int(experiments_counts[code]))
+
+    def save_model_registry(self) -> None:
+        # PROFILES FITTED NOW REPLACE THE ONES OF THE SAME NAME; THE OTHER ONES ALREADY ON THE REGISTRY ARE KEPT.
+        # WRITTEN NEXT TO THE FILE, THEN RENAMED OVER IT
+        model_registry = {}
+        if self.model_registry_file_path.exists():
+            with numpy_load(self.model_registry_file_path) as registry:
+                for profile, beta_parameters, experiments_count in zip(registry["profiles"],
+                                                                       registry["beta_parameters"],
+                                                                       registry["experiments_count"]):
+                    model_registry[str(profile)] = (array(beta_parameters, dtype=float64), int(experiments_count))
+        model_registry.update(self.model_registry)
+        profiles = sorted(model_registry)
+        temporary_file_path = self.model_registry_file_path.with_name(self.model_registry_file_path.name + ".tmp")
+        with open(temporary_file_path, "wb") as temporary_file:
+            savez(temporary_file,
+                  profiles=array(profiles, dtype=str_),
+                  beta_parameters=array([model_registry[profile][0] for profile in profiles],
+                                        dtype=float64).reshape(-1, 8),
+                  experiments_count=array([model_registry[profile][1] for profile in profiles], dtype=int64))
+        temporary_file_path.replace(self.model_registry_file_path)
+        print("Updated '{0}' file with the Beta parameters of the '{1}' profile(s) learned from '{2}' file."
+              .format(self.model_registry_file_path,
+                      "', '".join(sorted(self.model_registry)),
+                      self.experiments_input_file_path))
+
     def update_beta_parameters_on_config_file(self) -> None:
         cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
         cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE)
@@ -135,6 +609,17 @@ class BetaParametersLearner:
         cp.set(section_name, "β5", str(self.betaFive))
         cp.set(section_name, "β6", str(self.betaSix))
         cp.set(section_name, "β7", str(self.betaSeven))
+        if self.confidence_intervals is not None:
+            # CONFIDENCE INTERVALS (LOWER, UPPER) AND OUT-OF-SAMPLE PREDICTION ERROR, NEXT TO THE β PARAMETERS
+            section_name = "beta parameters confidence intervals"
+            if not cp.has_section(section_name):
+                cp.add_section(section_name)
+            cp.set(section_name, "resampling_method", self.resampling_method)
+            cp.set(section_name, "resamples", str(len(self.beta_samples)))
+            cp.set(section_name, "confidence_level", str(self.confidence_level))
+            for i, (lower, upper) in enumerate(self.confidence_intervals):
+                cp.set(section_name, "β{0}".format(i), "{0}, {1}".format(lower, upper))
+            cp.set(section_name, "out_of_sample_rmse_in_seconds", str(self.out_of_sample_rmse))
         with open(self.cresp_optimizer_config_file_path, "w", encoding="utf-8") as config_file:
             cp.write(config_file)
         del cp  # DELETE CONFIGPARSER OBJECT
@@ -147,20 +632,47 @@ def main():
     # INIT BETA PARAMETERS LEARNER OBJECT
     bpl = BetaParametersLearner()
 
-    # LOAD GENERAL SETTINGS (experiments input file path)
+    # LOAD GENERAL SETTINGS (experiments input file path, learning mode, sufficient statistics file path,
+    # forgetting factor, model registry file path)
     bpl.load_general_settings()
 
+    # LOAD EXPERIMENTS (m, r, M, execution time AND optional profile columns, in a single pass)
+    bpl.load_experiments()
+
     # LOAD "A" MATRIX
     bpl.load_A_matrix()
 
     # LOAD "b" VECTOR
     bpl.load_b_vector()
 
-    # SOLVE THE NON-NEGATIVE LEAST SQUARES (NNLS) PROBLEM
-    bpl.solve_non_negative_least_squares_problem()
+    if bpl.learning_mode == "online":
+        # LOAD THE SUFFICIENT STATISTICS (AᵀA, Aᵀb, bᵀb) OF THE EXPERIMENTS FOLDED IN BY THE PREVIOUS RUNS
+        bpl.load_sufficient_statistics()
+
+        # FOLD THE NEW EXPERIMENTS IN
+        bpl.fold_in_experiments()
+
+        # SOLVE THE NON-NEGATIVE LEAST SQUARES (NNLS) PROBLEM OVER EVERY EXPERIMENT FOLDED IN SO FAR
+        bpl.solve_non_negative_least_squares_problem_from_sufficient_statistics()
+
+        # SAVE THE UPDATED SUFFICIENT STATISTICS, ALONG WITH THE BETA PARAMETERS (READ FROM THERE BY cresp_optimizer.py
+        # WHEN IT IS ITS 'sufficient_statistics_file'; "cresp_optimizer_config" FILE IS LEFT UNTOUCHED)
+        bpl.save_sufficient_statistics()
+    else:
+        # SOLVE THE NON-NEGATIVE LEAST SQUARES (NNLS) PROBLEM
+        bpl.solve_non_negative_least_squares_problem()
+
+        # ESTIMATE THE CONFIDENCE INTERVALS OF THE BETA PARAMETERS (IF ANY RESAMPLES ARE SET)
+        if bpl.resamples > 0:
+            bpl.estimate_confidence_intervals()
+
+        # UPDATE THE BETA PARAMETERS (AND THEIR CONFIDENCE INTERVALS, IF ANY) ON "cresp_optimizer_config" FILE
+        bpl.update_beta_parameters_on_config_file()
 
-    # UPDATE THE BETA PARAMETERS ON "cresp_optimizer_config" FILE
-    bpl.update_beta_parameters_on_config_file()
+    # FIT THE BETA PARAMETERS OF EVERY PROFILE OF THE EXPERIMENTS AND SAVE THEM ON THE MODEL REGISTRY (IF ANY IS SET)
+    if bpl.model_registry_file_path is not None:
+        bpl.fit_model_registry()
+        bpl.save_model_registry()
 
     # DELETE BETA PARAMETERS LEARNER OBJECT
     del bpl
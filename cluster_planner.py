@@ -0,0 +1,289 @@
+from configparser import ConfigParser
+from cresp_optimizer import CrespOptimizer, CrespParameters
+from math import isfinite
+from numpy import arange, ceil as numpy_ceil, float64, full, inf as numpy_inf, int64, zeros
+from pathlib import Path
+from time import time
+from sys import exit
+
+
+class CrespClusterPlanner:
+    # PLANS MANY JOBS THAT SHARE A CLUSTER: ONE (m, R) PER JOB, MINIMIZING THE TOTAL TIME (Σ T3) OR THE TOTAL COST
+    # (Σ C) UNDER A GLOBAL LIMIT ON NODES (Σ ν) OR ON SPEND (Σ C). EVERY JOB CONTRIBUTES ITS NON-DOMINATED
+    # (OBJECTIVE, RESOURCE) OPTIONS, AND A MULTIPLE-CHOICE KNAPSACK (DYNAMIC PROGRAMMING OVER THE LIMIT) PICKS ONE
+    # OPTION PER JOB. SPEND IS DISCRETIZED INTO budget_steps UNITS, EACH JOB'S COST ROUNDED UP, SO PLANS NEVER EXCEED IT
+
+    def __init__(self) -> None:
+        self.cluster_planner_config_file_path = Path("config/cluster_planner.cfg")
+        self.jobs_input_file_path = None
+        self.plan_output_file_path = None
+        self.objective = None
+        self.limit = None
+        self.limit_value = None
+        self.budget_steps = 1000
+        self.beta_parameters_columns = ["β0", "β1", "β2", "β3", "β4", "β5", "β6", "β7"]
+        self.jobs = []
+        self.plan = None
+
+    def get_jobs_input_file_path(self,
+                                 config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'jobs_input_file' must be a valid path file!" \
+            .format(self.cluster_planner_config_file_path)
+        try:
+            jobs_input_file_path = Path(config_parser.get("general", "jobs_input_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return jobs_input_file_path
+
+    def get_plan_output_file_path(self,
+                                  config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'plan_output_file' must be a valid path file!" \
+            .format(self.cluster_planner_config_file_path)
+        try:
+            plan_output_file_path = Path(config_parser.get("general", "plan_output_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return plan_output_file_path
+
+    def get_objective(self,
+                      config_parser: ConfigParser) -> str:
+        exception_message = "{0}: supported 'objective' values: time | cost." \
+            .format(self.cluster_planner_config_file_path)
+        objective = str(config_parser.get("general", "objective"))
+        if objective not in ["time", "cost"]:
+            raise ValueError(exception_message)
+        return objective
+
+    def get_limit(self,
+                  config_parser: ConfigParser) -> str:
+        exception_message = "{0}: supported 'limit' values: nodes | budget." \
+            .format(self.cluster_planner_config_file_path)
+        limit = str(config_parser.get("general", "limit"))
+        if limit not in ["nodes", "budget"]:
+            raise ValueError(exception_message)
+        return limit
+
+    def get_limit_value(self,
+                        config_parser: ConfigParser) -> float:
+        exception_message = "{0}: 'limit_value' (maximum number of nodes, or maximum spend) " \
+                            "must be a integer (nodes) or float (budget) value higher than zero!" \
+            .format(self.cluster_planner_config_file_path)
+        try:
+            if self.limit == "nodes":
+                limit_value = int(config_parser.get("general", "limit_value"))
+            else:
+                limit_value = float(config_parser.get("general", "limit_value"))
+            if limit_value <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return limit_value
+
+    def get_budget_steps(self,
+                         config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'budget_steps' (resolution of the budget limit) " \
+                            "must be a integer value higher than zero!" \
+            .format(self.cluster_planner_config_file_path)
+        try:
+            budget_steps = int(config_parser.get("general", "budget_steps", fallback="1000"))
+            if budget_steps <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return budget_steps
+
+    def load_general_settings(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.cluster_planner_config_file_path, encoding="utf-8")
+        self.jobs_input_file_path = self.get_jobs_input_file_path(cp)
+        self.plan_output_file_path = self.get_plan_output_file_path(cp)
+        self.objective = self.get_objective(cp)
+        self.limit = self.get_limit(cp)
+        self.limit_value = self.get_limit_value(cp)
+        self.budget_steps = self.get_budget_steps(cp)
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    def load_jobs(self) -> None:
+        # CSV FILE WITH A 'name, M' HEADER (PLUS, OPTIONALLY, THE β0, ..., β7 COLUMNS OF EACH JOB'S OWN PROFILE) AND ONE
+        # JOB PER LINE; JOBS WITHOUT THEIR OWN β PARAMETERS USE THE ONES OF 'cresp_optimizer.cfg'
+        exception_message = "{0}: the header must hold the 'name, M' columns (and, optionally, all the '{1}' ones), " \
+                            "and every job must have a integer M higher than zero (and, if given, finite float β " \
+                            "parameters equal or higher than zero)!" \
+            .format(self.jobs_input_file_path, ", ".join(self.beta_parameters_columns))
+        self.jobs = []
+        with open(self.jobs_input_file_path, "r", encoding="utf-8") as jobs_file:
+            header = [column.strip() for column in jobs_file.readline().split(",")]
+            has_beta_parameters = all(column in header for column in self.beta_parameters_columns)
+            if "name" not in header or "M" not in header or \
+                    (not has_beta_parameters and any(column in header for column in self.beta_parameters_columns)):
+                raise ValueError(exception_message)
+            for line in jobs_file:
+                if len(line.strip()) == 0:
+                    continue
+                fields = [field.strip() for field in line.split(",")]
+                try:
+                    M = int(fields[header.index("M")])
+                    beta_parameters = None
+                    if has_beta_parameters and len(fields[header.index("β0")]) > 0:
+                        beta_parameters = [float(fields[header.index(column)])
+                                           for column in self.beta_parameters_columns]
+                        if not all(isfinite(beta_i) and beta_i >= 0.0 for beta_i in beta_parameters):
+                            raise ValueError(exception_message)
+                    if M <= 0:
+                        raise ValueError(exception_message)
+                except (ValueError, IndexError):
+                    raise ValueError(exception_message)
+                self.jobs.append((fields[header.index("name")], M, beta_parameters))
+
+    def get_job_options(self,
+                        cresp_optimizer: CrespOptimizer,
+                        parameters: CrespParameters) -> tuple:
+        # NON-DOMINATED (OBJECTIVE, RESOURCE) OPTIONS, AS (m, R, T3, C, ν, OBJECTIVE, WEIGHT) ARRAYS, WHERE THE WEIGHT
+        # IS THE RESOURCE IN KNAPSACK UNITS (NODES, OR BUDGET STEPS)
+        if self.limit == "nodes":
+            Nu, m, R, T3, C = cresp_optimizer.get_node_count_options(parameters, self.objective)
+            weight = Nu
+        else:
+            # THE (T3, C) PARETO FRONTIER (SHARED BY JOBS WITH THE SAME M AND β PARAMETERS)
+            pareto_frontier = cresp_optimizer.get_pareto_frontier(parameters)
+            m, R, T3, C = pareto_frontier.m, pareto_frontier.R, pareto_frontier.T3, pareto_frontier.C
+            Nu = -(-(m + R) // parameters.Gamma)
+            weight = numpy_ceil(C / (self.limit_value / self.budget_steps)).astype(int64)
+        objective = T3 if self.objective == "time" else C
+        return m, R, T3, C, Nu, objective, weight
+
+    def plan_jobs(self,
+                  cresp_optimizer: CrespOptimizer) -> None:
+        capacity = self.limit_value if self.limit == "nodes" else self.budget_steps
+        # best[c]: LOWEST TOTAL OBJECTIVE OF THE JOBS PLANNED SO FAR, USING AT MOST c UNITS OF THE LIMIT
+        best = zeros(capacity + 1, dtype=float64)
+        choices = []
+        jobs_options = []
+        options_cache = {}
+        for _, M, beta_parameters in self.jobs:
+            parameters = cresp_optimizer.get_scenario_parameters(M,
+                                                                 cresp_optimizer.Gamma,
+                                                                 cresp_optimizer.Upsilon,
+                                                                 cresp_optimizer.Phi,
+                                                                 cresp_optimizer.Tau,
+                                                                 beta_parameters)
+            key = parameters.get_canonical_key("cluster_planner")
+            if key not in options_cache:
+                options_cache[key] = self.get_job_options(cresp_optimizer, parameters)
+            job_options = options_cache[key]
+            objective, weight = job_options[5], job_options[6]
+            job_best = full(capacity + 1, numpy_inf, dtype=float64)
+            job_choice = full(capacity + 1, -1, dtype=int64)
+            for option in arange(len(weight))[weight <= capacity]:
+                candidate = best[:capacity + 1 - weight[option]] + objective[option]
+                is_better = candidate < job_best[weight[option]:]
+                job_best[weight[option]:][is_better] = candidate[is_better]
+                job_choice[weight[option]:][is_better] = option
+            best = job_best
+            choices.append(job_choice)
+            jobs_options.append(job_options)
+        if best[capacity] == numpy_inf:
+            self.plan = None
+            return
+        # WALK THE CHOICES BACKWARDS, FROM THE LAST JOB AND THE WHOLE CAPACITY
+        self.plan = []
+        remaining_capacity = capacity
+        for job_choice, job_options in zip(reversed(choices), reversed(jobs_options)):
+            option = int(job_choice[remaining_capacity])
+            m, R, T3, C, Nu, _, weight = (column[option] for column in job_options)
+            self.plan.append((int(m), int(R), int(Nu), float(T3), float(C)))
+            remaining_capacity -= int(weight)
+        self.plan.reverse()
+
+    @staticmethod
+    def get_plan_totals(plan: list) -> tuple:
+        return sum(row[2] for row in plan), sum(row[3] for row in plan), sum(row[4] for row in plan)
+
+    def write_plan(self,
+                   cresp_optimizer: CrespOptimizer) -> None:
+        if self.plan is None:
+            print("NO PLAN FITS INTO THE {0} LIMIT OF {1}!".format(self.limit.upper(), self.limit_value))
+            return
+        with open(self.plan_output_file_path, "w", encoding="utf-8") as plan_file:
+            plan_file.write(",".join(["name", "M", "m", "R", "ν", "T3", "C"]) + "\n")
+            for (name, M, _), row in zip(self.jobs, self.plan):
+                plan_file.write(",".join(str(value) for value in (name, M) + row) + "\n")
+        Nu_total, T3_total, C_total = self.get_plan_totals(self.plan)
+        print("Generated '{0}' file with the plan of {1} jobs: {2} nodes, {3} {4}(s), {5} {6}."
+              .format(self.plan_output_file_path,
+                      len(self.plan),
+                      Nu_total,
+                      T3_total,
+                      cresp_optimizer.time_unit,
+                      C_total,
+                      cresp_optimizer.monetary_unit))
+
+
+def main():
+    # INIT CLUSTER PLANNER OBJECT
+    ccp = CrespClusterPlanner()
+
+    # LOAD GENERAL SETTINGS (jobs input file path, plan output file path, objective, limit, limit value, budget steps)
+    ccp.load_general_settings()
+
+    # LOAD JOBS (name, M and, optionally, β parameters of each job)
+    ccp.load_jobs()
+
+    # INIT CRESP OPTIMIZER OBJECT
+    co = CrespOptimizer()
+
+    # INIT CONFIGPARSER OBJECT
+    cp = ConfigParser()
+
+    # PRESERVE OPTIONS NAMES' CASE
+    cp.optionxform = str
+
+    # READ CONFIG FILE
+    cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
+
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7), FOR JOBS WITHOUT THEIR OWN ONES
+    co.load_beta_parameters(cp)
+
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
+    # LOAD INPUT PARAMETERS (M, γ, υ, φ, τ); ONLY γ AND υ ARE USED, M COMES FROM EACH JOB
+    co.load_input_parameters(cp)
+
+    # LOAD m BOUNDS (lower, upper)
+    co.load_m_bounds(cp)
+
+    # LOAD R BOUNDS (lower, upper)
+    co.load_R_bounds(cp)
+
+    # LOAD MONETARY UNIT [USD]
+    co.load_monetary_unit(cp)
+
+    # LOAD TIME UNIT [second | minute | hour]
+    co.load_time_unit(cp)
+
+    # PLAN THE JOBS
+    planning_start_time = time()
+    ccp.plan_jobs(co)
+    print("Planned {0} jobs in {1} seconds.".format(len(ccp.jobs), time() - planning_start_time))
+
+    # WRITE THE PLAN
+    ccp.write_plan(co)
+
+    # DELETE CONFIGPARSER OBJECT
+    del cp
+
+    # DELETE CRESP OPTIMIZER OBJECT
+    del co
+
+    # DELETE CLUSTER PLANNER OBJECT
+    del ccp
+
+    # END
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+from configparser import ConfigParser
+from cresp_optimizer import CrespOptimizer
+from numpy import argmax, floor, int64, loadtxt
+from pathlib import Path
+from time import time
+from sys import exit
+
+
+class CrespBatchOptimizer:
+
+    def __init__(self) -> None:
+        self.cresp_batch_optimizer_config_file_path = Path("config/cresp_batch_optimizer.cfg")
+        self.scenarios_input_file_path = None
+        self.results_output_file_path = None
+        self.scenarios_columns = ["M", "γ", "υ", "φ", "τ"]
+        self.scenarios_columns_descriptions = {"M": ("number of Map tasks", "integer"),
+                                               "γ": ("gamma: number of slots per node", "integer"),
+                                               "υ": ("upsilon: monetary cost, per hour, of one node", "float"),
+                                               "φ": ("phi: maximum monetary cost for finishing the job", "float"),
+                                               "τ": ("tau: maximum amount of time, in hours, for finishing the job",
+                                                     "float")}
+        self.scenarios = None
+        self.results = None
+
+    def get_scenarios_input_file_path(self,
+                                      config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'scenarios_input_file' must be a valid path file!" \
+            .format(self.cresp_batch_optimizer_config_file_path)
+        try:
+            scenarios_input_file_path = Path(config_parser.get("general", "scenarios_input_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return scenarios_input_file_path
+
+    def get_results_output_file_path(self,
+                                     config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'results_output_file' must be a valid path file!" \
+            .format(self.cresp_batch_optimizer_config_file_path)
+        try:
+            results_output_file_path = Path(config_parser.get("general", "results_output_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return results_output_file_path
+
+    def load_general_settings(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.cresp_batch_optimizer_config_file_path, encoding="utf-8")
+        self.scenarios_input_file_path = self.get_scenarios_input_file_path(cp)
+        self.results_output_file_path = self.get_results_output_file_path(cp)
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    def load_scenarios(self) -> None:
+        exception_message = "{0}: the header must hold the '{1}' columns!" \
+            .format(self.scenarios_input_file_path, ", ".join(self.scenarios_columns))
+        with open(self.scenarios_input_file_path, "r", encoding="utf-8") as scenarios_file:
+            header = [column.strip() for column in scenarios_file.readline().split(",")]
+            if any(column not in header for column in self.scenarios_columns):
+                raise ValueError(exception_message)
+            table = loadtxt(scenarios_file, delimiter=",", ndmin=2)
+        self.scenarios = {column: table[:, header.index(column)] for column in self.scenarios_columns}
+        # EVERY SCENARIO IS CHECKED AS THE CONFIG FILE VALUES ARE (LINE 1 IS THE HEADER)
+        for column in self.scenarios_columns:
+            description, value_type = self.scenarios_columns_descriptions[column]
+            invalid = ~(self.scenarios[column] > 0.0)
+            if value_type == "integer":
+                invalid |= self.scenarios[column] != floor(self.scenarios[column])
+            if invalid.any():
+                raise ValueError("{0}, line {1}: '{2}' ({3}) must be a {4} value higher than zero!"
+                                 .format(self.scenarios_input_file_path, int(argmax(invalid)) + 2,
+                                         column, description, value_type))
+        self.scenarios["M"] = self.scenarios["M"].astype(int64)
+        self.scenarios["γ"] = self.scenarios["γ"].astype(int64)
+
+    def optimize_scenarios(self,
+                           cresp_optimizer: CrespOptimizer) -> None:
+        if cresp_optimizer.workers > 1:
+            optimize_scenarios_batch = cresp_optimizer.optimize_scenarios_batch_in_parallel
+        else:
+            optimize_scenarios_batch = cresp_optimizer.optimize_scenarios_batch
+        self.results = optimize_scenarios_batch(self.scenarios["M"],
+                                                self.scenarios["γ"],
+                                                self.scenarios["υ"],
+                                                self.scenarios["φ"],
+                                                self.scenarios["τ"])
+
+    def write_results(self) -> None:
+        with open(self.results_output_file_path, "w", encoding="utf-8") as results_file:
+            results_file.write(",".join(self.scenarios_columns + ["m", "R", "ν", "T3", "C", "feasible"]) + "\n")
+            for i in range(len(self.results["m"])):
+                row = [int(self.scenarios["M"][i]),
+                       int(self.scenarios["γ"][i]),
+                       self.scenarios["υ"][i],
+                       self.scenarios["φ"][i],
+                       self.scenarios["τ"][i]] + \
+                      [self.results["m"][i],
+                       self.results["R"][i],
+                       self.results["Nu"][i],
+                       self.results["T3"][i],
+                       self.results["C"][i],
+                       self.results["feasible"][i]]
+                results_file.write(",".join(str(value) for value in row) + "\n")
+        print("Generated '{0}' file with the allocations of the {1} scenarios read from '{2}' file."
+              .format(self.results_output_file_path,
+                      len(self.results["m"]),
+                      self.scenarios_input_file_path))
+
+
+def main():
+    # INIT CRESP BATCH OPTIMIZER OBJECT
+    cbo = CrespBatchOptimizer()
+
+    # LOAD GENERAL SETTINGS (scenarios input file path, results output file path)
+    cbo.load_general_settings()
+
+    # LOAD SCENARIOS (M, γ, υ, φ, τ)
+    cbo.load_scenarios()
+
+    # INIT CRESP OPTIMIZER OBJECT
+    co = CrespOptimizer()
+
+    # INIT CONFIGPARSER OBJECT
+    cp = ConfigParser()
+
+    # PRESERVE OPTIONS NAMES' CASE
+    cp.optionxform = str
+
+    # READ CONFIG FILE
+    cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
+
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7), SHARED BY ALL SCENARIOS
+    co.load_beta_parameters(cp)
+
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
+    # LOAD m BOUNDS (lower, upper)
+    co.load_m_bounds(cp)
+
+    # LOAD R BOUNDS (lower, upper)
+    co.load_R_bounds(cp)
+
+    # LOAD MONETARY UNIT [USD]
+    co.load_monetary_unit(cp)
+
+    # LOAD TIME UNIT [second | minute | hour]
+    co.load_time_unit(cp)
+
+    # LOAD OPTIMIZATION PROBLEM [1 | 2 | 3]
+    co.load_optimization_problem(cp)
+
+    # LOAD NUMBER OF WORKER PROCESSES (1: NO PROCESS POOL)
+    co.load_workers(cp)
+
+    # LOAD VECTORIZED BLOCK SIZE (MAXIMUM NUMBER OF CELLS EVALUATED AT ONCE, WHICH BOUNDS THE PEAK MEMORY)
+    co.load_vectorized_block_size(cp)
+
+    # OPTIMIZE ALL SCENARIOS AT ONCE
+    optimization_start_time = time()
+    cbo.optimize_scenarios(co)
+    optimization_end_time = time() - optimization_start_time
+    print("Optimized {0} scenarios in {1} seconds.".format(len(cbo.results["m"]), optimization_end_time))
+
+    # WRITE RESULTS (m, R, ν, T3, C, feasible)
+    cbo.write_results()
+
+    # DELETE CONFIGPARSER OBJECT
+    del cp
+
+    # DELETE CRESP OPTIMIZER OBJECT
+    del co
+
+    # DELETE CRESP BATCH OPTIMIZER OBJECT
+    del cbo
+
+    # END
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+from cresp_optimizer import CrespOptimizer, CrespParameters, CrespResult
+from functools import partial
+from gurobipy import Env, GRB, Model
+from math import ceil
+from threading import Lock
+
+
+# SOLVER BACKEND OF THE gurobi AND gurobi_session OPTIMIZATION MODES (IMPORTED ONLY WHEN ONE OF THEM IS FIRST SOLVED)
+def solve_with_gurobi(cresp_optimizer: CrespOptimizer,
+                      parameters: CrespParameters) -> CrespResult:
+    result = CrespResult()
+    with Env() as env, Model(name="CRESP Cost Model on Gurobi for Python", env=env) as model:
+        # SET MODEL PARAMETERS
+        model.setParam("NonConvex", 2)
+        # SET MODEL DECISION VARIABLE
+        m = model.addVar(name="m",
+                         vtype=GRB.INTEGER,
+                         lb=parameters.m_lower_bound,
+                         ub=parameters.m_upper_bound)
+        R = model.addVar(name="R",
+                         vtype=GRB.INTEGER,
+                         lb=parameters.R_lower_bound,
+                         ub=parameters.R_upper_bound)
+        z0 = model.addVar(name="z0",
+                          vtype=GRB.CONTINUOUS)  # z0 = α0
+        z1 = model.addVar(name="z1",
+                          vtype=GRB.CONTINUOUS)  # z1 = α1 / m -> z1 * m = α1
+        z2 = model.addVar(name="z2",
+                          vtype=GRB.CONTINUOUS)  # z2 = (α2 * R) / m -> z2 * m = α2 * R
+        z3 = model.addVar(name="z3",
+                          vtype=GRB.CONTINUOUS)  # z3 = (α3 * m) / R -> z3 * R = α3 * m
+        z4 = model.addVar(name="z4",
+                          vtype=GRB.CONTINUOUS)  # z4 = α4 / R -> z4 * R = α4
+        z5 = model.addVar(name="z5",
+                          vtype=GRB.CONTINUOUS)  # z5 = α5 * R
+        # SET TIME COST FUNCTION: T3(m,R) = α0 + α1/m + α2R/m + α3m/R + α4/R + α5R
+        T3 = z0 + \
+             z1 + \
+             z2 + \
+             z3 + \
+             z4 + \
+             z5
+        if parameters.time_unit == "hour":
+            T3 = T3 / 3600
+        elif parameters.time_unit == "minute":
+            T3 = T3 / 60
+        # SET MODEL OBJECTIVE AND CONSTRAINTS
+        if parameters.optimization_problem == 1:
+            # MINIMIZE T3(m,R):
+            # SUBJECT TO:
+            # Upsilon * [T3(m,R)] * [(m+R) / Gamma] <= Phi
+            model.setObjective(T3, GRB.MINIMIZE)
+            model.addConstr(parameters.Upsilon * T3 * ((m + R) / parameters.Gamma) <= parameters.Phi, "c0")
+        elif parameters.optimization_problem == 2:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            # SUBJECT TO:
+            # T3(m,R) <= τ
+            model.setObjective(parameters.Upsilon * T3 * ((m + R) / parameters.Gamma), GRB.MINIMIZE)
+            model.addConstr(T3 <= parameters.Tau, "c0")
+        elif parameters.optimization_problem == 3:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            model.setObjective(parameters.Upsilon * T3 * ((m + R) / parameters.Gamma), GRB.MINIMIZE)
+        model.addConstr(parameters.alfaZero == z0, "c1")  # z0 = α0
+        model.addConstr(parameters.alfaOne == z1 * m, "c2")  # z1 = α1 / m -> z1 * m = α1
+        model.addConstr(parameters.alfaTwo * R == z2 * m, "c3")  # z2 = (α2 * R) / m -> z2 * m = α2 * R
+        model.addConstr(parameters.alfaThree * m == z3 * R, "c4")  # z3 = (α3 * m) / R -> z3 * R = α3 * m
+        model.addConstr(parameters.alfaFour == z4 * R, "c5")  # z4 = α4 / R -> z4 * R = α4
+        model.addConstr(parameters.alfaFive * R == z5, "c6")  # z5 = α5 * R
+        # OPTIMIZE MODEL
+        model.optimize()
+        # IF MODEL IS FEASIBLE (FOUND OPTIMAL VALUE, GRB.OPTIMAL):
+        if model.status == 2:
+            m_value, R_value = 0, 0
+            for v in model.getVars():
+                if str(v.varName) == "m":
+                    m_value = ceil(v.x)
+                if str(v.varName) == "R":
+                    R_value = ceil(v.x)
+            T3_value = T3.getValue()
+            result = CrespOptimizer.get_model_result(parameters,
+                                                     m_value,
+                                                     R_value,
+                                                     T3_value,
+                                                     parameters.calculate_C(T3_value, m_value, R_value))
+        del env
+        del model
+    return result
+
+
+class CrespGurobiSession:
+    # ONE GUROBI ENVIRONMENT, STARTED ONCE, AND ONE MODEL PER (OPTIMIZATION PROBLEM, TIME UNIT), BUILT ONCE: LATER SOLVES
+    # ONLY UPDATE THE SCENARIO DEPENDENT VALUES (α CONSTANTS, φ, τ, γ, υ AND BOUNDS) AND WARM-START FROM AN INCUMBENT
+    def __init__(self) -> None:
+        self.env = None
+        self.models = {}
+        self.previous_results = {}
+        self.lock = Lock()
+
+    def get_env(self) -> Env:
+        if self.env is None:
+            self.env = Env()
+        return self.env
+
+    def build_model(self,
+                    optimization_problem: int,
+                    time_unit: str) -> dict:
+        model = Model(name="CRESP Cost Model on Gurobi for Python (Session)", env=self.get_env())
+        # SET MODEL PARAMETERS
+        model.setParam("NonConvex", 2)
+        # SET MODEL DECISION VARIABLE
+        m = model.addVar(name="m",
+                         vtype=GRB.INTEGER)
+        R = model.addVar(name="R",
+                         vtype=GRB.INTEGER)
+        # α CONSTANTS ARE FIXED VARIABLES (LB = UB), SO A NEW SCENARIO ONLY CHANGES THEIR BOUNDS
+        alfa = [model.addVar(name="a{0}".format(i),
+                             vtype=GRB.CONTINUOUS) for i in range(6)]
+        z = [model.addVar(name="z{0}".format(i),
+                          vtype=GRB.CONTINUOUS) for i in range(6)]
+        # SET TIME COST FUNCTION: T3(m,R) = α0 + α1/m + α2R/m + α3m/R + α4/R + α5R
+        T3 = z[0] + \
+             z[1] + \
+             z[2] + \
+             z[3] + \
+             z[4] + \
+             z[5]
+        if time_unit == "hour":
+            T3 = T3 / 3600
+        elif time_unit == "minute":
+            T3 = T3 / 60
+        # SET MODEL OBJECTIVE AND CONSTRAINTS (υ / γ > 0 ONLY SCALES THE MONETARY COST, SO IT IS LEFT OUT OF THE MODEL
+        # AND THE BUDGET CONSTRAINT BECOMES T3(m,R) * (m+R) <= φ * γ / υ, WHOSE RIGHT-HAND SIDE IS UPDATED PER SCENARIO)
+        constraint = None
+        if optimization_problem == 1:
+            model.setObjective(T3, GRB.MINIMIZE)
+            constraint = model.addQConstr(T3 * (m + R) <= 0.0, "c0")
+        elif optimization_problem == 2:
+            model.setObjective(T3 * (m + R), GRB.MINIMIZE)
+            constraint = model.addConstr(T3 <= 0.0, "c0")
+        elif optimization_problem == 3:
+            model.setObjective(T3 * (m + R), GRB.MINIMIZE)
+        model.addConstr(alfa[0] == z[0], "c1")  # z0 = α0
+        model.addConstr(alfa[1] == z[1] * m, "c2")  # z1 = α1 / m -> z1 * m = α1
+        model.addConstr(alfa[2] * R == z[2] * m, "c3")  # z2 = (α2 * R) / m -> z2 * m = α2 * R
+        model.addConstr(alfa[3] * m == z[3] * R, "c4")  # z3 = (α3 * m) / R -> z3 * R = α3 * m
+        model.addConstr(alfa[4] == z[4] * R, "c5")  # z4 = α4 / R -> z4 * R = α4
+        model.addConstr(alfa[5] * R == z[5], "c6")  # z5 = α5 * R
+        return {"model": model,
+                "m": m,
+                "R": R,
+                "alfa": alfa,
+                "T3": T3,
+                "constraint": constraint}
+
+    def update_model(self,
+                     handles: dict,
+                     parameters: CrespParameters,
+                     incumbent: CrespResult) -> None:
+        handles["m"].LB = parameters.m_lower_bound
+        handles["m"].UB = parameters.m_upper_bound
+        handles["R"].LB = parameters.R_lower_bound
+        handles["R"].UB = parameters.R_upper_bound
+        alfa_constants = (parameters.alfaZero, parameters.alfaOne, parameters.alfaTwo,
+                          parameters.alfaThree, parameters.alfaFour, parameters.alfaFive)
+        for alfa_i, alfa_constant in zip(handles["alfa"], alfa_constants):
+            alfa_i.LB = alfa_constant
+            alfa_i.UB = alfa_constant
+        if parameters.optimization_problem == 1:
+            handles["constraint"].QCRHS = parameters.Phi * parameters.Gamma / parameters.Upsilon
+        elif parameters.optimization_problem == 2:
+            handles["constraint"].RHS = parameters.Tau
+        # WARM START (THE AUXILIARY VARIABLES ARE COMPLETED BY GUROBI)
+        handles["m"].Start = incumbent.m if incumbent.is_feasible() else GRB.UNDEFINED
+        handles["R"].Start = incumbent.R if incumbent.is_feasible() else GRB.UNDEFINED
+
+    def solve(self,
+              parameters: CrespParameters,
+              solve_incumbent) -> CrespResult:
+        model_key = (parameters.optimization_problem, parameters.time_unit)
+        with self.lock:
+            if model_key not in self.models:
+                self.models[model_key] = self.build_model(parameters.optimization_problem, parameters.time_unit)
+            handles = self.models[model_key]
+            # THE PREVIOUS SOLUTION OF THIS MODEL IS THE INCUMBENT, AS LONG AS IT IS STILL WITHIN BOUNDS AND FEASIBLE;
+            # OTHERWISE, THE INCUMBENT COMES FROM solve_incumbent: A CHEAP HEURISTIC, AS AN EXACT SEARCH WOULD ALREADY
+            # ANSWER THE PROBLEM, LEAVING GUROBI NOTHING BUT LATENCY TO ADD
+            incumbent = self.previous_results.get(model_key, CrespResult())
+            if not (incumbent.is_feasible() and
+                    parameters.m_lower_bound <= incumbent.m <= parameters.m_upper_bound and
+                    parameters.R_lower_bound <= incumbent.R <= parameters.R_upper_bound and
+                    (parameters.optimization_problem == 3 or
+                     parameters.is_constraint_not_violated(parameters.calculate_C_from_allocation(incumbent.m,
+                                                                                                  incumbent.R),
+                                                           parameters.calculate_T3(incumbent.m, incumbent.R)))):
+                incumbent = solve_incumbent(parameters)
+            self.update_model(handles, parameters, incumbent)
+            # OPTIMIZE MODEL
+            handles["model"].optimize()
+            result = CrespResult()
+            # IF MODEL IS FEASIBLE (FOUND OPTIMAL VALUE, GRB.OPTIMAL):
+            if handles["model"].status == 2:
+                m_value = ceil(handles["m"].x)
+                R_value = ceil(handles["R"].x)
+                T3_value = handles["T3"].getValue()
+                result = CrespOptimizer.get_model_result(parameters,
+                                                         m_value,
+                                                         R_value,
+                                                         T3_value,
+                                                         parameters.calculate_C(T3_value, m_value, R_value))
+            self.previous_results[model_key] = result
+        return result
+
+    def close(self) -> None:
+        with self.lock:
+            for handles in self.models.values():
+                handles["model"].dispose()
+            self.models = {}
+            self.previous_results = {}
+            if self.env is not None:
+                self.env.dispose()
+                self.env = None
+
+
+def solve_with_gurobi_session(cresp_optimizer: CrespOptimizer,
+                              parameters: CrespParameters) -> CrespResult:
+    return cresp_optimizer.get_backend_session("gurobi_session", CrespGurobiSession) \
+        .solve(parameters, partial(cresp_optimizer.search_relaxed_neighbourhood, radius=0))
@@ -1,11 +1,452 @@
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
-from gurobipy import Env, GRB, Model
+from copy import copy
+from functools import partial
+from heapq import heappop, heappush
+from hashlib import sha256
+from importlib import import_module
 from math import ceil, inf, log
+from numpy import add, any as numpy_any, arange, argmax, argmin, asarray, broadcast_to, cbrt, ceil as numpy_ceil, \
+    clip, concatenate, copyto, divide, empty, errstate, float64, floor, full, inf as numpy_inf, int64, isin, \
+    less_equal, lexsort, load, maximum, minimum, multiply, nan_to_num, ndarray, newaxis, searchsorted, sqrt, \
+    take_along_axis, vectorize, where, zeros
 from pathlib import Path
+from sqlite3 import connect
+from threading import Lock
 from time import time
 from sys import exit
 
 
+class CrespParameters:
+    # IMMUTABLE INPUTS OF ONE OPTIMIZATION (OR OF A BATCH OF SCENARIOS, WHEN THE FIELDS ARE NUMPY COLUMNS):
+    # α CONSTANTS, γ, υ AND τ ALREADY CONVERTED TO THE TIME UNIT, VARIABLES BOUNDS AND OPTIMIZATION PROBLEM
+    __slots__ = ("alfaZero",
+                 "alfaOne",
+                 "alfaTwo",
+                 "alfaThree",
+                 "alfaFour",
+                 "alfaFive",
+                 "Gamma",
+                 "Upsilon",
+                 "Phi",
+                 "Tau",
+                 "m_lower_bound",
+                 "m_upper_bound",
+                 "R_lower_bound",
+                 "R_upper_bound",
+                 "time_unit",
+                 "optimization_problem")
+
+    def __init__(self,
+                 alfaZero: float,
+                 alfaOne: float,
+                 alfaTwo: float,
+                 alfaThree: float,
+                 alfaFour: float,
+                 alfaFive: float,
+                 Gamma: int,
+                 Upsilon: float,
+                 Phi: float,
+                 Tau: float,
+                 m_lower_bound: int,
+                 m_upper_bound: int,
+                 R_lower_bound: int,
+                 R_upper_bound: int,
+                 time_unit: str,
+                 optimization_problem: int) -> None:
+        values = (alfaZero, alfaOne, alfaTwo, alfaThree, alfaFour, alfaFive, Gamma, Upsilon, Phi, Tau,
+                  m_lower_bound, m_upper_bound, R_lower_bound, R_upper_bound, time_unit, optimization_problem)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self,
+                    name: str,
+                    value) -> None:
+        raise AttributeError("CrespParameters objects are immutable (use 'replace' instead)!")
+
+    def __delattr__(self,
+                    name: str) -> None:
+        raise AttributeError("CrespParameters objects are immutable!")
+
+    def __reduce__(self) -> tuple:
+        return CrespParameters, tuple(getattr(self, name) for name in self.__slots__)
+
+    def get_canonical_key(self,
+                          mode: str) -> str:
+        # HASH OF EVERY INPUT THAT AFFECTS THE SOLUTION (FLOATS IN THEIR EXACT HEXADECIMAL FORM)
+        values = [mode] + [value.hex() if isinstance(value, float) else str(value)
+                           for value in (getattr(self, name) for name in self.__slots__)]
+        return sha256("|".join(values).encode("utf-8")).hexdigest()
+
+    def replace(self,
+                **changes) -> "CrespParameters":
+        return CrespParameters(*(changes.get(name, getattr(self, name)) for name in self.__slots__))
+
+    def calculate_T3(self,
+                     m: int,
+                     R: int) -> float:
+        T3 = self.alfaZero + \
+             self.alfaOne / m + \
+             (self.alfaTwo * R) / m + \
+             (self.alfaThree * m) / R + \
+             self.alfaFour / R + \
+             self.alfaFive * R
+        if self.time_unit == "hour":
+            T3 = T3 / 3600
+        elif self.time_unit == "minute":
+            T3 = T3 / 60
+        return T3
+
+    def calculate_T3_lower_bound(self,
+                                 m_lower: int,
+                                 m_upper: int,
+                                 R_lower: int,
+                                 R_upper: int) -> float:
+        # EVERY T3 TERM IS MONOTONE IN m AND IN R, SO EACH ONE IS BOUNDED AT A CORNER OF THE [m_lower, m_upper] ×
+        # [R_lower, R_upper] RECTANGLE; AS IEEE ROUNDING IS MONOTONE TOO, THE BOUND ALSO HOLDS FOR THE COMPUTED VALUES
+        T3 = self.alfaZero + \
+             self.alfaOne / m_upper + \
+             (self.alfaTwo * R_lower) / m_upper + \
+             (self.alfaThree * m_lower) / R_upper + \
+             self.alfaFour / R_upper + \
+             self.alfaFive * R_lower
+        if self.time_unit == "hour":
+            T3 = T3 / 3600
+        elif self.time_unit == "minute":
+            T3 = T3 / 60
+        return T3
+
+    def calculate_C(self,
+                    T3: float,
+                    m: int,
+                    R: int) -> float:
+        return self.Upsilon * T3 * (m + R) / self.Gamma
+
+    def calculate_T3_into(self,
+                          m: ndarray,
+                          R: ndarray,
+                          T3: ndarray,
+                          buffer: ndarray) -> ndarray:
+        # SAME VALUES AS calculate_T3 (SAME IEEE OPERATIONS, IN THE SAME ORDER) OVER AN m COLUMN × R ROW TILE, WRITTEN
+        # INTO THE PREALLOCATED T3 ARRAY: ONLY ROW / COLUMN SIZED TEMPORARIES ARE CREATED
+        divide(self.alfaTwo * R, m, out=T3)
+        add(self.alfaZero + self.alfaOne / m, T3, out=T3)
+        divide(self.alfaThree * m, R, out=buffer)
+        add(T3, buffer, out=T3)
+        add(T3, self.alfaFour / R, out=T3)
+        add(T3, self.alfaFive * R, out=T3)
+        if self.time_unit == "hour":
+            divide(T3, 3600, out=T3)
+        elif self.time_unit == "minute":
+            divide(T3, 60, out=T3)
+        return T3
+
+    def calculate_C_into(self,
+                         T3: ndarray,
+                         m: ndarray,
+                         R: ndarray,
+                         C: ndarray,
+                         buffer: ndarray) -> ndarray:
+        # SAME VALUES AS calculate_C, WRITTEN INTO THE PREALLOCATED C ARRAY
+        multiply(T3, self.Upsilon, out=C)
+        add(m, R, out=buffer)
+        multiply(C, buffer, out=C)
+        divide(C, self.Gamma, out=C)
+        return C
+
+    def calculate_C_from_allocation(self,
+                                    m: int,
+                                    R: int) -> float:
+        return self.calculate_C(self.calculate_T3(m, R), m, R)
+
+    def calculate_T3_coefficients_in_R(self,
+                                       m: ndarray) -> tuple:
+        # FOR A FIXED m, T3(m,R) = a + b/R + cR, WITH a = α0 + α1/m, b = α3m + α4 AND c = α2/m + α5 (ALL >= 0)
+        a = self.alfaZero + self.alfaOne / m
+        b = self.alfaThree * m + self.alfaFour
+        c = self.alfaTwo / m + self.alfaFive
+        if self.time_unit == "hour":
+            a, b, c = a / 3600, b / 3600, c / 3600
+        elif self.time_unit == "minute":
+            a, b, c = a / 60, b / 60, c / 60
+        return a, b, c
+
+    def is_constraint_not_violated(self,
+                                   C: float,
+                                   T3: float) -> bool:
+        if self.optimization_problem == 1:
+            return C <= self.Phi
+        if self.optimization_problem == 2:
+            return T3 <= self.Tau
+
+    def calculate_optimal_number_of_vms(self,
+                                        m: int,
+                                        R: int) -> int:
+        return ceil((m + R) / self.Gamma)
+
+
+class CrespResult:
+    # IMMUTABLE OUTPUT OF ONE OPTIMIZATION (m = R = 0 AND T3 = C = INFINITY IF THE MODEL IS INFEASIBLE)
+    __slots__ = ("m",
+                 "R",
+                 "T3",
+                 "C",
+                 "Nu")
+
+    def __init__(self,
+                 m: int = 0,
+                 R: int = 0,
+                 T3: float = inf,
+                 C: float = inf,
+                 Nu: int = 0) -> None:
+        for name, value in zip(self.__slots__, (m, R, T3, C, Nu)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self,
+                    name: str,
+                    value) -> None:
+        raise AttributeError("CrespResult objects are immutable!")
+
+    def __delattr__(self,
+                    name: str) -> None:
+        raise AttributeError("CrespResult objects are immutable!")
+
+    def __reduce__(self) -> tuple:
+        return CrespResult, (self.m, self.R, self.T3, self.C, self.Nu)
+
+    def __repr__(self) -> str:
+        return "CrespResult(m={0}, R={1}, T3={2}, C={3}, Nu={4})".format(self.m, self.R, self.T3, self.C, self.Nu)
+
+    def is_feasible(self) -> bool:
+        return self.m > 0 and self.R > 0
+
+
+class CrespAnytimeResult:
+    # IMMUTABLE OUTPUT OF ONE DEADLINE-BOUNDED OPTIMIZATION: THE BEST ALLOCATION FOUND, A LOWER BOUND ON THE OPTIMAL
+    # OBJECTIVE (T3 FOR THE OPTIMIZATION PROBLEM 1, C OTHERWISE) AND THE RELATIVE OPTIMALITY GAP BETWEEN THEM
+    # (0 ONCE THE SEARCH PROVED THE RESULT OPTIMAL, OR THE MODEL INFEASIBLE; INFINITY IF NO ALLOCATION WAS FOUND YET)
+    __slots__ = ("result",
+                 "lower_bound",
+                 "optimality_gap")
+
+    def __init__(self,
+                 result: CrespResult,
+                 lower_bound: float,
+                 optimality_gap: float) -> None:
+        for name, value in zip(self.__slots__, (result, lower_bound, optimality_gap)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self,
+                    name: str,
+                    value) -> None:
+        raise AttributeError("CrespAnytimeResult objects are immutable!")
+
+    def __delattr__(self,
+                    name: str) -> None:
+        raise AttributeError("CrespAnytimeResult objects are immutable!")
+
+    def __reduce__(self) -> tuple:
+        return CrespAnytimeResult, (self.result, self.lower_bound, self.optimality_gap)
+
+    def __repr__(self) -> str:
+        return "CrespAnytimeResult(result={0}, lower_bound={1}, optimality_gap={2})" \
+            .format(self.result, self.lower_bound, self.optimality_gap)
+
+    def is_optimal(self) -> bool:
+        return self.optimality_gap == 0
+
+
+class CrespParetoFrontier:
+    # NON-DOMINATED (T3, C) ALLOCATIONS OF THE m×R BOUNDS, SORTED BY INCREASING T3 (AND THUS STRICTLY DECREASING C).
+    # IT DOES NOT DEPEND ON φ, τ OR ON THE OPTIMIZATION PROBLEM, WHICH BECOME BINARY SEARCHES OVER THE FRONTIER.
+    # AMONG ALLOCATIONS WITH THE SAME T3 (OR THE SAME C) ONLY THE CHEAPEST (OR THE FASTEST) ONE IS KEPT ON THE FRONTIER;
+    # THE TIES (EVERY ALLOCATION WHOSE T3 OR C EQUALS THE ONE OF A FRONTIER ALLOCATION, SORTED BY m, THEN R) ARE KEPT
+    # APART, SO THAT AN OPTIMUM IS BROKEN TOWARDS THE LOWEST m, AND THEN THE LOWEST R, AS THE BRUTE FORCE DOES
+    __slots__ = ("m",
+                 "R",
+                 "T3",
+                 "C",
+                 "Gamma",
+                 "ties_m",
+                 "ties_R",
+                 "ties_T3",
+                 "ties_C")
+
+    def __init__(self,
+                 m: ndarray,
+                 R: ndarray,
+                 T3: ndarray,
+                 C: ndarray,
+                 Gamma: int,
+                 ties: tuple = None) -> None:
+        self.m = m
+        self.R = R
+        self.T3 = T3
+        self.C = C
+        self.Gamma = Gamma
+        if ties is None:
+            ties = (m, R, T3, C)
+        order = lexsort((ties[1], ties[0]))
+        self.ties_m, self.ties_R, self.ties_T3, self.ties_C = (tie_values[order] for tie_values in ties)
+
+    def __len__(self) -> int:
+        return len(self.T3)
+
+    @staticmethod
+    def get_non_dominated_frontier(m: ndarray,
+                                   R: ndarray,
+                                   T3: ndarray,
+                                   C: ndarray) -> tuple:
+        # SORT BY T3, THEN C, THEN m AND R; KEEP THE ALLOCATIONS WHOSE C IS LOWER THAN EVERY C SORTED BEFORE THEM
+        order = lexsort((R, m, C, T3))
+        m, R, T3, C = m[order], R[order], T3[order], C[order]
+        is_non_dominated = C < concatenate(([numpy_inf], minimum.accumulate(C)[:-1]))
+        return m[is_non_dominated], R[is_non_dominated], T3[is_non_dominated], C[is_non_dominated]
+
+    @staticmethod
+    def get_frontier_ties(m: ndarray,
+                          R: ndarray,
+                          T3: ndarray,
+                          C: ndarray,
+                          T3_frontier: ndarray,
+                          C_frontier: ndarray) -> tuple:
+        # THE ALLOCATIONS WHOSE T3 OR C EQUALS THE ONE OF A FRONTIER ALLOCATION (INCLUDING THE FRONTIER ONES)
+        is_tie = isin(T3, T3_frontier) | isin(C, C_frontier)
+        return m[is_tie], R[is_tie], T3[is_tie], C[is_tie]
+
+    def get_result(self,
+                   is_optimal_tie: ndarray) -> CrespResult:
+        # THE FIRST (LOWEST m, THEN LOWEST R) OPTIMAL TIE
+        if not is_optimal_tie.any():
+            return CrespResult()
+        index = int(argmax(is_optimal_tie))
+        m = int(self.ties_m[index])
+        R = int(self.ties_R[index])
+        return CrespResult(m, R, float(self.ties_T3[index]), float(self.ties_C[index]), ceil((m + R) / self.Gamma))
+
+    def get_minimum_time_under_budget(self,
+                                      Phi: float) -> CrespResult:
+        # FIRST ALLOCATION (LOWEST T3) WHOSE C <= φ; C IS DECREASING, SO -C IS SORTED
+        index = int(searchsorted(-self.C, -Phi, side="left"))
+        if index >= len(self.T3):
+            return CrespResult()
+        return self.get_result((self.ties_T3 == self.T3[index]) & (self.ties_C <= Phi))
+
+    def get_minimum_cost_under_deadline(self,
+                                        Tau: float) -> CrespResult:
+        # LAST ALLOCATION (LOWEST C) WHOSE T3 <= τ
+        index = int(searchsorted(self.T3, Tau, side="right")) - 1
+        if index < 0:
+            return CrespResult()
+        return self.get_result((self.ties_C == self.C[index]) & (self.ties_T3 <= Tau))
+
+    def get_minimum_cost(self) -> CrespResult:
+        if len(self.T3) == 0:
+            return CrespResult()
+        return self.get_result(self.ties_C == self.C[-1])
+
+    def get_optimum(self,
+                    parameters: CrespParameters) -> CrespResult:
+        if parameters.optimization_problem == 1:
+            return self.get_minimum_time_under_budget(parameters.Phi)
+        if parameters.optimization_problem == 2:
+            return self.get_minimum_cost_under_deadline(parameters.Tau)
+        return self.get_minimum_cost()
+
+
+class CrespResultCache:
+    # MEMOIZATION OF CrespResult OBJECTS: AN IN-MEMORY LRU TIER AND AN OPTIONAL ON-DISK (SQLITE) TIER, BOTH EVICTING
+    # THEIR LEAST RECENTLY USED ENTRIES ONCE FULL. THE DISK TIER IS EMPTIED WHEN THE β PARAMETERS FINGERPRINT CHANGES
+    # (E.G., AFTER 'beta_parameters_learner.py' REWRITES THE β PARAMETERS)
+
+    def __init__(self,
+                 memory_cache_size: int,
+                 disk_cache_file_path: Path,
+                 disk_cache_size: int,
+                 beta_parameters_fingerprint: str) -> None:
+        self.memory_cache_size = memory_cache_size
+        self.disk_cache_file_path = disk_cache_file_path
+        self.disk_cache_size = disk_cache_size
+        self.beta_parameters_fingerprint = beta_parameters_fingerprint
+        self.memory_cache = OrderedDict()
+        self.disk_cache_connection = None
+        self.lock = Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self.disk_cache_file_path is not None:
+            self.open_disk_cache()
+
+    def open_disk_cache(self) -> None:
+        self.disk_cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.disk_cache_connection = connect(self.disk_cache_file_path, check_same_thread=False)
+        self.disk_cache_connection.execute("CREATE TABLE IF NOT EXISTS metadata "
+                                           "(name TEXT PRIMARY KEY, value TEXT)")
+        self.disk_cache_connection.execute("CREATE TABLE IF NOT EXISTS results "
+                                           "(key TEXT PRIMARY KEY, m INTEGER, R INTEGER, T3 REAL, C REAL, "
+                                           "Nu INTEGER, last_used REAL)")
+        row = self.disk_cache_connection.execute("SELECT value FROM metadata WHERE name = 'beta_parameters'") \
+            .fetchone()
+        if row is None or row[0] != self.beta_parameters_fingerprint:
+            # INVALIDATE THE RESULTS COMPUTED WITH OTHER β PARAMETERS
+            self.disk_cache_connection.execute("DELETE FROM results")
+            self.disk_cache_connection.execute("INSERT OR REPLACE INTO metadata VALUES ('beta_parameters', ?)",
+                                               (self.beta_parameters_fingerprint,))
+        self.disk_cache_connection.commit()
+
+    def get(self,
+            key: str):
+        with self.lock:
+            result = self.memory_cache.get(key)
+            if result is not None:
+                self.memory_cache.move_to_end(key)
+                self.memory_hits += 1
+                return result
+            if self.disk_cache_connection is not None:
+                row = self.disk_cache_connection.execute("SELECT m, R, T3, C, Nu FROM results WHERE key = ?",
+                                                         (key,)).fetchone()
+                if row is not None:
+                    self.disk_cache_connection.execute("UPDATE results SET last_used = ? WHERE key = ?",
+                                                       (time(), key))
+                    self.disk_cache_connection.commit()
+                    result = CrespResult(*row)
+                    self.put_on_memory_cache(key, result)
+                    self.disk_hits += 1
+                    return result
+            self.misses += 1
+            return None
+
+    def put_on_memory_cache(self,
+                            key: str,
+                            result: CrespResult) -> None:
+        self.memory_cache[key] = result
+        self.memory_cache.move_to_end(key)
+        while len(self.memory_cache) > self.memory_cache_size:
+            self.memory_cache.popitem(last=False)
+
+    def put(self,
+            key: str,
+            result: CrespResult) -> None:
+        with self.lock:
+            self.put_on_memory_cache(key, result)
+            if self.disk_cache_connection is not None:
+                self.disk_cache_connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                                   (key, result.m, result.R, result.T3, result.C, result.Nu, time()))
+                self.disk_cache_connection.execute("DELETE FROM results WHERE key IN "
+                                                   "(SELECT key FROM results ORDER BY last_used DESC "
+                                                   "LIMIT -1 OFFSET ?)",
+                                                   (self.disk_cache_size,))
+                self.disk_cache_connection.commit()
+
+    def get_statistics(self) -> dict:
+        with self.lock:
+            return {"memory_hits": self.memory_hits,
+                    "disk_hits": self.disk_hits,
+                    "misses": self.misses,
+                    "memory_entries": len(self.memory_cache)}
+
+
 class CrespOptimizer:
 
     def __init__(self) -> None:
@@ -40,6 +481,36 @@ class CrespOptimizer:
         self.optimization_problem = 0
         self.optimization_problem_description = None
         self.optimization_modes = None
+        self.workers = 1
+        self.result_cache = None
+        self.pareto_frontiers = OrderedDict()
+        self.pareto_frontiers_size = 16
+        self.pareto_frontiers_lock = Lock()
+        self.backend_sessions = {}
+        self.backend_sessions_lock = Lock()
+        self.branch_and_bound_leaf_size = 256
+        self.branch_and_bound_statistics = {"evaluated_cells": 0, "brute_force_cells": 0}
+        self.anytime_deadline_in_seconds = 1.0
+        self.approximate_neighbourhood_radius = 2
+        self.approximate_reference_mode = None
+        self.instance_catalogue = []
+        self.sensitivity_factors = []
+        self.sensitivity_parameters = OrderedDict([("β0", "betaZero"),
+                                                   ("β1", "betaOne"),
+                                                   ("β2", "betaTwo"),
+                                                   ("β3", "betaThree"),
+                                                   ("β4", "betaFour"),
+                                                   ("β5", "betaFive"),
+                                                   ("β6", "betaSix"),
+                                                   ("β7", "betaSeven"),
+                                                   ("υ", "Upsilon"),
+                                                   ("φ", "Phi"),
+                                                   ("τ", "Tau")])
+        self.anytime_statistics = {"solves": 0, "optimal_solves": 0, "worst_optimality_gap": 0.0}
+        self.search_statistics_lock = Lock()
+        self.vectorized_block_size = 65536
+        self.model_registry = OrderedDict()
+        self.model_profile = None
         self.T3 = inf
         self.C = inf
         self.Nu = 0
@@ -57,8 +528,41 @@ class CrespOptimizer:
             raise ValueError(exception_message)
         return beta_i_value
 
+    def get_sufficient_statistics_file_path(self,
+                                            config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'sufficient_statistics_file' must be empty or a valid path file!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            sufficient_statistics_file = str(config_parser.get("general", "sufficient_statistics_file", fallback=""))
+            sufficient_statistics_file_path = \
+                Path(sufficient_statistics_file) if len(sufficient_statistics_file) > 0 else None
+        except ValueError:
+            raise ValueError(exception_message)
+        return sufficient_statistics_file_path
+
+    def load_beta_parameters_from_sufficient_statistics(self,
+                                                        sufficient_statistics_file_path: Path) -> None:
+        # .npz FILE WRITTEN BY beta_parameters_learner.py IN THE ONLINE LEARNING MODE: beta_parameters (β0...β7) ARE
+        # THE ONES LEARNED FROM EVERY EXPERIMENT FOLDED IN SO FAR
+        exception_message = "{0}: the sufficient statistics must hold the 'beta_parameters' array " \
+                            "(8 β parameters, equal or higher than zero)!" \
+            .format(sufficient_statistics_file_path)
+        with load(sufficient_statistics_file_path) as sufficient_statistics:
+            if "beta_parameters" not in sufficient_statistics.files:
+                raise ValueError(exception_message)
+            beta_parameters = sufficient_statistics["beta_parameters"]
+        if beta_parameters.shape != (8,) or (beta_parameters < 0.0).any():
+            raise ValueError(exception_message)
+        (self.betaZero, self.betaOne, self.betaTwo, self.betaThree,
+         self.betaFour, self.betaFive, self.betaSix, self.betaSeven) = (float(beta_i) for beta_i in beta_parameters)
+
     def load_beta_parameters(self,
                              config_parser: ConfigParser) -> None:
+        # FROM THE SUFFICIENT STATISTICS FILE OF THE ONLINE LEARNING MODE, IF ANY IS SET, OR ELSE FROM THE β FIELDS
+        sufficient_statistics_file_path = self.get_sufficient_statistics_file_path(config_parser)
+        if sufficient_statistics_file_path is not None:
+            self.load_beta_parameters_from_sufficient_statistics(sufficient_statistics_file_path)
+            return
         self.betaZero = self.get_beta_i(config_parser, "β0")
         self.betaOne = self.get_beta_i(config_parser, "β1")
         self.betaTwo = self.get_beta_i(config_parser, "β2")
@@ -68,6 +572,74 @@ class CrespOptimizer:
         self.betaSix = self.get_beta_i(config_parser, "β6")
         self.betaSeven = self.get_beta_i(config_parser, "β7")
 
+    def get_model_registry_file_path(self,
+                                     config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'model_registry_file' must be empty or a valid path file!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            model_registry_file = str(config_parser.get("general", "model_registry_file", fallback=""))
+            model_registry_file_path = Path(model_registry_file) if len(model_registry_file) > 0 else None
+        except ValueError:
+            raise ValueError(exception_message)
+        return model_registry_file_path
+
+    def get_model_profile(self,
+                          config_parser: ConfigParser) -> str:
+        exception_message = "{0}: 'model_profile' must be empty or the name of a profile of 'model_registry_file'!" \
+            .format(self.cresp_optimizer_config_file_path)
+        model_profile = str(config_parser.get("general", "model_profile", fallback="")).strip()
+        if len(model_profile) == 0:
+            return None
+        if model_profile not in self.model_registry:
+            raise ValueError(exception_message)
+        return model_profile
+
+    def load_model_registry(self,
+                            config_parser: ConfigParser) -> None:
+        # .npz FILE WRITTEN BY beta_parameters_learner.py: profiles (NAMES), beta_parameters (ONE ROW OF β0...β7 PER
+        # PROFILE) AND experiments_count. READ ONCE; ITS PROFILES ARE THEN SELECTED WITHOUT READING ANY FILE AGAIN
+        self.model_registry = OrderedDict()
+        model_registry_file_path = self.get_model_registry_file_path(config_parser)
+        if model_registry_file_path is not None:
+            exception_message = "{0}: the model registry must hold the 'profiles' and 'beta_parameters' arrays " \
+                                "(one row of 8 β parameters, equal or higher than zero, per profile)!" \
+                .format(model_registry_file_path)
+            with load(model_registry_file_path) as model_registry:
+                if "profiles" not in model_registry.files or "beta_parameters" not in model_registry.files:
+                    raise ValueError(exception_message)
+                profiles, beta_parameters = model_registry["profiles"], model_registry["beta_parameters"]
+            if beta_parameters.shape != (len(profiles), 8) or (beta_parameters < 0.0).any():
+                raise ValueError(exception_message)
+            for profile, profile_beta_parameters in zip(profiles, beta_parameters.astype(float64)):
+                self.model_registry[str(profile)] = tuple(float(beta_i) for beta_i in profile_beta_parameters)
+        self.model_profile = self.get_model_profile(config_parser)
+        if self.model_profile is not None:
+            self.select_model_profile(self.model_profile)
+
+    def get_profile_beta_parameters(self,
+                                    profile: str) -> tuple:
+        if profile not in self.model_registry:
+            raise ValueError("Unknown model profile: '{0}' (available: {1})!"
+                             .format(profile, ", ".join(self.model_registry) or "none"))
+        return self.model_registry[profile]
+
+    def select_model_profile(self,
+                             profile: str) -> None:
+        # REPLACES THE β PARAMETERS WITH THE ONES OF A REGISTRY PROFILE (calculate_alfa_constants MUST FOLLOW, IF THE α
+        # CONSTANTS WERE ALREADY CALCULATED)
+        (self.betaZero, self.betaOne, self.betaTwo, self.betaThree,
+         self.betaFour, self.betaFive, self.betaSix, self.betaSeven) = self.get_profile_beta_parameters(profile)
+        self.model_profile = profile
+
+    def get_profile_parameters(self,
+                               profile: str) -> CrespParameters:
+        # PARAMETERS OF THIS OPTIMIZER'S SCENARIO UNDER THE β PARAMETERS OF A REGISTRY PROFILE, PICKED AT SOLVE TIME
+        # (E.G., co.solve(co.get_profile_parameters("sort"), "brute_force")), LEAVING THE OPTIMIZER UNCHANGED
+        profile_optimizer = copy(self)
+        profile_optimizer.select_model_profile(profile)
+        profile_optimizer.calculate_alfa_constants()
+        return profile_optimizer.get_model_parameters()
+
     def get_M(self,
               config_parser: ConfigParser) -> int:
         exception_message = "{0}: 'M' (number of Map tasks) must be a integer value higher than zero!" \
@@ -228,19 +800,28 @@ class CrespOptimizer:
         self.time_unit = self.get_time_unit(config_parser)
 
     def convert_time_unit_dependent_variables(self) -> None:
+        self.Upsilon = self.get_upsilon_in_time_unit(self.Upsilon)
         if self.time_unit == "minute":
-            self.Upsilon = self.Upsilon / 60  # Price of renting one VM instance per minute
             self.Tau = self.Tau * 60  # Maximum amount of time τ, in minutes, for finishing the job (Time constraint)
         elif self.time_unit == "second":
-            self.Upsilon = self.Upsilon / 3600  # Price of renting one VM instance per second
             self.Tau = self.Tau * 3600  # Maximum amount of time τ, in seconds, for finishing the job (Time constraint)
 
+    def get_upsilon_in_time_unit(self,
+                                 upsilon: float) -> float:
+        if self.time_unit == "minute":
+            return upsilon / 60  # Price of renting one VM instance per minute
+        if self.time_unit == "second":
+            return upsilon / 3600  # Price of renting one VM instance per second
+        return upsilon
+
     def calculate_alfa_constants(self) -> None:
         self.alfaZero = self.betaZero + (self.betaSix * self.M)
         self.alfaOne = self.betaOne * self.M
         self.alfaTwo = self.betaTwo * self.M
         self.alfaThree = self.betaThree
-        self.alfaFour = (self.betaFour * self.M * log(self.M)) + (self.betaFive * self.M)
+        # M MAY BE A COLUMN OF SCENARIOS (BATCH OPTIMIZATION), math.log IS THEN APPLIED ELEMENT BY ELEMENT
+        log_M = vectorize(log, otypes=[float64])(self.M) if isinstance(self.M, ndarray) else log(self.M)
+        self.alfaFour = (self.betaFour * self.M * log_M) + (self.betaFive * self.M)
         self.alfaFive = self.betaSeven
 
     def get_optimization_problem(self,
@@ -272,7 +853,7 @@ class CrespOptimizer:
 
     def get_optimization_modes(self,
                                config_parser: ConfigParser) -> list:
-        valid_optimization_mode_list = ["brute_force", "gurobi"]
+        valid_optimization_mode_list = list(optimization_modes_registry)
         exception_message = "{0}: supported 'optimization_modes' values: {1}." \
             .format(self.cresp_optimizer_config_file_path, " | ".join(valid_optimization_mode_list))
         try:
@@ -288,34 +869,259 @@ class CrespOptimizer:
                                 config_parser: ConfigParser) -> None:
         self.optimization_modes = self.get_optimization_modes(config_parser)
 
-    def calculate_T3(self,
-                     m: int,
-                     R: int) -> float:
-        T3 = self.alfaZero + \
-             self.alfaOne / m + \
-             (self.alfaTwo * R) / m + \
-             (self.alfaThree * m) / R + \
-             self.alfaFour / R + \
-             self.alfaFive * R
-        if self.time_unit == "hour":
-            T3 = T3 / 3600
-        elif self.time_unit == "minute":
-            T3 = T3 / 60
-        return T3
+    def get_workers(self,
+                    config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'workers' (number of worker processes) must be a integer value higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            workers = int(config_parser.get("general", "workers", fallback="1"))
+            if workers <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return workers
 
-    def calculate_C(self,
-                    T3: float,
-                    m: int,
-                    R: int) -> float:
-        return self.Upsilon * T3 * (m + R) / self.Gamma
+    def load_workers(self,
+                     config_parser: ConfigParser) -> None:
+        self.workers = self.get_workers(config_parser)
 
-    def is_constraint_not_violated(self,
-                                   C: float,
-                                   T3: float) -> bool:
-        if self.optimization_problem == 1:
-            return C <= self.Phi
-        if self.optimization_problem == 2:
-            return T3 <= self.Tau
+    def get_vectorized_block_size(self,
+                                  config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'vectorized_block_size' (maximum number of m×R cells evaluated at once) " \
+                            "must be a integer value higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            vectorized_block_size = int(config_parser.get("general", "vectorized_block_size", fallback="65536"))
+            if vectorized_block_size <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return vectorized_block_size
+
+    def load_vectorized_block_size(self,
+                                   config_parser: ConfigParser) -> None:
+        self.vectorized_block_size = self.get_vectorized_block_size(config_parser)
+
+    def get_anytime_deadline_in_seconds(self,
+                                        config_parser: ConfigParser) -> float:
+        exception_message = "{0}: 'anytime_deadline_in_seconds' (wall-clock time of the anytime optimization mode) " \
+                            "must be a float value higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            anytime_deadline_in_seconds = float(config_parser.get("general",
+                                                                  "anytime_deadline_in_seconds",
+                                                                  fallback="1"))
+            if anytime_deadline_in_seconds <= 0.0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return anytime_deadline_in_seconds
+
+    def load_anytime_deadline_in_seconds(self,
+                                         config_parser: ConfigParser) -> None:
+        self.anytime_deadline_in_seconds = self.get_anytime_deadline_in_seconds(config_parser)
+
+    def get_approximate_neighbourhood_radius(self,
+                                             config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'approximate_neighbourhood_radius' (integer neighbourhood of the approximate " \
+                            "optimization mode) must be a integer value equal or higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            approximate_neighbourhood_radius = int(config_parser.get("general",
+                                                                     "approximate_neighbourhood_radius",
+                                                                     fallback="2"))
+            if approximate_neighbourhood_radius < 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return approximate_neighbourhood_radius
+
+    def get_approximate_reference_mode(self,
+                                       config_parser: ConfigParser) -> str:
+        exception_message = "{0}: 'approximate_reference_mode' must be empty or one of: {1}." \
+            .format(self.cresp_optimizer_config_file_path, " | ".join(optimization_modes_registry))
+        approximate_reference_mode = str(config_parser.get("general", "approximate_reference_mode", fallback=""))
+        if len(approximate_reference_mode) == 0:
+            return None
+        if approximate_reference_mode not in optimization_modes_registry:
+            raise ValueError(exception_message)
+        return approximate_reference_mode
+
+    def load_approximate_settings(self,
+                                  config_parser: ConfigParser) -> None:
+        self.approximate_neighbourhood_radius = self.get_approximate_neighbourhood_radius(config_parser)
+        self.approximate_reference_mode = self.get_approximate_reference_mode(config_parser)
+
+    def get_sensitivity_factors(self,
+                                config_parser: ConfigParser) -> list:
+        # EMPTY: NO SENSITIVITY ANALYSIS. THE FACTOR 1 (UNPERTURBED PARAMETERS) IS ALWAYS INCLUDED
+        exception_message = "{0}: 'sensitivity_factors' must be empty or a list of float values higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        sensitivity_factors = str(config_parser.get("general", "sensitivity_factors", fallback=""))
+        if len(sensitivity_factors.strip()) == 0:
+            return []
+        try:
+            sensitivity_factors = [float(factor) for factor in sensitivity_factors.split(",")]
+            if any(factor <= 0.0 for factor in sensitivity_factors):
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return sorted(set(sensitivity_factors + [1.0]))
+
+    def load_sensitivity_factors(self,
+                                 config_parser: ConfigParser) -> None:
+        self.sensitivity_factors = self.get_sensitivity_factors(config_parser)
+
+    def get_memory_cache_size(self,
+                              config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'memory_cache_size' (number of cached results) " \
+                            "must be a integer value equal or higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            memory_cache_size = int(config_parser.get("cache", "memory_cache_size", fallback="0"))
+            if memory_cache_size < 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return memory_cache_size
+
+    def get_disk_cache_file_path(self,
+                                 config_parser: ConfigParser):
+        exception_message = "{0}: 'disk_cache_file' must be a valid path file (or empty)!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            disk_cache_file = str(config_parser.get("cache", "disk_cache_file", fallback="")).strip()
+            disk_cache_file_path = Path(disk_cache_file) if len(disk_cache_file) > 0 else None
+        except ValueError:
+            raise ValueError(exception_message)
+        return disk_cache_file_path
+
+    def get_disk_cache_size(self,
+                            config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'disk_cache_size' (number of cached results) " \
+                            "must be a integer value higher than zero!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            disk_cache_size = int(config_parser.get("cache", "disk_cache_size", fallback="100000"))
+            if disk_cache_size <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return disk_cache_size
+
+    def get_beta_parameters_fingerprint(self) -> str:
+        beta_parameters = (self.betaZero, self.betaOne, self.betaTwo, self.betaThree,
+                           self.betaFour, self.betaFive, self.betaSix, self.betaSeven)
+        return sha256("|".join(float(beta_i).hex() for beta_i in beta_parameters).encode("utf-8")).hexdigest()
+
+    def get_instance_catalogue_file_path(self,
+                                         config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'instance_catalogue_file' must be empty or a valid path file!" \
+            .format(self.cresp_optimizer_config_file_path)
+        try:
+            instance_catalogue_file = str(config_parser.get("general", "instance_catalogue_file", fallback=""))
+            instance_catalogue_file_path = Path(instance_catalogue_file) if len(instance_catalogue_file) > 0 else None
+        except ValueError:
+            raise ValueError(exception_message)
+        return instance_catalogue_file_path
+
+    def load_instance_catalogue(self,
+                                config_parser: ConfigParser) -> None:
+        # CSV FILE WITH A 'name, γ, υ' HEADER AND ONE INSTANCE TYPE PER LINE (υ PER HOUR, AS IN THE CONFIG FILE)
+        self.instance_catalogue = []
+        instance_catalogue_file_path = self.get_instance_catalogue_file_path(config_parser)
+        if instance_catalogue_file_path is None:
+            return
+        exception_message = "{0}: every instance type must have a name, a integer γ higher than zero " \
+                            "and a float υ higher than zero (header: 'name, γ, υ')!" \
+            .format(instance_catalogue_file_path)
+        with open(instance_catalogue_file_path, "r", encoding="utf-8") as instance_catalogue_file:
+            header = [column.strip() for column in instance_catalogue_file.readline().split(",")]
+            if header != ["name", "γ", "υ"]:
+                raise ValueError(exception_message)
+            for line in instance_catalogue_file:
+                if len(line.strip()) == 0:
+                    continue
+                try:
+                    name, gamma, upsilon = [field.strip() for field in line.split(",")]
+                    gamma, upsilon = int(gamma), float(upsilon)
+                    if len(name) == 0 or gamma <= 0 or upsilon <= 0.0:
+                        raise ValueError(exception_message)
+                except ValueError:
+                    raise ValueError(exception_message)
+                self.instance_catalogue.append((name, gamma, upsilon))
+        if len(self.instance_catalogue) == 0:
+            raise ValueError(exception_message)
+
+    def load_result_cache(self,
+                          config_parser: ConfigParser) -> None:
+        memory_cache_size = self.get_memory_cache_size(config_parser)
+        disk_cache_file_path = self.get_disk_cache_file_path(config_parser)
+        if memory_cache_size > 0 or disk_cache_file_path is not None:
+            self.result_cache = CrespResultCache(memory_cache_size,
+                                                 disk_cache_file_path,
+                                                 self.get_disk_cache_size(config_parser),
+                                                 self.get_beta_parameters_fingerprint())
+
+    def __getstate__(self) -> dict:
+        # THE RESULT CACHE (LOCK AND DATABASE CONNECTION), THE PARETO FRONTIERS AND THE SOLVER BACKEND SESSIONS STAY ON
+        # THE PROCESS THAT OWNS THEM
+        state = self.__dict__.copy()
+        state["result_cache"] = None
+        state["backend_sessions"] = {}
+        state["pareto_frontiers"] = OrderedDict()
+        del state["pareto_frontiers_lock"]
+        del state["backend_sessions_lock"]
+        del state["search_statistics_lock"]
+        return state
+
+    def __setstate__(self,
+                     state: dict) -> None:
+        self.__dict__.update(state)
+        self.pareto_frontiers_lock = Lock()
+        self.backend_sessions_lock = Lock()
+        self.search_statistics_lock = Lock()
+
+    def get_model_parameters(self) -> CrespParameters:
+        return CrespParameters(self.alfaZero,
+                               self.alfaOne,
+                               self.alfaTwo,
+                               self.alfaThree,
+                               self.alfaFour,
+                               self.alfaFive,
+                               self.Gamma,
+                               self.Upsilon,
+                               self.Phi,
+                               self.Tau,
+                               self.m_lower_bound,
+                               self.m_upper_bound,
+                               self.R_lower_bound,
+                               self.R_upper_bound,
+                               self.time_unit,
+                               self.optimization_problem)
+
+    def get_scenario_parameters(self,
+                                M: int,
+                                Gamma: int,
+                                Upsilon: float,
+                                Phi: float,
+                                Tau: float,
+                                beta_parameters: list = None) -> CrespParameters:
+        # PARAMETERS OF ANOTHER (M, γ, υ, φ, τ) SCENARIO (υ PER HOUR AND τ IN HOURS, AS IN THE CONFIG FILE), SHARING
+        # THIS OPTIMIZER'S BOUNDS, UNITS, OPTIMIZATION PROBLEM AND (UNLESS OTHERS ARE GIVEN) β PARAMETERS
+        scenario_optimizer = copy(self)
+        if beta_parameters is not None:
+            (scenario_optimizer.betaZero, scenario_optimizer.betaOne, scenario_optimizer.betaTwo,
+             scenario_optimizer.betaThree, scenario_optimizer.betaFour, scenario_optimizer.betaFive,
+             scenario_optimizer.betaSix, scenario_optimizer.betaSeven) = beta_parameters
+        scenario_optimizer.M = M
+        scenario_optimizer.Gamma = Gamma
+        scenario_optimizer.Upsilon = Upsilon
+        scenario_optimizer.Phi = Phi
+        scenario_optimizer.Tau = Tau
+        scenario_optimizer.convert_time_unit_dependent_variables()
+        scenario_optimizer.calculate_alfa_constants()
+        return scenario_optimizer.get_model_parameters()
 
     def reset_model_results(self) -> None:
         self.m = 0
@@ -324,121 +1130,669 @@ class CrespOptimizer:
         self.C = inf
         self.Nu = 0
 
-    def optimize_model_with_brute_force(self) -> None:
-        if self.optimization_problem == 1:
+    def set_model_results(self,
+                          result: CrespResult) -> None:
+        self.m = result.m
+        self.R = result.R
+        self.T3 = result.T3
+        self.C = result.C
+        self.Nu = result.Nu
+
+    @staticmethod
+    def get_model_result(parameters: CrespParameters,
+                         m: int,
+                         R: int,
+                         T3: float,
+                         C: float) -> CrespResult:
+        if m > 0 and R > 0:
+            return CrespResult(m, R, T3, C, parameters.calculate_optimal_number_of_vms(m, R))
+        return CrespResult()
+
+    @staticmethod
+    def solve_with_brute_force(parameters: CrespParameters) -> CrespResult:
+        m, R, T3, C = 0, 0, inf, inf
+        if parameters.optimization_problem == 1:
             # MINIMIZE T3(m,R):
             # SUBJECT TO:
             # Upsilon * [T3(m,R)] * [(m+R) / Gamma] <= Phi
-            for m_candidate in range(self.m_lower_bound, self.m_upper_bound + 1):
-                for R_candidate in range(self.R_lower_bound, self.R_upper_bound + 1):
-                    T3_candidate = self.calculate_T3(m_candidate, R_candidate)
-                    C_candidate = self.calculate_C(T3_candidate, m_candidate, R_candidate)
-                    if self.is_constraint_not_violated(C_candidate, T3_candidate):
-                        if T3_candidate < self.T3:
-                            self.m = m_candidate
-                            self.R = R_candidate
-                            self.T3 = T3_candidate
-                            self.C = C_candidate
-        elif self.optimization_problem == 2:
+            for m_candidate in range(parameters.m_lower_bound, parameters.m_upper_bound + 1):
+                for R_candidate in range(parameters.R_lower_bound, parameters.R_upper_bound + 1):
+                    T3_candidate = parameters.calculate_T3(m_candidate, R_candidate)
+                    C_candidate = parameters.calculate_C(T3_candidate, m_candidate, R_candidate)
+                    if parameters.is_constraint_not_violated(C_candidate, T3_candidate):
+                        if T3_candidate < T3:
+                            m, R, T3, C = m_candidate, R_candidate, T3_candidate, C_candidate
+        elif parameters.optimization_problem == 2:
             # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
             # SUBJECT TO:
             # T3(m,R) <= τ
-            for m_candidate in range(self.m_lower_bound, self.m_upper_bound + 1):
-                for R_candidate in range(self.R_lower_bound, self.R_upper_bound + 1):
-                    T3_candidate = self.calculate_T3(m_candidate, R_candidate)
-                    C_candidate = self.calculate_C(T3_candidate, m_candidate, R_candidate)
-                    if self.is_constraint_not_violated(C_candidate, T3_candidate):
-                        if C_candidate < self.C:
-                            self.m = m_candidate
-                            self.R = R_candidate
-                            self.T3 = T3_candidate
-                            self.C = C_candidate
-        elif self.optimization_problem == 3:
+            for m_candidate in range(parameters.m_lower_bound, parameters.m_upper_bound + 1):
+                for R_candidate in range(parameters.R_lower_bound, parameters.R_upper_bound + 1):
+                    T3_candidate = parameters.calculate_T3(m_candidate, R_candidate)
+                    C_candidate = parameters.calculate_C(T3_candidate, m_candidate, R_candidate)
+                    if parameters.is_constraint_not_violated(C_candidate, T3_candidate):
+                        if C_candidate < C:
+                            m, R, T3, C = m_candidate, R_candidate, T3_candidate, C_candidate
+        elif parameters.optimization_problem == 3:
             # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
-            for m_candidate in range(self.m_lower_bound, self.m_upper_bound + 1):
-                for R_candidate in range(self.R_lower_bound, self.R_upper_bound + 1):
-                    T3_candidate = self.calculate_T3(m_candidate, R_candidate)
-                    C_candidate = self.calculate_C(T3_candidate, m_candidate, R_candidate)
-                    if C_candidate < self.C:
-                        self.m = m_candidate
-                        self.R = R_candidate
-                        self.T3 = T3_candidate
-                        self.C = C_candidate
-
-    def optimize_model_with_gurobi(self) -> None:
-        with Env() as env, Model(name="CRESP Cost Model on Gurobi for Python", env=env) as model:
-            # SET MODEL PARAMETERS
-            model.setParam("NonConvex", 2)
-            # SET MODEL DECISION VARIABLE
-            m = model.addVar(name="m",
-                             vtype=GRB.INTEGER,
-                             lb=self.m_lower_bound,
-                             ub=self.m_upper_bound)
-            R = model.addVar(name="R",
-                             vtype=GRB.INTEGER,
-                             lb=self.R_lower_bound,
-                             ub=self.R_upper_bound)
-            z0 = model.addVar(name="z0",
-                              vtype=GRB.CONTINUOUS)  # z0 = α0
-            z1 = model.addVar(name="z1",
-                              vtype=GRB.CONTINUOUS)  # z1 = α1 / m -> z1 * m = α1
-            z2 = model.addVar(name="z2",
-                              vtype=GRB.CONTINUOUS)  # z2 = (α2 * R) / m -> z2 * m = α2 * R
-            z3 = model.addVar(name="z3",
-                              vtype=GRB.CONTINUOUS)  # z3 = (α3 * m) / R -> z3 * R = α3 * m
-            z4 = model.addVar(name="z4",
-                              vtype=GRB.CONTINUOUS)  # z4 = α4 / R -> z4 * R = α4
-            z5 = model.addVar(name="z5",
-                              vtype=GRB.CONTINUOUS)  # z5 = α5 * R
-            # SET TIME COST FUNCTION: T3(m,R) = α0 + α1/m + α2R/m + α3m/R + α4/R + α5R
-            T3 = z0 + \
-                 z1 + \
-                 z2 + \
-                 z3 + \
-                 z4 + \
-                 z5
-            if self.time_unit == "hour":
-                T3 = T3 / 3600
-            elif self.time_unit == "minute":
-                T3 = T3 / 60
-            # SET MODEL OBJECTIVE AND CONSTRAINTS
-            if self.optimization_problem == 1:
-                # MINIMIZE T3(m,R):
-                # SUBJECT TO:
-                # Upsilon * [T3(m,R)] * [(m+R) / Gamma] <= Phi
-                model.setObjective(T3, GRB.MINIMIZE)
-                model.addConstr(self.Upsilon * T3 * ((m + R) / self.Gamma) <= self.Phi, "c0")
-            elif self.optimization_problem == 2:
-                # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
-                # SUBJECT TO:
-                # T3(m,R) <= τ
-                model.setObjective(self.Upsilon * T3 * ((m + R) / self.Gamma), GRB.MINIMIZE)
-                model.addConstr(T3 <= self.Tau, "c0")
-            elif self.optimization_problem == 3:
-                # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
-                model.setObjective(self.Upsilon * T3 * ((m + R) / self.Gamma), GRB.MINIMIZE)
-            model.addConstr(self.alfaZero == z0, "c1")  # z0 = α0
-            model.addConstr(self.alfaOne == z1 * m, "c2")  # z1 = α1 / m -> z1 * m = α1
-            model.addConstr(self.alfaTwo * R == z2 * m, "c3")  # z2 = (α2 * R) / m -> z2 * m = α2 * R
-            model.addConstr(self.alfaThree * m == z3 * R, "c4")  # z3 = (α3 * m) / R -> z3 * R = α3 * m
-            model.addConstr(self.alfaFour == z4 * R, "c5")  # z4 = α4 / R -> z4 * R = α4
-            model.addConstr(self.alfaFive * R == z5, "c6")  # z5 = α5 * R
-            # OPTIMIZE MODEL
-            model.optimize()
-            # IF MODEL IS FEASIBLE (FOUND OPTIMAL VALUE, GRB.OPTIMAL):
-            if model.status == 2:
-                for v in model.getVars():
-                    if str(v.varName) == "m":
-                        self.m = ceil(v.x)
-                    if str(v.varName) == "R":
-                        self.R = ceil(v.x)
-                self.T3 = T3.getValue()
-                self.C = self.calculate_C(self.T3, self.m, self.R)
-            del env
-            del model
-
-    def calculate_optimal_number_of_vms(self) -> None:
-        self.Nu = ceil((self.m + self.R) / self.Gamma)
+            for m_candidate in range(parameters.m_lower_bound, parameters.m_upper_bound + 1):
+                for R_candidate in range(parameters.R_lower_bound, parameters.R_upper_bound + 1):
+                    T3_candidate = parameters.calculate_T3(m_candidate, R_candidate)
+                    C_candidate = parameters.calculate_C(T3_candidate, m_candidate, R_candidate)
+                    if C_candidate < C:
+                        m, R, T3, C = m_candidate, R_candidate, T3_candidate, C_candidate
+        return CrespOptimizer.get_model_result(parameters, m, R, T3, C)
+
+    def iterate_grid_tiles(self,
+                           parameters: CrespParameters):
+        # STREAM THE m×R GRID AS TILES OF AT MOST vectorized_block_size CELLS (ROW-MAJOR: LOWEST m, THEN LOWEST R,
+        # FIRST), EVALUATED INTO BUFFERS ALLOCATED ONCE AND REUSED BY EVERY TILE, SO THE PEAK MEMORY ONLY DEPENDS ON THE
+        # TILE SIZE, NOT ON THE BOUNDS. YIELDS (m COLUMN, R ROW, T3, C, OBJECTIVE BUFFER, MASK BUFFER) VIEWS, ONLY
+        # VALID UNTIL THE NEXT TILE
+        m_count = parameters.m_upper_bound - parameters.m_lower_bound + 1
+        R_count = parameters.R_upper_bound - parameters.R_lower_bound + 1
+        tile_columns = max(1, min(R_count, self.vectorized_block_size))
+        tile_rows = max(1, min(m_count, self.vectorized_block_size // tile_columns))
+        m_offsets = arange(tile_rows, dtype=float64)[:, newaxis]
+        R_offsets = arange(tile_columns, dtype=float64)
+        m_buffer = empty((tile_rows, 1), dtype=float64)
+        R_buffer = empty(tile_columns, dtype=float64)
+        T3_buffer = empty((tile_rows, tile_columns), dtype=float64)
+        C_buffer = empty((tile_rows, tile_columns), dtype=float64)
+        objective_buffer = empty((tile_rows, tile_columns), dtype=float64)
+        mask_buffer = empty((tile_rows, tile_columns), dtype=bool)
+        for m_tile_start in range(parameters.m_lower_bound, parameters.m_upper_bound + 1, tile_rows):
+            rows = min(tile_rows, parameters.m_upper_bound + 1 - m_tile_start)
+            m_tile = add(m_offsets[:rows], m_tile_start, out=m_buffer[:rows])
+            for R_tile_start in range(parameters.R_lower_bound, parameters.R_upper_bound + 1, tile_columns):
+                columns = min(tile_columns, parameters.R_upper_bound + 1 - R_tile_start)
+                R_tile = add(R_offsets[:columns], R_tile_start, out=R_buffer[:columns])
+                T3 = parameters.calculate_T3_into(m_tile, R_tile, T3_buffer[:rows, :columns],
+                                                  objective_buffer[:rows, :columns])
+                C = parameters.calculate_C_into(T3, m_tile, R_tile, C_buffer[:rows, :columns],
+                                                objective_buffer[:rows, :columns])
+                yield m_tile, R_tile, T3, C, objective_buffer[:rows, :columns], mask_buffer[:rows, :columns]
+
+    @staticmethod
+    def calculate_objective_into(parameters: CrespParameters,
+                                 T3: ndarray,
+                                 C: ndarray,
+                                 objective: ndarray,
+                                 mask: ndarray) -> ndarray:
+        # OBJECTIVE VALUE OF EVERY CELL OF A TILE, INFINITY WHERE THE CONSTRAINT IS VIOLATED
+        if parameters.optimization_problem == 1:
+            # MINIMIZE T3(m,R):
+            # SUBJECT TO:
+            # Upsilon * [T3(m,R)] * [(m+R) / Gamma] <= Phi
+            less_equal(C, parameters.Phi, out=mask)
+            copyto(objective, numpy_inf)
+            copyto(objective, T3, where=mask)
+        elif parameters.optimization_problem == 2:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            # SUBJECT TO:
+            # T3(m,R) <= τ
+            less_equal(T3, parameters.Tau, out=mask)
+            copyto(objective, numpy_inf)
+            copyto(objective, C, where=mask)
+        else:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            copyto(objective, C)
+        return objective
+
+    def solve_with_brute_force_vectorized(self,
+                                          parameters: CrespParameters) -> CrespResult:
+        # EVALUATE THE m×R GRID TILE BY TILE (BOUNDED MEMORY), KEEPING ONLY THE RUNNING ARGMIN
+        m, R, T3, C = 0, 0, inf, inf
+        best_objective = inf
+        for m_tile, R_tile, T3_tile, C_tile, objective_tile, mask_tile in self.iterate_grid_tiles(parameters):
+            objective_tile = self.calculate_objective_into(parameters, T3_tile, C_tile, objective_tile, mask_tile)
+            # argmin RETURNS THE FIRST (LOWEST m, THEN LOWEST R) OCCURRENCE OF THE TILE; ACROSS TILES, TIES GO TO THE
+            # LOWEST m, THEN THE LOWEST R, AS THE NESTED LOOP DOES
+            row_index, column_index = divmod(int(argmin(objective_tile)), objective_tile.shape[1])
+            objective = float(objective_tile[row_index, column_index])
+            m_candidate = int(m_tile[row_index, 0])
+            R_candidate = int(R_tile[column_index])
+            if objective < best_objective or \
+                    (objective == best_objective < inf and (m_candidate, R_candidate) < (m, R)):
+                m, R = m_candidate, R_candidate
+                T3 = float(T3_tile[row_index, column_index])
+                C = float(C_tile[row_index, column_index])
+                best_objective = objective
+        return self.get_model_result(parameters, m, R, T3, C)
+
+    @staticmethod
+    def estimate_polynomial_root(coefficients: tuple,
+                                 R_start: ndarray) -> ndarray:
+        # NEWTON'S METHOD ON c3R³ + c2R² + c1R + c0 (CONVEX FOR R > 0): STARTING OUTSIDE THE ROOTS, IT MOVES
+        # MONOTONICALLY TOWARDS THE NEAREST ONE (THE ESTIMATE ONLY SEEDS THE EXACT SEARCH, SO IT MAY BE ROUGH)
+        c3, c2, c1, c0 = coefficients
+        R_estimate = R_start
+        with errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for _ in range(8):
+                R_estimate = R_estimate - (((c3 * R_estimate + c2) * R_estimate + c1) * R_estimate + c0) \
+                    / ((3 * c3 * R_estimate + 2 * c2) * R_estimate + c1)
+        return R_estimate
+
+    def estimate_sublevel_set_boundaries(self,
+                                         coefficients: tuple,
+                                         R_lower: ndarray,
+                                         R_upper: ndarray) -> tuple:
+        # ROOTS OF THE POLYNOMIAL WHOSE SIGN MATCHES function(m,R) - bound, APPROACHED FROM EACH END OF THE BOUNDS
+        c3, c2, c1, c0 = coefficients
+        boundaries = []
+        for R_start in (R_lower.astype(float64), R_upper.astype(float64)):
+            is_start_inside = ((c3 * R_start + c2) * R_start + c1) * R_start + c0 <= 0
+            boundaries.append(where(is_start_inside, R_start, self.estimate_polynomial_root(coefficients, R_start)))
+        return boundaries[0], boundaries[1]
+
+    @staticmethod
+    def search_first_R_satisfying(predicate,
+                                  m_candidates: ndarray,
+                                  R_lower: ndarray,
+                                  R_upper: ndarray,
+                                  R_estimate: ndarray = None) -> ndarray:
+        # SMALLEST R IN [R_lower, R_upper] THAT SATISFIES THE PREDICATE (WHICH MUST BE MONOTONE, FALSE THEN TRUE,
+        # ALONG R), OR R_upper + 1 IF NO R SATISFIES IT
+        low = R_lower.copy()
+        high = R_upper + 1
+        if R_estimate is not None:
+            # ROWS WHOSE PREDICATE SWITCHES TO TRUE AT floor(R_estimate) OR AT THE NEXT R ARE SOLVED RIGHT AWAY
+            def is_satisfied(R):
+                return (R > R_upper) | predicate(m_candidates, minimum(R, R_upper))
+            R_guess = clip(nan_to_num(floor(R_estimate), nan=0.0), R_lower, R_upper + 1).astype(int64)
+            is_not_satisfied_before_guess = (R_guess <= R_lower) | ~is_satisfied(maximum(R_guess - 1, R_lower))
+            is_satisfied_at_guess = is_satisfied(R_guess)
+            is_solved_at_next = ~is_satisfied_at_guess & is_satisfied(R_guess + 1)
+            is_solved = (is_not_satisfied_before_guess & is_satisfied_at_guess) | is_solved_at_next
+            R_solution = where(is_solved_at_next, R_guess + 1, R_guess)
+            low = where(is_solved, R_solution, low)
+            high = where(is_solved, R_solution, high)
+        # BISECTION ON EVERY REMAINING ROW AT ONCE
+        while numpy_any(low < high):
+            active = low < high
+            middle = (low + high) // 2
+            satisfied = predicate(m_candidates, middle)
+            high = where(active & satisfied, middle, high)
+            low = where(active & ~satisfied, middle + 1, low)
+        return low
+
+    def search_first_R_minimizing(self,
+                                  function,
+                                  m_candidates: ndarray,
+                                  R_lower: ndarray,
+                                  R_upper: ndarray,
+                                  R_estimate: ndarray = None) -> ndarray:
+        # T3 AND C ARE CONVEX IN R FOR A FIXED m, SO THEIR FIRST MINIMIZER IS THE FIRST R WHERE
+        # function(R+1) >= function(R), WHICH LIES IN [floor(x), floor(x) + 1] FOR THE CONTINUOUS MINIMIZER x
+        def is_not_decreasing(m, R):
+            return (R >= R_upper) | (function(m, (R + 1).astype(float64)) >= function(m, R.astype(float64)))
+        if R_estimate is not None:
+            R_estimate = minimum(R_estimate, R_upper)
+        return self.search_first_R_satisfying(is_not_decreasing, m_candidates, R_lower, R_upper, R_estimate)
+
+    def search_R_interval_satisfying(self,
+                                     function,
+                                     bound: float,
+                                     m_candidates: ndarray,
+                                     R_lower: ndarray,
+                                     R_upper: ndarray,
+                                     R_minimizer_estimate: ndarray,
+                                     boundary_polynomial_coefficients: tuple) -> tuple:
+        # THE SUBLEVEL SET {R : function(m,R) <= bound} OF A CONVEX FUNCTION IS AN INTERVAL [R_first, R_last],
+        # FOUND ON EACH SIDE OF THE FUNCTION MINIMIZER (EMPTY INTERVAL IF R_first > R_last)
+        R_minimizer = self.search_first_R_minimizing(function, m_candidates, R_lower, R_upper, R_minimizer_estimate)
+        feasible = function(m_candidates, R_minimizer.astype(float64)) <= bound
+        R_first_estimate, R_last_estimate = self.estimate_sublevel_set_boundaries(boundary_polynomial_coefficients,
+                                                                                  R_lower,
+                                                                                  R_upper)
+        # ROWS WITHOUT ANY FEASIBLE R ARE NOT SEARCHED (THEIR BRACKETS ARE COLLAPSED ONTO THE MINIMIZER)
+        R_first = self.search_first_R_satisfying(lambda m, R: function(m, R.astype(float64)) <= bound,
+                                                 m_candidates,
+                                                 where(feasible, R_lower, R_minimizer),
+                                                 R_minimizer,
+                                                 R_first_estimate)
+        R_last = self.search_first_R_satisfying(lambda m, R: function(m, R.astype(float64)) > bound,
+                                                m_candidates,
+                                                R_minimizer,
+                                                where(feasible, R_upper, R_minimizer),
+                                                R_last_estimate) - 1
+        return where(feasible, R_first, R_upper + 1), where(feasible, R_last, R_upper)
+
+    def search_structured_optimum(self,
+                                  parameters: CrespParameters,
+                                  m_candidates: ndarray,
+                                  R_lower: ndarray,
+                                  R_upper: ndarray) -> tuple:
+        # BEST R OF EACH m ROW AND ITS OBJECTIVE VALUE (INFINITY WHERE THE ROW HAS NO FEASIBLE R)
+        # THE CLOSED FORMS OF THE CONTINUOUS PROBLEM SEED THE EXACT INTEGER SEARCH OF EACH ROW
+        a, b, c = parameters.calculate_T3_coefficients_in_R(m_candidates)
+        with errstate(divide="ignore", invalid="ignore"):
+            # d[T3(m,R)]/dR = 0  <=>  cR² - b = 0
+            T3_minimizer_estimate = sqrt(b / c)
+            # d[T3(m,R) * (m+R)]/dR = 0  <=>  2cR³ + (a + cm)R² - bm = 0 (STARTING ABOVE ITS POSITIVE ROOT)
+            C_minimizer_estimate = self.estimate_polynomial_root((2 * c, a + c * m_candidates, 0.0, -b * m_candidates),
+                                                                 minimum(cbrt((b * m_candidates) / (2 * c)),
+                                                                         sqrt((b * m_candidates) /
+                                                                              (a + c * m_candidates))))
+        if parameters.optimization_problem == 1:
+            # MINIMIZE T3(m,R):
+            # SUBJECT TO:
+            # Upsilon * [T3(m,R)] * [(m+R) / Gamma] <= Phi
+            objective_function = parameters.calculate_T3
+            objective_minimizer_estimate = T3_minimizer_estimate
+            # C(m,R) <= φ  <=>  kcR³ + k(a + cm)R² + (k(b + am) - φ)R + kbm <= 0, WITH k = υ/γ
+            k = parameters.Upsilon / parameters.Gamma
+            R_lower, R_upper = self.search_R_interval_satisfying(parameters.calculate_C_from_allocation,
+                                                                 parameters.Phi,
+                                                                 m_candidates,
+                                                                 R_lower,
+                                                                 R_upper,
+                                                                 C_minimizer_estimate,
+                                                                 (k * c,
+                                                                  k * (a + c * m_candidates),
+                                                                  k * (b + a * m_candidates) - parameters.Phi,
+                                                                  k * b * m_candidates))
+        elif parameters.optimization_problem == 2:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            # SUBJECT TO:
+            # T3(m,R) <= τ
+            objective_function = parameters.calculate_C_from_allocation
+            objective_minimizer_estimate = C_minimizer_estimate
+            # T3(m,R) <= τ  <=>  cR² + (a - τ)R + b <= 0
+            R_lower, R_upper = self.search_R_interval_satisfying(parameters.calculate_T3,
+                                                                 parameters.Tau,
+                                                                 m_candidates,
+                                                                 R_lower,
+                                                                 R_upper,
+                                                                 T3_minimizer_estimate,
+                                                                 (0.0, c, a - parameters.Tau, b))
+        else:
+            # MINIMIZE Upsilon * [T3(m,R)] * [(m+R) / Gamma]
+            objective_function = parameters.calculate_C_from_allocation
+            objective_minimizer_estimate = C_minimizer_estimate
+        R_candidates = self.search_first_R_minimizing(objective_function,
+                                                      m_candidates,
+                                                      R_lower,
+                                                      R_upper,
+                                                      clip(objective_minimizer_estimate, R_lower, R_upper))
+        objective_candidates = where(R_lower <= R_upper,
+                                     objective_function(m_candidates, R_candidates.astype(float64)),
+                                     numpy_inf)
+        return R_candidates, objective_candidates
+
+    def solve_with_structured(self,
+                              parameters: CrespParameters) -> CrespResult:
+        # EXACT O(m log R) SEARCH: ONE BISECTION PER m ROW, ALL ROWS EVALUATED TOGETHER AS NUMPY ARRAYS
+        m_candidates = arange(parameters.m_lower_bound, parameters.m_upper_bound + 1, dtype=float64)
+        R_candidates, objective_candidates = \
+            self.search_structured_optimum(parameters,
+                                           m_candidates,
+                                           full(len(m_candidates), parameters.R_lower_bound, dtype=int64),
+                                           full(len(m_candidates), parameters.R_upper_bound, dtype=int64))
+        # argmin RETURNS THE LOWEST m AMONG THE BEST ROWS, AS THE NESTED LOOP DOES
+        row_index = int(argmin(objective_candidates))
+        if objective_candidates[row_index] == numpy_inf:
+            return CrespResult()
+        m = int(m_candidates[row_index])
+        R = int(R_candidates[row_index])
+        T3 = float(parameters.calculate_T3(float(m), float(R)))
+        C = float(parameters.calculate_C(T3, float(m), float(R)))
+        return self.get_model_result(parameters, m, R, T3, C)
+
+    @staticmethod
+    def get_rectangle_lower_bound(parameters: CrespParameters,
+                                  m_lower: int,
+                                  R_lower: int,
+                                  m_upper: int,
+                                  R_upper: int) -> float:
+        # LOWER BOUND OF THE OBJECTIVE OVER THE RECTANGLE, OR INFINITY IF NONE OF ITS CELLS MEETS THE φ (OR τ) CONSTRAINT
+        T3_lower_bound = parameters.calculate_T3_lower_bound(m_lower, m_upper, R_lower, R_upper)
+        C_lower_bound = parameters.calculate_C(T3_lower_bound, m_lower, R_lower)
+        if parameters.optimization_problem != 3 and \
+                not parameters.is_constraint_not_violated(C_lower_bound, T3_lower_bound):
+            return inf
+        return T3_lower_bound if parameters.optimization_problem == 1 else C_lower_bound
+
+    def search_branch_and_bound(self,
+                                parameters: CrespParameters,
+                                incumbent: CrespResult = CrespResult(),
+                                deadline: float = inf) -> tuple:
+        # BEST-FIRST SEARCH OVER RECTANGLES OF THE (m, R) BOUNDS: A RECTANGLE IS DROPPED IF ITS LOWER BOUNDS PROVE THAT
+        # NONE OF ITS CELLS MEETS THE φ (OR τ) CONSTRAINT OR BEATS THE INCUMBENT; RECTANGLES UP TO
+        # branch_and_bound_leaf_size CELLS ARE EVALUATED BY THE VECTORIZED BRUTE FORCE, LARGER ONES ARE HALVED.
+        # THE HEAP IS ORDERED BY (LOWER BOUND, m_lower, R_lower), SO TIES ARE BROKEN AS THE NESTED LOOP DOES.
+        # RETURNS THE BEST RESULT, THE NUMBER OF EVALUATED CELLS AND A LOWER BOUND ON THE OPTIMAL OBJECTIVE, WHICH IS
+        # THE RESULT'S OWN OBJECTIVE (OR INFINITY, IF INFEASIBLE) UNLESS THE deadline (A time() VALUE) STOPPED IT
+        result = incumbent
+        best_key = (inf, 0, 0)
+        if incumbent.is_feasible():
+            best_key = (incumbent.T3 if parameters.optimization_problem == 1 else incumbent.C, incumbent.m, incumbent.R)
+        evaluated_cells = 0
+        rectangles = []
+        root_lower_bound = self.get_rectangle_lower_bound(parameters,
+                                                          parameters.m_lower_bound, parameters.R_lower_bound,
+                                                          parameters.m_upper_bound, parameters.R_upper_bound)
+        if root_lower_bound < inf:
+            rectangles.append((root_lower_bound, parameters.m_lower_bound, parameters.R_lower_bound,
+                               parameters.m_upper_bound, parameters.R_upper_bound))
+        while rectangles:
+            if time() >= deadline:
+                return result, evaluated_cells, rectangles[0][0]
+            lower_bound, m_lower, R_lower, m_upper, R_upper = heappop(rectangles)
+            if (lower_bound, m_lower, R_lower) > best_key:
+                break
+            rows_count, columns_count = m_upper - m_lower + 1, R_upper - R_lower + 1
+            if rows_count * columns_count <= self.branch_and_bound_leaf_size:
+                evaluated_cells += rows_count * columns_count
+                rectangle_result = self.solve_with_brute_force_vectorized(parameters.replace(m_lower_bound=m_lower,
+                                                                                             m_upper_bound=m_upper,
+                                                                                             R_lower_bound=R_lower,
+                                                                                             R_upper_bound=R_upper))
+                if rectangle_result.is_feasible():
+                    rectangle_key = (rectangle_result.T3 if parameters.optimization_problem == 1
+                                     else rectangle_result.C, rectangle_result.m, rectangle_result.R)
+                    if rectangle_key < best_key:
+                        result, best_key = rectangle_result, rectangle_key
+                continue
+            if rows_count >= columns_count:
+                m_middle = (m_lower + m_upper) // 2
+                halves = ((m_lower, R_lower, m_middle, R_upper), (m_middle + 1, R_lower, m_upper, R_upper))
+            else:
+                R_middle = (R_lower + R_upper) // 2
+                halves = ((m_lower, R_lower, m_upper, R_middle), (m_lower, R_middle + 1, m_upper, R_upper))
+            for half_m_lower, half_R_lower, half_m_upper, half_R_upper in halves:
+                half_lower_bound = self.get_rectangle_lower_bound(parameters,
+                                                                  half_m_lower, half_R_lower,
+                                                                  half_m_upper, half_R_upper)
+                if half_lower_bound < inf and (half_lower_bound, half_m_lower, half_R_lower) <= best_key:
+                    heappush(rectangles, (half_lower_bound, half_m_lower, half_R_lower, half_m_upper, half_R_upper))
+        return result, evaluated_cells, best_key[0]
+
+    def solve_with_branch_and_bound(self,
+                                    parameters: CrespParameters) -> CrespResult:
+        result, evaluated_cells, _ = self.search_branch_and_bound(parameters)
+        with self.search_statistics_lock:
+            self.branch_and_bound_statistics["evaluated_cells"] += evaluated_cells
+            self.branch_and_bound_statistics["brute_force_cells"] += \
+                (parameters.m_upper_bound - parameters.m_lower_bound + 1) * \
+                (parameters.R_upper_bound - parameters.R_lower_bound + 1)
+        return result
+
+    def search_relaxed_neighbourhood(self,
+                                     parameters: CrespParameters,
+                                     radius: int) -> CrespResult:
+        # BEST ALLOCATION WITHIN radius CELLS OF THE FLOOR / CEILING OF THE CONTINUOUS RELAXATION'S OPTIMUM (A CONSTANT
+        # AMOUNT OF WORK, WHATEVER THE m AND R BOUNDS); INFEASIBLE IF THE RELAXATION IS, OR IF NO NEIGHBOUR IS FEASIBLE
+        relaxed_allocation = import_module("cresp_scipy_backend").solve_continuous_relaxation(parameters)
+        if relaxed_allocation is None:
+            return CrespResult()
+        m_relaxed, R_relaxed = relaxed_allocation
+        return self.solve_with_brute_force_vectorized(
+            parameters.replace(m_lower_bound=max(int(floor(m_relaxed)) - radius, parameters.m_lower_bound),
+                               m_upper_bound=min(ceil(m_relaxed) + radius, parameters.m_upper_bound),
+                               R_lower_bound=max(int(floor(R_relaxed)) - radius, parameters.R_lower_bound),
+                               R_upper_bound=min(ceil(R_relaxed) + radius, parameters.R_upper_bound)))
+
+    def solve_with_approximate(self,
+                               parameters: CrespParameters) -> CrespResult:
+        return self.search_relaxed_neighbourhood(parameters, self.approximate_neighbourhood_radius)
+
+    def solve_anytime(self,
+                      parameters: CrespParameters,
+                      deadline_in_seconds: float) -> CrespAnytimeResult:
+        # START FROM THE RELAXED INCUMBENT AND IMPROVE IT WITH THE BRANCH AND BOUND UNTIL IT IS PROVEN OPTIMAL OR THE
+        # WALL-CLOCK DEADLINE EXPIRES, WHICHEVER COMES FIRST
+        deadline = time() + deadline_in_seconds
+        result, _, lower_bound = self.search_branch_and_bound(parameters,
+                                                              self.search_relaxed_neighbourhood(parameters, 0),
+                                                              deadline)
+        objective = result.T3 if parameters.optimization_problem == 1 else result.C
+        if objective == lower_bound:
+            optimality_gap = 0.0
+        elif result.is_feasible():
+            optimality_gap = (objective - lower_bound) / objective
+        else:
+            optimality_gap = inf
+        return CrespAnytimeResult(result, lower_bound, optimality_gap)
+
+    def solve_with_anytime(self,
+                           parameters: CrespParameters) -> CrespResult:
+        anytime_result = self.solve_anytime(parameters, self.anytime_deadline_in_seconds)
+        with self.search_statistics_lock:
+            self.anytime_statistics["solves"] += 1
+            if anytime_result.is_optimal():
+                self.anytime_statistics["optimal_solves"] += 1
+            self.anytime_statistics["worst_optimality_gap"] = max(self.anytime_statistics["worst_optimality_gap"],
+                                                                  anytime_result.optimality_gap)
+        return anytime_result.result
+
+    def calculate_diagonal_minima(self,
+                                  parameters: CrespParameters) -> tuple:
+        # ALONG EACH ANTI-DIAGONAL m+R = s, T3 (AND SO C, WHICH IS υ/γ * T3 * s THERE) IS CONVEX IN m (EVERY TERM IS),
+        # SO ITS LOWEST m MINIMIZER IS FOUND BY BISECTION ON THE SIGN OF T3(m+1, s-m-1) - T3(m, s-m)
+        s = arange(parameters.m_lower_bound + parameters.R_lower_bound,
+                   parameters.m_upper_bound + parameters.R_upper_bound + 1,
+                   dtype=int64)
+        m_lower = maximum(parameters.m_lower_bound, s - parameters.R_upper_bound)
+        m_upper = minimum(parameters.m_upper_bound, s - parameters.R_lower_bound)
+
+        def is_not_decreasing(s_candidates, m):
+            with errstate(divide="ignore", invalid="ignore"):
+                return (m >= m_upper) | \
+                    (parameters.calculate_T3(m + 1.0, (s_candidates - m - 1).astype(float64)) >=
+                     parameters.calculate_T3(m.astype(float64), (s_candidates - m).astype(float64)))
+        m_diagonal = self.search_first_R_satisfying(is_not_decreasing, s, m_lower, m_upper)
+        T3_diagonal = parameters.calculate_T3(m_diagonal.astype(float64), (s - m_diagonal).astype(float64))
+        return s, m_diagonal, T3_diagonal
+
+    def get_node_count_options(self,
+                               parameters: CrespParameters,
+                               objective: str) -> tuple:
+        # FOR EVERY NODE COUNT ν, THE ALLOCATION WITH THE LOWEST T3 (objective = "time") OR C (objective = "cost")
+        # AMONG THOSE THAT FIT INTO THE νγ SLOTS (m+R <= νγ), AS (ν, m, R, T3, C) ARRAYS OF INCREASING ν
+        s, m_diagonal, T3_diagonal = self.calculate_diagonal_minima(parameters)
+        if objective == "time":
+            objective_diagonal = T3_diagonal
+        else:
+            objective_diagonal = parameters.calculate_C(T3_diagonal, m_diagonal, s - m_diagonal)
+        # PREFIX MINIMUM: BEST DIAGONAL (LOWEST s AMONG TIES) WITH AT MOST s SLOTS
+        is_new_minimum = objective_diagonal < concatenate(([numpy_inf], minimum.accumulate(objective_diagonal)[:-1]))
+        best_diagonal = maximum.accumulate(where(is_new_minimum, arange(len(s)), 0))
+        Nu = arange(-(-int(s[0]) // parameters.Gamma), -(-int(s[-1]) // parameters.Gamma) + 1, dtype=int64)
+        Nu_diagonal = best_diagonal[minimum(Nu * parameters.Gamma - s[0], len(s) - 1)]
+        m = m_diagonal[Nu_diagonal]
+        R = s[Nu_diagonal] - m
+        T3 = T3_diagonal[Nu_diagonal]
+        return Nu, m, R, T3, parameters.calculate_C(T3, m, R)
+
+    def solve_with_node_count(self,
+                              parameters: CrespParameters) -> CrespResult:
+        # NODES ARE BILLED WHOLE: C(m,R) = υ * T3(m,R) * ν, WITH ν = ceil((m+R) / γ). FOR ν NODES, THE BEST ALLOCATION
+        # IS THE ONE WITH THE LOWEST T3 AMONG THOSE THAT FIT INTO THE νγ SLOTS, FOR EVERY OPTIMIZATION PROBLEM, SO ONLY
+        # THE ANTI-DIAGONAL MINIMA ARE EVALUATED. THE RESULT'S C IS THE BILLED COST (TIES GO TO FEWER SLOTS, THEN TO
+        # FEWER NODES)
+        Nu, m, R, T3_candidates, _ = self.get_node_count_options(parameters, "time")
+        C_candidates = parameters.Upsilon * T3_candidates * Nu
+        if parameters.optimization_problem == 1:
+            objective_candidates = where(C_candidates <= parameters.Phi, T3_candidates, numpy_inf)
+        elif parameters.optimization_problem == 2:
+            objective_candidates = where(T3_candidates <= parameters.Tau, C_candidates, numpy_inf)
+        else:
+            objective_candidates = C_candidates
+        Nu_index = int(argmin(objective_candidates))
+        if objective_candidates[Nu_index] == numpy_inf:
+            return CrespResult()
+        return CrespResult(int(m[Nu_index]),
+                           int(R[Nu_index]),
+                           float(T3_candidates[Nu_index]),
+                           float(C_candidates[Nu_index]),
+                           int(Nu[Nu_index]))
+
+    def calculate_pareto_frontier(self,
+                                  parameters: CrespParameters) -> CrespParetoFrontier:
+        # ONE PASS OVER THE m×R GRID, TILE BY TILE (BOUNDED MEMORY), MERGING EACH TILE INTO THE RUNNING FRONTIER AND ITS
+        # TIES (WHICH HOLD THE FRONTIER ALLOCATIONS THEMSELVES)
+        ties = (zeros(0, dtype=int64), zeros(0, dtype=int64), zeros(0, dtype=float64), zeros(0, dtype=float64))
+        frontier = ties
+        for m_tile, R_tile, T3_tile, C_tile, _, _ in self.iterate_grid_tiles(parameters):
+            candidates = (concatenate((ties[0], broadcast_to(m_tile, T3_tile.shape).astype(int64).ravel())),
+                          concatenate((ties[1], broadcast_to(R_tile, T3_tile.shape).astype(int64).ravel())),
+                          concatenate((ties[2], T3_tile.ravel())),
+                          concatenate((ties[3], C_tile.ravel())))
+            frontier = CrespParetoFrontier.get_non_dominated_frontier(*candidates)
+            ties = CrespParetoFrontier.get_frontier_ties(*candidates, frontier[2], frontier[3])
+        return CrespParetoFrontier(*frontier, parameters.Gamma, ties)
+
+    def get_pareto_frontier(self,
+                            parameters: CrespParameters) -> CrespParetoFrontier:
+        # THE FRONTIER IS SHARED BY EVERY φ, τ AND OPTIMIZATION PROBLEM, SO ITS KEY IGNORES THEM
+        key = parameters.replace(Phi=0.0, Tau=0.0, optimization_problem=0).get_canonical_key("pareto")
+        with self.pareto_frontiers_lock:
+            pareto_frontier = self.pareto_frontiers.get(key)
+            if pareto_frontier is not None:
+                self.pareto_frontiers.move_to_end(key)
+                return pareto_frontier
+        pareto_frontier = self.calculate_pareto_frontier(parameters)
+        with self.pareto_frontiers_lock:
+            self.pareto_frontiers[key] = pareto_frontier
+            while len(self.pareto_frontiers) > self.pareto_frontiers_size:
+                self.pareto_frontiers.popitem(last=False)
+        return pareto_frontier
+
+    def solve_with_pareto(self,
+                          parameters: CrespParameters) -> CrespResult:
+        return self.get_pareto_frontier(parameters).get_optimum(parameters)
+
+    def solve_scenarios_block(self,
+                              batch_parameters: CrespParameters) -> tuple:
+        # (m, R, ν, T3, C, FEASIBLE) OF A BLOCK OF SCENARIOS, WHOSE INPUT PARAMETERS ARE (SCENARIOS × 1) COLUMNS,
+        # BROADCAST AGAINST THE m CANDIDATES ROW
+        m_candidates = arange(self.m_lower_bound, self.m_upper_bound + 1, dtype=float64)[newaxis, :]
+        block_shape = (len(batch_parameters.alfaZero), m_candidates.shape[1])
+        R_candidates, objective_candidates = \
+            self.search_structured_optimum(batch_parameters,
+                                           m_candidates,
+                                           full(block_shape, self.R_lower_bound, dtype=int64),
+                                           full(block_shape, self.R_upper_bound, dtype=int64))
+        # argmin RETURNS THE LOWEST m AMONG THE BEST ROWS OF EACH SCENARIO, AS THE NESTED LOOP DOES
+        row_index = argmin(objective_candidates, axis=1)[:, newaxis]
+        feasible = take_along_axis(objective_candidates, row_index, axis=1) < numpy_inf
+        m = m_candidates[0][row_index]
+        R = take_along_axis(R_candidates, row_index, axis=1).astype(float64)
+        T3 = batch_parameters.calculate_T3(m, R)
+        C = batch_parameters.calculate_C(T3, m, R)
+        return (where(feasible, m, 0)[:, 0],
+                where(feasible, R, 0)[:, 0],
+                where(feasible, numpy_ceil((m + R) / batch_parameters.Gamma), 0)[:, 0],
+                where(feasible, T3, numpy_inf)[:, 0],
+                where(feasible, C, numpy_inf)[:, 0],
+                feasible[:, 0])
+
+    def optimize_scenarios_batch(self,
+                                 M: ndarray,
+                                 Gamma: ndarray,
+                                 Upsilon: ndarray,
+                                 Phi: ndarray,
+                                 Tau: ndarray) -> dict:
+        # SOLVE MANY (M, γ, υ, φ, τ) SCENARIOS WITH THE SAME β PARAMETERS, BOUNDS, UNITS AND OPTIMIZATION PROBLEM:
+        # EVERY SCENARIO IS A ROW OF THE α CONSTANTS ARRAYS, SOLVED TOGETHER BY THE STRUCTURED SEARCH
+        scenarios_count = len(M)
+        block_scenarios = max(1, self.vectorized_block_size // (self.m_upper_bound - self.m_lower_bound + 1))
+        results = {"m": zeros(scenarios_count, dtype=int64),
+                   "R": zeros(scenarios_count, dtype=int64),
+                   "Nu": zeros(scenarios_count, dtype=int64),
+                   "T3": full(scenarios_count, numpy_inf),
+                   "C": full(scenarios_count, numpy_inf),
+                   "feasible": zeros(scenarios_count, dtype=bool)}
+        for block_start in range(0, scenarios_count, block_scenarios):
+            block = slice(block_start, min(block_start + block_scenarios, scenarios_count))
+            batch_parameters = self.get_scenario_parameters(asarray(M[block], dtype=int64)[:, newaxis],
+                                                            asarray(Gamma[block], dtype=int64)[:, newaxis],
+                                                            asarray(Upsilon[block], dtype=float64)[:, newaxis],
+                                                            asarray(Phi[block], dtype=float64)[:, newaxis],
+                                                            asarray(Tau[block], dtype=float64)[:, newaxis])
+            (results["m"][block],
+             results["R"][block],
+             results["Nu"][block],
+             results["T3"][block],
+             results["C"][block],
+             results["feasible"][block]) = self.solve_scenarios_block(batch_parameters)
+        return results
+
+    def get_perturbed_parameters(self,
+                                 perturbed_values: dict) -> CrespParameters:
+        # MODEL PARAMETERS WITH SOME ATTRIBUTES (β PARAMETERS, υ, φ OR τ, IN THE MODEL'S TIME UNIT) REPLACED BY
+        # (SCENARIOS × 1) COLUMNS, ONE PERTURBED SCENARIO PER ROW
+        perturbed_optimizer = copy(self)
+        for attribute, values in perturbed_values.items():
+            setattr(perturbed_optimizer, attribute, asarray(values, dtype=float64)[:, newaxis])
+        perturbed_optimizer.calculate_alfa_constants()
+        return perturbed_optimizer.get_model_parameters()
+
+    def analyze_sensitivity(self) -> OrderedDict:
+        # EVERY NON-ZERO PARAMETER IS SCALED BY EVERY SENSITIVITY FACTOR (THE OTHERS KEPT AT THEIR VALUES), AND ALL THE
+        # PERTURBED SCENARIOS ARE SOLVED TOGETHER BY THE STRUCTURED SEARCH. FOR EACH PARAMETER, RETURNS ITS VALUE, THE
+        # LOWEST AND HIGHEST FACTORS OF THE CONTIGUOUS RUN AROUND 1 WHERE THE OPTIMAL (m, R) DOES NOT CHANGE, AND THE
+        # MARGINAL CHANGES OF THE OPTIMAL T3 AND C (FINITE DIFFERENCES OVER THE FACTORS NEXT TO 1)
+        factors = asarray(self.sensitivity_factors, dtype=float64)
+        base_index = int(searchsorted(factors, 1.0))
+        parameters_names = [name for name, attribute in self.sensitivity_parameters.items()
+                            if getattr(self, attribute) != 0.0]
+        scenarios_count = len(parameters_names) * len(factors)
+        perturbed_values = {attribute: full(scenarios_count, getattr(self, attribute), dtype=float64)
+                            for attribute in self.sensitivity_parameters.values()}
+        for parameter_index, name in enumerate(parameters_names):
+            attribute = self.sensitivity_parameters[name]
+            segment = slice(parameter_index * len(factors), (parameter_index + 1) * len(factors))
+            perturbed_values[attribute][segment] = getattr(self, attribute) * factors
+        block_scenarios = max(1, self.vectorized_block_size // (self.m_upper_bound - self.m_lower_bound + 1))
+        m, R, T3, C = (zeros(scenarios_count, dtype=int64), zeros(scenarios_count, dtype=int64),
+                       full(scenarios_count, numpy_inf), full(scenarios_count, numpy_inf))
+        for block_start in range(0, scenarios_count, block_scenarios):
+            block = slice(block_start, min(block_start + block_scenarios, scenarios_count))
+            batch_parameters = self.get_perturbed_parameters({attribute: values[block]
+                                                              for attribute, values in perturbed_values.items()})
+            m[block], R[block], _, T3[block], C[block], _ = self.solve_scenarios_block(batch_parameters)
+        sensitivity = OrderedDict()
+        for parameter_index, name in enumerate(parameters_names):
+            segment = slice(parameter_index * len(factors), (parameter_index + 1) * len(factors))
+            allocations = list(zip(m[segment], R[segment]))
+            lower_index = base_index
+            while lower_index > 0 and allocations[lower_index - 1] == allocations[base_index]:
+                lower_index -= 1
+            upper_index = base_index
+            while upper_index < len(factors) - 1 and allocations[upper_index + 1] == allocations[base_index]:
+                upper_index += 1
+            value = getattr(self, self.sensitivity_parameters[name])
+            previous_index, next_index = max(base_index - 1, 0), min(base_index + 1, len(factors) - 1)
+            marginals = []
+            for objective in (T3[segment], C[segment]):
+                with errstate(invalid="ignore"):
+                    marginals.append(float((objective[next_index] - objective[previous_index]) /
+                                           (value * (factors[next_index] - factors[previous_index])))
+                                     if next_index > previous_index else float("nan"))
+            sensitivity[name] = (value, float(factors[lower_index]), float(factors[upper_index]), *marginals)
+        return sensitivity
+
+    def print_sensitivity_analysis(self) -> None:
+        print("Sensitivity analysis ({0} factors from {1} to {2}; υ and τ in {3}s):"
+              .format(len(self.sensitivity_factors),
+                      self.sensitivity_factors[0],
+                      self.sensitivity_factors[-1],
+                      self.time_unit))
+        for name, (value, lower_factor, upper_factor, T3_marginal, C_marginal) in self.analyze_sensitivity().items():
+            print("{0} = {1}: optimal (m, R) unchanged for {2} ≤ {0} ≤ {3} (×{4} to ×{5}), "
+                  "∂T3/∂{0} = {6} {7}(s), ∂C/∂{0} = {8} {9}"
+                  .format(name,
+                          value,
+                          value * lower_factor,
+                          value * upper_factor,
+                          lower_factor,
+                          upper_factor,
+                          T3_marginal,
+                          self.time_unit,
+                          C_marginal,
+                          self.monetary_unit))
 
     def print_optimization_results(self,
                                    optimization_mode: str,
@@ -454,19 +1808,229 @@ class CrespOptimizer:
         else:
             print("MODEL IS INFEASIBLE!")
 
+    def get_backend_session(self,
+                            session_name: str,
+                            session_class: type):
+        # LONG-LIVED STATE OF A SOLVER BACKEND (E.G., A SOLVER ENVIRONMENT), CREATED ON FIRST USE AND KEPT UNTIL
+        # close_backend_sessions
+        with self.backend_sessions_lock:
+            if session_name not in self.backend_sessions:
+                self.backend_sessions[session_name] = session_class()
+            return self.backend_sessions[session_name]
+
+    def close_backend_sessions(self) -> None:
+        with self.backend_sessions_lock:
+            for backend_session in self.backend_sessions.values():
+                backend_session.close()
+            self.backend_sessions = {}
+
+    def get_solver_function(self,
+                            mode: str):
+        if mode not in optimization_modes_registry:
+            raise ValueError("Unsupported optimization mode: '{0}'!".format(mode))
+        backend_module_name, solver_function_name = optimization_modes_registry[mode][:2]
+        if backend_module_name is None:
+            return getattr(self, solver_function_name)
+        return partial(getattr(import_module(backend_module_name), solver_function_name), self)
+
+    def solve_with_optimization_mode(self,
+                                     parameters: CrespParameters,
+                                     mode: str) -> CrespResult:
+        return self.get_solver_function(mode)(parameters)
+
+    def solve_with_result_cache(self,
+                                parameters: CrespParameters,
+                                mode: str,
+                                solve_function) -> CrespResult:
+        if self.result_cache is None or not optimization_modes_registry[mode][3]:
+            return solve_function(parameters, mode)
+        key = parameters.get_canonical_key(mode)
+        result = self.result_cache.get(key)
+        if result is None:
+            result = solve_function(parameters, mode)
+            self.result_cache.put(key, result)
+        return result
+
+    def solve(self,
+              parameters: CrespParameters,
+              mode: str) -> CrespResult:
+        # STATELESS: NEITHER READS NOR WRITES THE OPTIMIZER'S MODEL ATTRIBUTES, SO ONE OPTIMIZER CAN SERVE MANY THREADS
+        # (THE RESULT CACHE, IF ANY, IS SHARED UNDER ITS OWN LOCK)
+        return self.solve_with_result_cache(parameters, mode, self.solve_with_optimization_mode)
+
+    def solve_in_parallel(self,
+                          parameters: CrespParameters,
+                          mode: str) -> CrespResult:
+        # SPLIT THE m BOUNDS INTO CONSECUTIVE RANGES (SEVERAL PER WORKER, FOR LOAD BALANCING) AND SOLVE THEM ON A
+        # PROCESS POOL; MERGING THE PARTIAL OPTIMA IN ASCENDING m ORDER WITH A STRICT COMPARISON KEEPS THE LOWEST m
+        # AMONG TIES, AS THE NESTED LOOP DOES
+        m_count = parameters.m_upper_bound - parameters.m_lower_bound + 1
+        ranges_count = min(m_count, 4 * self.workers)
+        m_range_bounds = [parameters.m_lower_bound + (i * m_count) // ranges_count for i in range(ranges_count + 1)]
+        result = CrespResult()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            partial_results = executor.map(self.solve_with_optimization_mode,
+                                           [parameters.replace(m_lower_bound=m_range_bounds[i],
+                                                               m_upper_bound=m_range_bounds[i + 1] - 1)
+                                            for i in range(ranges_count)],
+                                           [mode] * ranges_count)
+            for partial_result in partial_results:
+                if not partial_result.is_feasible():
+                    continue
+                if parameters.optimization_problem == 1:
+                    is_better = partial_result.T3 < result.T3
+                else:
+                    is_better = partial_result.C < result.C
+                if is_better:
+                    result = partial_result
+        return result
+
+    def optimize_scenarios_batch_in_parallel(self,
+                                             M: ndarray,
+                                             Gamma: ndarray,
+                                             Upsilon: ndarray,
+                                             Phi: ndarray,
+                                             Tau: ndarray) -> dict:
+        # SPLIT THE SCENARIOS INTO CHUNKS (SEVERAL PER WORKER, FOR LOAD BALANCING) SOLVED ON A PROCESS POOL
+        scenarios_count = len(M)
+        chunks_count = max(1, min(scenarios_count, 4 * self.workers))
+        chunk_bounds = [(i * scenarios_count) // chunks_count for i in range(chunks_count + 1)]
+        chunks = [slice(chunk_bounds[i], chunk_bounds[i + 1]) for i in range(chunks_count)]
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            partial_results = list(executor.map(self.optimize_scenarios_batch,
+                                                [M[chunk] for chunk in chunks],
+                                                [Gamma[chunk] for chunk in chunks],
+                                                [Upsilon[chunk] for chunk in chunks],
+                                                [Phi[chunk] for chunk in chunks],
+                                                [Tau[chunk] for chunk in chunks]))
+        return {column: concatenate([partial_result[column] for partial_result in partial_results])
+                for column in partial_results[0]}
+
+    def solve_with_workers(self,
+                           parameters: CrespParameters,
+                           mode: str) -> CrespResult:
+        if self.workers > 1 and optimization_modes_registry[mode][2]:
+            return self.solve_with_result_cache(parameters, mode, self.solve_in_parallel)
+        return self.solve(parameters, mode)
+
+    def optimize_model_with_optimization_mode(self,
+                                              mode: str) -> None:
+        self.set_model_results(self.solve_with_workers(self.get_model_parameters(), mode))
+
+    def solve_with_instance_catalogue(self,
+                                      parameters: CrespParameters,
+                                      mode: str) -> tuple:
+        # C(m,R) = (υ / γ) * T3(m,R) * (m+R) AND T3(m,R) DOES NOT DEPEND ON γ OR υ, SO FOR EVERY OPTIMIZATION PROBLEM
+        # THE OPTIMUM ONLY DEPENDS ON THE INSTANCE TYPE THROUGH ITS PRICE PER SLOT υ / γ, AND NEVER GETS BETTER AS IT
+        # INCREASES (THE φ BUDGET ONLY GETS TIGHTER). ONLY THE TYPES WITH THE LOWEST PRICE PER SLOT ARE SOLVED, THE
+        # OTHERS ARE PRUNED, UNLESS THE MODE'S COST IS NOT PRICE PER SLOT SEPARABLE (E.G., node_count BILLS WHOLE
+        # NODES, υ * T3(m,R) * ceil((m+R) / γ), SO IT DEPENDS ON γ THROUGH THE ROUNDING): EVERY TYPE IS THEN SOLVED.
+        # TIES ARE BROKEN BY THE CATALOGUE ORDER. RETURNS THE BEST INSTANCE TYPE NAME (OR None) AND ITS RESULT
+        instance_types = [(name, Gamma, self.get_upsilon_in_time_unit(Upsilon))
+                          for name, Gamma, Upsilon in self.instance_catalogue]
+        lowest_price_per_slot = min(Upsilon / Gamma for _, Gamma, Upsilon in instance_types)
+        is_price_per_slot_separable = optimization_modes_registry[mode][4]
+        best_name, best_result = None, CrespResult()
+        for name, Gamma, Upsilon in instance_types:
+            if is_price_per_slot_separable and Upsilon / Gamma > lowest_price_per_slot:
+                continue
+            result = self.solve_with_workers(parameters.replace(Gamma=Gamma, Upsilon=Upsilon), mode)
+            if not result.is_feasible():
+                continue
+            if not best_result.is_feasible() or \
+                    ((result.T3 < best_result.T3) if parameters.optimization_problem == 1
+                     else (result.C < best_result.C)):
+                best_name, best_result = name, result
+        return best_name, best_result
+
+    def optimize_model_with_instance_catalogue(self) -> None:
+        print("CRESP's Optimization Problem \"{0}\" over {1} instance types:".format(self.optimization_problem,
+                                                                                   len(self.instance_catalogue)))
+        for mode in self.optimization_modes:
+            self.reset_model_results()
+            optimization_start_time = time()
+            name, result = self.solve_with_instance_catalogue(self.get_model_parameters(), mode)
+            self.set_model_results(result)
+            optimization_end_time = time() - optimization_start_time
+            self.print_optimization_results(mode, optimization_end_time)
+            if name is not None:
+                Gamma, Upsilon = next((Gamma, Upsilon) for type_name, Gamma, Upsilon in self.instance_catalogue
+                                      if type_name == name)
+                print("Instance Type: {0} (γ = {1} slots per node, υ = {2} {3} per hour)"
+                      .format(name, Gamma, Upsilon, self.monetary_unit))
+
+    def print_approximation_error(self) -> None:
+        # COMPARE THE APPROXIMATE RESULT (ALREADY SET ON THE MODEL) WITH THE REFERENCE MODE'S ONE
+        reference_result = self.solve(self.get_model_parameters(), self.approximate_reference_mode)
+        if self.optimization_problem == 1:
+            approximate_objective, reference_objective = self.T3, reference_result.T3
+        else:
+            approximate_objective, reference_objective = self.C, reference_result.C
+        if not reference_result.is_feasible():
+            relative_error = 0.0 if approximate_objective == reference_objective else inf
+        else:
+            relative_error = (approximate_objective - reference_objective) / reference_objective
+        print("Approximate vs {0}: m = {1} vs {2}, R = {3} vs {4}, relative objective error = {5}"
+              .format(self.approximate_reference_mode,
+                      self.m,
+                      reference_result.m,
+                      self.R,
+                      reference_result.R,
+                      relative_error))
+
     def optimize_model_with_available_optimization_modes(self) -> None:
         print("CRESP's Optimization Problem \"{0}\" - {1}:".format(self.optimization_problem,
                                                                    self.optimization_problem_description))
         for mode in self.optimization_modes:
             self.reset_model_results()
             optimization_start_time = time()
-            if mode == "brute_force":
-                self.optimize_model_with_brute_force()
-            if mode == "gurobi":
-                self.optimize_model_with_gurobi()
+            self.optimize_model_with_optimization_mode(mode)
             optimization_end_time = time() - optimization_start_time
-            self.calculate_optimal_number_of_vms()
             self.print_optimization_results(mode, optimization_end_time)
+            if mode == "approximate" and self.approximate_reference_mode is not None:
+                self.print_approximation_error()
+        if self.branch_and_bound_statistics["brute_force_cells"] > 0:
+            print("Branch and bound: {0}".format(self.branch_and_bound_statistics))
+        if self.anytime_statistics["solves"] > 0:
+            print("Anytime: {0}".format(self.anytime_statistics))
+        if self.result_cache is not None:
+            print("Result cache: {0}".format(self.result_cache.get_statistics()))
+
+
+# OPTIMIZATION MODES REGISTRY: MODE -> (SOLVER BACKEND MODULE, SOLVER FUNCTION, SPLIT ACROSS THE PROCESS POOL?,
+# CACHE ITS RESULTS?, IS ITS COST PRICE PER SLOT (υ / γ) SEPARABLE?)
+# BUILT-IN MODES (MODULE None) ARE CrespOptimizer METHODS THAT TAKE THE MODEL PARAMETERS; ANY OTHER BACKEND MODULE IS
+# ONLY IMPORTED WHEN ONE OF ITS MODES IS FIRST SOLVED, AND ITS SOLVER FUNCTIONS TAKE THE OPTIMIZER AND THE PARAMETERS
+optimization_modes_registry = OrderedDict()
+
+
+def register_optimization_mode(mode: str,
+                               backend_module_name: str,
+                               solver_function_name: str,
+                               split_across_process_pool: bool = True,
+                               cache_results: bool = True,
+                               price_per_slot_separable: bool = True) -> None:
+    optimization_modes_registry[mode] = (backend_module_name,
+                                         solver_function_name,
+                                         split_across_process_pool,
+                                         cache_results,
+                                         price_per_slot_separable)
+
+
+register_optimization_mode("brute_force", None, "solve_with_brute_force")
+register_optimization_mode("brute_force_vectorized", None, "solve_with_brute_force_vectorized")
+register_optimization_mode("structured", None, "solve_with_structured")
+register_optimization_mode("pareto", None, "solve_with_pareto")
+register_optimization_mode("branch_and_bound", None, "solve_with_branch_and_bound", False)
+# DEADLINE-BOUNDED RESULTS MAY NOT BE OPTIMAL, SO THEY ARE NOT CACHED
+register_optimization_mode("anytime", None, "solve_with_anytime", False, False)
+# THE NEIGHBOURHOOD RADIUS IS NOT PART OF THE CACHE KEY, SO APPROXIMATE RESULTS ARE NOT CACHED EITHER
+register_optimization_mode("approximate", None, "solve_with_approximate", False, False)
+# ITS C IS THE BILLED COST OF WHOLE NODES (NOT COMPARABLE WITH THE OTHER MODES' ONE), WHICH DEPENDS ON γ ON ITS OWN
+register_optimization_mode("node_count", None, "solve_with_node_count", False, True, False)
+register_optimization_mode("gurobi", "cresp_gurobi_backend", "solve_with_gurobi", False)
+register_optimization_mode("gurobi_session", "cresp_gurobi_backend", "solve_with_gurobi_session", False)
+register_optimization_mode("scipy", "cresp_scipy_backend", "solve_with_scipy")
 
 
 def main():
@@ -482,9 +2046,13 @@ def main():
     # READ CONFIG FILE
     cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
 
-    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7)
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7), FROM THE SUFFICIENT STATISTICS FILE IF ANY IS SET
     co.load_beta_parameters(cp)
 
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
     # LOAD INPUT PARAMETERS (M, γ, υ, φ, τ)
     # M: Number of chunks of data (Map tasks); M = Input (GB) * 1024MB / HDFS Block Size (MB)
     # γ (Gamma): Fixed number of slots (vCPUs) per node for a specific cluster setup
@@ -519,12 +2087,46 @@ def main():
     # 3: Find the most economical solution for the job without the Time constraint τ
     co.load_optimization_problem(cp)
 
-    # LOAD OPTIMIZATION MODES [brute_force | gurobi]
+    # LOAD OPTIMIZATION MODES
+    # [brute_force | brute_force_vectorized | structured | pareto | branch_and_bound | anytime | approximate |
+    #  node_count | gurobi | gurobi_session | scipy]
     co.load_optimization_modes(cp)
 
+    # LOAD NUMBER OF WORKER PROCESSES (1: NO PROCESS POOL)
+    co.load_workers(cp)
+
+    # LOAD VECTORIZED BLOCK SIZE (MAXIMUM NUMBER OF m×R CELLS EVALUATED AT ONCE, WHICH BOUNDS THE PEAK MEMORY)
+    co.load_vectorized_block_size(cp)
+
+    # LOAD WALL-CLOCK DEADLINE OF THE ANYTIME OPTIMIZATION MODE (IN SECONDS)
+    co.load_anytime_deadline_in_seconds(cp)
+
+    # LOAD APPROXIMATE OPTIMIZATION MODE SETTINGS (INTEGER NEIGHBOURHOOD RADIUS, OPTIONAL REFERENCE MODE)
+    co.load_approximate_settings(cp)
+
+    # LOAD SENSITIVITY FACTORS (OPTIONAL; RELATIVE PERTURBATIONS OF THE β PARAMETERS, υ, φ AND τ)
+    co.load_sensitivity_factors(cp)
+
+    # LOAD RESULT CACHE (IN-MEMORY LRU TIER, OPTIONAL ON-DISK TIER)
+    co.load_result_cache(cp)
+
+    # LOAD INSTANCE CATALOGUE (OPTIONAL; NAME, γ AND υ OF EACH INSTANCE TYPE)
+    co.load_instance_catalogue(cp)
+
     # OPTIMIZE MODEL WITH AVAILABLE OPTIMIZATION MODES
     co.optimize_model_with_available_optimization_modes()
 
+    # OPTIMIZE MODEL OVER THE INSTANCE CATALOGUE (IF ANY), WITH AVAILABLE OPTIMIZATION MODES
+    if len(co.instance_catalogue) > 0:
+        co.optimize_model_with_instance_catalogue()
+
+    # ANALYZE THE SENSITIVITY OF THE OPTIMAL ALLOCATION TO THE β PARAMETERS, υ, φ AND τ (IF ANY FACTORS ARE SET)
+    if len(co.sensitivity_factors) > 0:
+        co.print_sensitivity_analysis()
+
+    # CLOSE SOLVER BACKEND SESSIONS (E.G., GUROBI ENVIRONMENT AND MODELS, IF ANY)
+    co.close_backend_sessions()
+
     # DELETE CONFIGPARSER OBJECT
     del cp
 
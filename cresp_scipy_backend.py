@@ -0,0 +1,189 @@
+from cresp_optimizer import CrespOptimizer, CrespParameters, CrespResult
+from heapq import heappop, heappush
+from math import ceil, exp, floor, inf, log
+from numpy import array, dot, exp as numpy_exp, float64, log as numpy_log
+from scipy.optimize import minimize
+
+
+# SOLVER BACKEND OF THE scipy OPTIMIZATION MODE (IMPORTED ONLY WHEN IT IS FIRST SOLVED): AN EXACT, LICENSE-FREE
+# BRANCH-AND-BOUND OVER THE INTEGER (m, R) BOUNDS. T3(m,R) AND C(m,R) ARE POSYNOMIALS IN m AND R, SO WITH m = e^u AND
+# R = e^v THEIR LOGARITHMS ARE CONVEX IN (u, v): THE CONTINUOUS RELAXATION OF EVERY NODE IS A CONVEX PROGRAM, SOLVED
+# WITH SCIPY, WHOSE OPTIMUM IS A VALID LOWER BOUND FOR THE INTEGER ALLOCATIONS OF THAT NODE
+SMALL_NODE_SIZE = 1024  # NODES WITH UP TO THIS MANY (m, R) CELLS ARE SOLVED BY THE VECTORIZED BRUTE FORCE
+PRUNING_SLACK = 1e-9  # A NODE IS ONLY PRUNED IF ITS LOWER BOUND EXCEEDS THE INCUMBENT BY THIS MUCH (IN LOG SPACE)
+T3_EXPONENTS = ((0, 0), (-1, 0), (-1, 1), (1, -1), (0, -1), (0, 1))  # α0, α1/m, α2R/m, α3m/R, α4/R, α5R
+
+
+class CrespLogPosynomial:
+    # log(Σ coefficient_k * m^a_k * R^b_k), AS A FUNCTION OF (u, v) = (log m, log R)
+    def __init__(self,
+                 coefficients: list,
+                 exponents: list) -> None:
+        terms = [(coefficient, exponent) for coefficient, exponent in zip(coefficients, exponents) if coefficient > 0]
+        self.log_coefficients = array([log(coefficient) for coefficient, _ in terms], dtype=float64)
+        self.exponents = array([exponent for _, exponent in terms], dtype=float64).reshape(-1, 2)
+
+    def is_empty(self) -> bool:
+        return len(self.log_coefficients) == 0
+
+    def calculate_value_and_gradient(self,
+                                     x) -> tuple:
+        z = dot(self.exponents, x) + self.log_coefficients
+        z_max = z.max()
+        weights = numpy_exp(z - z_max)
+        weights_sum = weights.sum()
+        return z_max + numpy_log(weights_sum), dot(weights / weights_sum, self.exponents)
+
+
+def get_log_posynomials(parameters: CrespParameters) -> tuple:
+    time_unit_divisor = {"hour": 3600, "minute": 60}.get(parameters.time_unit, 1)
+    T3_coefficients = [alfa_i / time_unit_divisor for alfa_i in (parameters.alfaZero, parameters.alfaOne,
+                                                                 parameters.alfaTwo, parameters.alfaThree,
+                                                                 parameters.alfaFour, parameters.alfaFive)]
+    # C(m,R) = (υ / γ) * T3(m,R) * m + (υ / γ) * T3(m,R) * R
+    C_coefficients = [parameters.Upsilon * T3_coefficient / parameters.Gamma for T3_coefficient in T3_coefficients]
+    C_exponents = [(a + 1, b) for a, b in T3_EXPONENTS] + [(a, b + 1) for a, b in T3_EXPONENTS]
+    return CrespLogPosynomial(T3_coefficients, T3_EXPONENTS), CrespLogPosynomial(C_coefficients * 2, C_exponents)
+
+
+def solve_node_relaxation(objective: CrespLogPosynomial,
+                          constraint: CrespLogPosynomial,
+                          constraint_bound: float,
+                          node: tuple) -> tuple:
+    # RETURNS THE LOWER BOUND (log OF THE OBJECTIVE) AND THE RELAXED (m, R) OF THE NODE, OR inf IF IT IS INFEASIBLE
+    m_lower, m_upper, R_lower, R_upper = node
+    bounds = [(log(m_lower), log(m_upper)), (log(R_lower), log(R_upper))]
+    x0 = array([(bounds[0][0] + bounds[0][1]) / 2, (bounds[1][0] + bounds[1][1]) / 2], dtype=float64)
+    constraints = ()
+    if constraint is not None:
+        # THE SMALLEST CONSTRAINT VALUE OVER THE NODE PROVES (OR DISPROVES) ITS INFEASIBILITY; A FAILED MINIMIZATION MAY
+        # STOP ABOVE IT, SO IT PROVES NOTHING AND THE NODE IS KEPT
+        feasibility = minimize(constraint.calculate_value_and_gradient, x0, jac=True, method="L-BFGS-B",
+                               bounds=bounds, options={"ftol": 1e-15, "gtol": 1e-12})
+        if feasibility.success:
+            if feasibility.fun > constraint_bound + PRUNING_SLACK:
+                return inf, None
+            x0 = feasibility.x
+        constraints = ({"type": "ineq",
+                        "fun": lambda x: constraint_bound - constraint.calculate_value_and_gradient(x)[0],
+                        "jac": lambda x: -constraint.calculate_value_and_gradient(x)[1]},)
+    relaxation = minimize(objective.calculate_value_and_gradient, x0, jac=True,
+                          method="SLSQP" if constraints else "L-BFGS-B",
+                          bounds=bounds, constraints=constraints, options={"ftol": 1e-15, "maxiter": 200})
+    # ANY FAILURE (INCLUDING SLSQP'S STATUS 8, POSITIVE DIRECTIONAL DERIVATIVE FOR LINESEARCH, WHICH MAY STOP SHORT OF
+    # THE MINIMUM) LEAVES NO TRUSTWORTHY BOUND: THE NODE IS KEPT AND SPLIT AROUND ITS CENTER
+    if not relaxation.success:
+        return -inf, (exp(x0[0]), exp(x0[1]))
+    return relaxation.fun, (exp(relaxation.x[0]), exp(relaxation.x[1]))
+
+
+def get_objective_value(parameters: CrespParameters,
+                        result: CrespResult) -> float:
+    return result.T3 if parameters.optimization_problem == 1 else result.C
+
+
+def is_better_result(parameters: CrespParameters,
+                     candidate: CrespResult,
+                     incumbent: CrespResult) -> bool:
+    # TIES ARE BROKEN TOWARDS THE LOWEST m, AND THEN THE LOWEST R, AS THE BRUTE FORCE DOES
+    if not candidate.is_feasible():
+        return False
+    if not incumbent.is_feasible():
+        return True
+    candidate_value = get_objective_value(parameters, candidate)
+    incumbent_value = get_objective_value(parameters, incumbent)
+    return candidate_value < incumbent_value or \
+        (candidate_value == incumbent_value and (candidate.m, candidate.R) < (incumbent.m, incumbent.R))
+
+
+def evaluate_allocation(parameters: CrespParameters,
+                        m: int,
+                        R: int) -> CrespResult:
+    T3 = parameters.calculate_T3(m, R)
+    C = parameters.calculate_C(T3, m, R)
+    if parameters.optimization_problem != 3 and not parameters.is_constraint_not_violated(C, T3):
+        return CrespResult()
+    return CrespOptimizer.get_model_result(parameters, m, R, T3, C)
+
+
+def split_node(node: tuple,
+               relaxed_allocation: tuple) -> list:
+    # SPLIT THE WIDEST VARIABLE AT ITS RELAXED VALUE (KEEPING BOTH CHILDREN NON-EMPTY)
+    m_lower, m_upper, R_lower, R_upper = node
+    if m_upper - m_lower >= R_upper - R_lower:
+        split = min(max(floor(relaxed_allocation[0]), m_lower), m_upper - 1)
+        return [(m_lower, split, R_lower, R_upper), (split + 1, m_upper, R_lower, R_upper)]
+    split = min(max(floor(relaxed_allocation[1]), R_lower), R_upper - 1)
+    return [(m_lower, m_upper, R_lower, split), (m_lower, m_upper, split + 1, R_upper)]
+
+
+def get_relaxed_program(parameters: CrespParameters) -> tuple:
+    # (OBJECTIVE, CONSTRAINT, CONSTRAINT BOUND) OF THE OPTIMIZATION PROBLEM, ALL IN LOG SPACE, OR None IF T3(m,R) = 0
+    # EVERYWHERE (NOTHING TO BOUND)
+    T3_posynomial, C_posynomial = get_log_posynomials(parameters)
+    if T3_posynomial.is_empty():
+        return None
+    if parameters.optimization_problem == 1:
+        # MINIMIZE T3(m,R), SUBJECT TO C(m,R) <= φ
+        return T3_posynomial, C_posynomial, log(parameters.Phi)
+    if parameters.optimization_problem == 2:
+        # MINIMIZE C(m,R), SUBJECT TO T3(m,R) <= τ
+        return C_posynomial, T3_posynomial, log(parameters.Tau)
+    # MINIMIZE C(m,R)
+    return C_posynomial, None, inf
+
+
+def solve_continuous_relaxation(parameters: CrespParameters) -> tuple:
+    # OPTIMAL (m, R) OVER THE REAL-VALUED BOUNDS, OR None IF THERE IS NO FEASIBLE ONE
+    relaxed_program = get_relaxed_program(parameters)
+    if relaxed_program is None:
+        # T3(m,R) = C(m,R) = 0 EVERYWHERE: EVERY ALLOCATION IS OPTIMAL, THE LOWEST ONE IS PICKED (AS THE BRUTE FORCE DOES)
+        return parameters.m_lower_bound, parameters.R_lower_bound
+    lower_bound, relaxed_allocation = solve_node_relaxation(*relaxed_program,
+                                                            (parameters.m_lower_bound, parameters.m_upper_bound,
+                                                             parameters.R_lower_bound, parameters.R_upper_bound))
+    return relaxed_allocation if lower_bound < inf else None
+
+
+def solve_with_scipy(cresp_optimizer: CrespOptimizer,
+                     parameters: CrespParameters) -> CrespResult:
+    relaxed_program = get_relaxed_program(parameters)
+    if relaxed_program is None:
+        return cresp_optimizer.solve_with_brute_force_vectorized(parameters)
+    objective, constraint, constraint_bound = relaxed_program
+    result = CrespResult()
+    nodes = [(-inf, 0, (parameters.m_lower_bound, parameters.m_upper_bound,
+                        parameters.R_lower_bound, parameters.R_upper_bound))]
+    nodes_count = 1
+    while nodes:
+        lower_bound, _, node = heappop(nodes)
+        if result.is_feasible() and lower_bound > log(get_objective_value(parameters, result)) + PRUNING_SLACK:
+            # BEST-FIRST: EVERY REMAINING NODE IS WORSE THAN THE INCUMBENT
+            break
+        m_lower, m_upper, R_lower, R_upper = node
+        if (m_upper - m_lower + 1) * (R_upper - R_lower + 1) <= SMALL_NODE_SIZE:
+            node_result = cresp_optimizer.solve_with_brute_force_vectorized(parameters.replace(m_lower_bound=m_lower,
+                                                                                               m_upper_bound=m_upper,
+                                                                                               R_lower_bound=R_lower,
+                                                                                               R_upper_bound=R_upper))
+            if is_better_result(parameters, node_result, result):
+                result = node_result
+            continue
+        node_lower_bound, relaxed_allocation = solve_node_relaxation(objective, constraint, constraint_bound, node)
+        if node_lower_bound == inf:
+            continue
+        # ROUND THE RELAXED ALLOCATION TO ITS NEIGHBOUR INTEGER ALLOCATIONS (CANDIDATE INCUMBENTS)
+        for m in {min(max(floor(relaxed_allocation[0]), m_lower), m_upper),
+                  min(max(ceil(relaxed_allocation[0]), m_lower), m_upper)}:
+            for R in {min(max(floor(relaxed_allocation[1]), R_lower), R_upper),
+                      min(max(ceil(relaxed_allocation[1]), R_lower), R_upper)}:
+                candidate = evaluate_allocation(parameters, m, R)
+                if is_better_result(parameters, candidate, result):
+                    result = candidate
+        if result.is_feasible() and \
+                node_lower_bound > log(get_objective_value(parameters, result)) + PRUNING_SLACK:
+            continue
+        for child_node in split_node(node, relaxed_allocation):
+            heappush(nodes, (node_lower_bound, nodes_count, child_node))
+            nodes_count += 1
+    return result
@@ -5,7 +5,7 @@ sudo apt install python3-pip -y
 python3 -m pip install --upgrade numpy
 # Install/Upgrade 'SciPy' library
 python3 -m pip install --upgrade scipy
-# Install/Upgrade 'GurobiPy' library
+# Install/Upgrade 'GurobiPy' library (optional: only used by the gurobi and gurobi_session optimization modes)
 python3 -m pip install --upgrade gurobipy
 # Install 'Vim' text editor
 sudo apt install vim -y
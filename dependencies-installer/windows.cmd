@@ -12,7 +12,7 @@ del get-pip.py
 python -m pip install --upgrade numpy
 :: Install/Upgrade 'SciPy' library
 python -m pip install --upgrade scipy
-:: Install/Upgrade 'GurobiPy' library
+:: Install/Upgrade 'GurobiPy' library (optional: only used by the gurobi and gurobi_session optimization modes)
 python -m pip install --upgrade gurobipy
 :: Install 'Chocolatey' software manager
 powershell Set-ExecutionPolicy Bypass -Scope Process -Force; [System.Net.ServicePointManager]::SecurityProtocol = [System.Net.ServicePointManager]::SecurityProtocol -bor 3072; iex ((New-Object System.Net.WebClient).DownloadString('https://community.chocolatey.org/install.ps1'))
@@ -0,0 +1,352 @@
+from configparser import ConfigParser
+from cresp_optimizer import CrespOptimizer, CrespParameters, CrespParetoFrontier
+from math import isfinite
+from numpy import arange, concatenate, float64, int64, maximum, repeat, searchsorted, tile, zeros
+from pathlib import Path
+from time import time
+from sys import exit
+
+
+class CrespPipelineFrontier:
+    # NON-DOMINATED (T3, C) PLANS OF A SUB-PIPELINE, SORTED BY INCREASING T3 (AND THUS STRICTLY DECREASING C). A STAGE
+    # FRONTIER IS ITS (T3, C) PARETO FRONTIER; A COMPOSED ONE REMEMBERS, FOR EACH PLAN, THE PLANS OF ITS TWO PARTS
+    # (left_index, right_index), RUN ONE AFTER THE OTHER ("series": T3 IS THE SUM) OR SIDE BY SIDE ("parallel": T3 IS
+    # THE MAXIMUM). C IS ALWAYS THE SUM
+    __slots__ = ("T3",
+                 "C",
+                 "stage",
+                 "pareto_frontier",
+                 "left",
+                 "right",
+                 "left_index",
+                 "right_index")
+
+    def __init__(self,
+                 T3,
+                 C,
+                 stage: int = None,
+                 pareto_frontier: CrespParetoFrontier = None,
+                 left: "CrespPipelineFrontier" = None,
+                 right: "CrespPipelineFrontier" = None,
+                 left_index=None,
+                 right_index=None) -> None:
+        self.T3 = T3
+        self.C = C
+        self.stage = stage
+        self.pareto_frontier = pareto_frontier
+        self.left = left
+        self.right = right
+        self.left_index = left_index
+        self.right_index = right_index
+
+    @staticmethod
+    def from_stage(stage: int,
+                   pareto_frontier: CrespParetoFrontier) -> "CrespPipelineFrontier":
+        return CrespPipelineFrontier(pareto_frontier.T3, pareto_frontier.C, stage, pareto_frontier)
+
+    @staticmethod
+    def compose(left: "CrespPipelineFrontier",
+                right: "CrespPipelineFrontier",
+                operation: str,
+                block_size: int) -> "CrespPipelineFrontier":
+        # EVERY PAIR OF PLANS, BLOCK OF left PLANS BY BLOCK OF left PLANS, MERGING EACH BLOCK INTO THE RUNNING FRONTIER
+        left_index = zeros(0, dtype=int64)
+        right_index = zeros(0, dtype=int64)
+        T3 = zeros(0, dtype=float64)
+        C = zeros(0, dtype=float64)
+        block_rows = max(1, block_size // len(right.T3))
+        for block_start in range(0, len(left.T3), block_rows):
+            block_end = min(block_start + block_rows, len(left.T3))
+            left_candidates = repeat(arange(block_start, block_end, dtype=int64), len(right.T3))
+            right_candidates = tile(arange(len(right.T3), dtype=int64), block_end - block_start)
+            if operation == "series":
+                T3_candidates = left.T3[left_candidates] + right.T3[right_candidates]
+            else:
+                T3_candidates = maximum(left.T3[left_candidates], right.T3[right_candidates])
+            C_candidates = left.C[left_candidates] + right.C[right_candidates]
+            left_index, right_index, T3, C = \
+                CrespParetoFrontier.get_non_dominated_frontier(concatenate((left_index, left_candidates)),
+                                                               concatenate((right_index, right_candidates)),
+                                                               concatenate((T3, T3_candidates)),
+                                                               concatenate((C, C_candidates)))
+        return CrespPipelineFrontier(T3, C, left=left, right=right, left_index=left_index, right_index=right_index)
+
+    def get_allocations(self,
+                        index: int,
+                        allocations: dict) -> dict:
+        # WALK THE COMPOSITION DOWN TO THE STAGES, COLLECTING THE (m, R, T3, C) OF EACH ONE
+        if self.pareto_frontier is not None:
+            allocations[self.stage] = (int(self.pareto_frontier.m[index]),
+                                       int(self.pareto_frontier.R[index]),
+                                       float(self.T3[index]),
+                                       float(self.C[index]))
+            return allocations
+        self.left.get_allocations(int(self.left_index[index]), allocations)
+        self.right.get_allocations(int(self.right_index[index]), allocations)
+        return allocations
+
+
+class CrespPipelineOptimizer:
+    # OPTIMIZES A PIPELINE (CHAIN OR TREE) OF MAPREDUCE STAGES AS A WHOLE: φ BOUNDS THE TOTAL COST (Σ C) AND τ BOUNDS
+    # THE MAKESPAN (LONGEST PATH OF T3), FOR THE OPTIMIZATION PROBLEMS 1, 2 AND 3 OF 'cresp_optimizer.cfg'. THE STAGE
+    # FRONTIERS ARE COMBINED BOTTOM-UP (DYNAMIC PROGRAMMING OVER NON-DOMINATED PLANS), WHICH IS EXACT AS LONG AS NO TWO
+    # BRANCHES SHARE A STAGE: EVERY STAGE MUST HAVE AT MOST ONE SUCCESSOR (CHAINS AND JOINS) OR EVERY STAGE AT MOST ONE
+    # PREDECESSOR (CHAINS AND FORKS). GRAPHS WHOSE BRANCHES SHARE A STAGE (E.G., A DIAMOND: A FORK FOLLOWED BY A JOIN)
+    # ARE NOT SUPPORTED
+
+    def __init__(self) -> None:
+        self.pipeline_optimizer_config_file_path = Path("config/pipeline_optimizer.cfg")
+        self.stages_input_file_path = None
+        self.plan_output_file_path = None
+        self.beta_parameters_columns = ["β0", "β1", "β2", "β3", "β4", "β5", "β6", "β7"]
+        self.stages = []
+        self.predecessors = []
+        self.plan = None
+
+    def get_stages_input_file_path(self,
+                                   config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'stages_input_file' must be a valid path file!" \
+            .format(self.pipeline_optimizer_config_file_path)
+        try:
+            stages_input_file_path = Path(config_parser.get("general", "stages_input_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return stages_input_file_path
+
+    def get_plan_output_file_path(self,
+                                  config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'plan_output_file' must be a valid path file!" \
+            .format(self.pipeline_optimizer_config_file_path)
+        try:
+            plan_output_file_path = Path(config_parser.get("general", "plan_output_file"))
+        except ValueError:
+            raise ValueError(exception_message)
+        return plan_output_file_path
+
+    def load_general_settings(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.pipeline_optimizer_config_file_path, encoding="utf-8")
+        self.stages_input_file_path = self.get_stages_input_file_path(cp)
+        self.plan_output_file_path = self.get_plan_output_file_path(cp)
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    def load_stages(self) -> None:
+        # CSV FILE WITH A 'name, M, after' HEADER (PLUS, OPTIONALLY, THE β0, ..., β7 COLUMNS OF EACH STAGE'S OWN
+        # PROFILE) AND ONE STAGE PER LINE; 'after' LISTS THE STAGES IT WAITS FOR, SEPARATED BY ';'. STAGES WITHOUT
+        # THEIR OWN β PARAMETERS USE THE ONES OF 'cresp_optimizer.cfg'
+        exception_message = "{0}: the header must hold the 'name, M, after' columns (and, optionally, all the '{1}' " \
+                            "ones), every stage must have a unique name, a integer M higher than zero (and, if " \
+                            "given, finite float β parameters equal or higher than zero), and wait only for stages " \
+                            "listed before it!" \
+            .format(self.stages_input_file_path, ", ".join(self.beta_parameters_columns))
+        self.stages = []
+        self.predecessors = []
+        stages_indices = {}
+        with open(self.stages_input_file_path, "r", encoding="utf-8") as stages_file:
+            header = [column.strip() for column in stages_file.readline().split(",")]
+            has_beta_parameters = all(column in header for column in self.beta_parameters_columns)
+            if "name" not in header or "M" not in header or "after" not in header or \
+                    (not has_beta_parameters and any(column in header for column in self.beta_parameters_columns)):
+                raise ValueError(exception_message)
+            for line in stages_file:
+                if len(line.strip()) == 0:
+                    continue
+                fields = [field.strip() for field in line.split(",")]
+                try:
+                    name = fields[header.index("name")]
+                    M = int(fields[header.index("M")])
+                    predecessors = [stages_indices[predecessor.strip()]
+                                    for predecessor in fields[header.index("after")].split(";")
+                                    if len(predecessor.strip()) > 0]
+                    beta_parameters = None
+                    if has_beta_parameters and len(fields[header.index("β0")]) > 0:
+                        beta_parameters = [float(fields[header.index(column)])
+                                           for column in self.beta_parameters_columns]
+                        if not all(isfinite(beta_i) and beta_i >= 0.0 for beta_i in beta_parameters):
+                            raise ValueError(exception_message)
+                    if M <= 0 or name in stages_indices or len(set(predecessors)) != len(predecessors):
+                        raise ValueError(exception_message)
+                except (ValueError, IndexError, KeyError):
+                    raise ValueError(exception_message)
+                stages_indices[name] = len(self.stages)
+                self.stages.append((name, M, beta_parameters))
+                self.predecessors.append(predecessors)
+        if len(self.stages) == 0:
+            raise ValueError(exception_message)
+
+    def get_composition_edges(self) -> list:
+        # PREDECESSORS OF EACH STAGE IN A GRAPH WHERE EVERY STAGE HAS AT MOST ONE SUCCESSOR: THE PIPELINE ITSELF, OR,
+        # IF EVERY STAGE HAS AT MOST ONE PREDECESSOR INSTEAD, THE REVERSED PIPELINE (SAME MAKESPAN AND COST)
+        successors = [[] for _ in self.stages]
+        for stage, predecessors in enumerate(self.predecessors):
+            for predecessor in predecessors:
+                successors[predecessor].append(stage)
+        if all(len(stage_successors) <= 1 for stage_successors in successors):
+            return self.predecessors
+        if all(len(stage_predecessors) <= 1 for stage_predecessors in self.predecessors):
+            return successors
+        raise ValueError("{0}: every stage must wait for at most one stage, or be waited for by at most one stage "
+                         "(only chains and trees of stages are supported: no two branches of the pipeline may share "
+                         "a stage)!".format(self.stages_input_file_path))
+
+    def get_stages_parameters(self,
+                              cresp_optimizer: CrespOptimizer) -> list:
+        return [cresp_optimizer.get_scenario_parameters(M,
+                                                        cresp_optimizer.Gamma,
+                                                        cresp_optimizer.Upsilon,
+                                                        cresp_optimizer.Phi,
+                                                        cresp_optimizer.Tau,
+                                                        beta_parameters)
+                for _, M, beta_parameters in self.stages]
+
+    def calculate_pipeline_frontier(self,
+                                    cresp_optimizer: CrespOptimizer,
+                                    stages_parameters: list) -> CrespPipelineFrontier:
+        composition_edges = self.get_composition_edges()
+        block_size = cresp_optimizer.vectorized_block_size
+        # SUB-PIPELINE ENDING AT EACH STAGE: ITS PREDECESSORS' SUB-PIPELINES SIDE BY SIDE, THEN THE STAGE ITSELF. EVERY
+        # STAGE HAS AT MOST ONE SUCCESSOR, SO THE SUB-PIPELINES ARE DISJOINT AND EACH IS COMBINED EXACTLY ONCE
+        frontiers = {}
+        has_successor = [False] * len(self.stages)
+        pending_stages = list(range(len(self.stages)))
+        while pending_stages:
+            stage = next(stage for stage in pending_stages
+                         if all(predecessor in frontiers for predecessor in composition_edges[stage]))
+            pending_stages.remove(stage)
+            frontier = CrespPipelineFrontier.from_stage(stage,
+                                                        cresp_optimizer.get_pareto_frontier(stages_parameters[stage]))
+            predecessors_frontier = None
+            for predecessor in composition_edges[stage]:
+                has_successor[predecessor] = True
+                predecessors_frontier = frontiers[predecessor] if predecessors_frontier is None else \
+                    CrespPipelineFrontier.compose(predecessors_frontier, frontiers[predecessor], "parallel", block_size)
+            if predecessors_frontier is not None:
+                frontier = CrespPipelineFrontier.compose(predecessors_frontier, frontier, "series", block_size)
+            frontiers[stage] = frontier
+        # THE LAST STAGES (THOSE WITHOUT SUCCESSORS) RUN SIDE BY SIDE
+        pipeline_frontier = None
+        for stage in range(len(self.stages)):
+            if not has_successor[stage]:
+                pipeline_frontier = frontiers[stage] if pipeline_frontier is None else \
+                    CrespPipelineFrontier.compose(pipeline_frontier, frontiers[stage], "parallel", block_size)
+        return pipeline_frontier
+
+    @staticmethod
+    def get_optimum_index(pipeline_frontier: CrespPipelineFrontier,
+                          parameters: CrespParameters) -> int:
+        # SAME SEARCHES AS THE SINGLE-JOB PARETO FRONTIER: T3 IS INCREASING AND C IS DECREASING
+        if parameters.optimization_problem == 1:
+            index = int(searchsorted(-pipeline_frontier.C, -parameters.Phi, side="left"))
+        elif parameters.optimization_problem == 2:
+            index = int(searchsorted(pipeline_frontier.T3, parameters.Tau, side="right")) - 1
+        else:
+            index = len(pipeline_frontier.T3) - 1
+        return index if 0 <= index < len(pipeline_frontier.T3) else None
+
+    def optimize_pipeline(self,
+                          cresp_optimizer: CrespOptimizer) -> None:
+        stages_parameters = self.get_stages_parameters(cresp_optimizer)
+        pipeline_frontier = self.calculate_pipeline_frontier(cresp_optimizer, stages_parameters)
+        index = self.get_optimum_index(pipeline_frontier, stages_parameters[0])
+        if index is None:
+            self.plan = None
+            return
+        allocations = pipeline_frontier.get_allocations(index, {})
+        # START EACH STAGE AS SOON AS EVERY STAGE IT WAITS FOR HAS FINISHED
+        self.plan = []
+        for stage, (m, R, T3, C) in sorted(allocations.items()):
+            start = max((self.plan[predecessor][5] for predecessor in self.predecessors[stage]), default=0.0)
+            Nu = -(-(m + R) // cresp_optimizer.Gamma)
+            self.plan.append((m, R, Nu, T3, C, start + T3))
+
+    def write_plan(self,
+                   cresp_optimizer: CrespOptimizer) -> None:
+        if self.plan is None:
+            print("NO PLAN OF THE PIPELINE MEETS THE CONSTRAINT OF THE OPTIMIZATION PROBLEM {0}!"
+                  .format(cresp_optimizer.optimization_problem))
+            return
+        with open(self.plan_output_file_path, "w", encoding="utf-8") as plan_file:
+            plan_file.write(",".join(["name", "M", "m", "R", "ν", "T3", "C", "finish"]) + "\n")
+            for (name, M, _), row in zip(self.stages, self.plan):
+                plan_file.write(",".join(str(value) for value in (name, M) + row) + "\n")
+        print("Generated '{0}' file with the plan of {1} stages: makespan of {2} {3}(s), {4} {5}."
+              .format(self.plan_output_file_path,
+                      len(self.plan),
+                      max(row[5] for row in self.plan),
+                      cresp_optimizer.time_unit,
+                      sum(row[4] for row in self.plan),
+                      cresp_optimizer.monetary_unit))
+
+
+def main():
+    # INIT PIPELINE OPTIMIZER OBJECT
+    cpo = CrespPipelineOptimizer()
+
+    # LOAD GENERAL SETTINGS (stages input file path, plan output file path)
+    cpo.load_general_settings()
+
+    # LOAD STAGES (name, M, stages it waits for and, optionally, β parameters of each stage)
+    cpo.load_stages()
+
+    # INIT CRESP OPTIMIZER OBJECT
+    co = CrespOptimizer()
+
+    # INIT CONFIGPARSER OBJECT
+    cp = ConfigParser()
+
+    # PRESERVE OPTIONS NAMES' CASE
+    cp.optionxform = str
+
+    # READ CONFIG FILE
+    cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
+
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7), FOR STAGES WITHOUT THEIR OWN ONES
+    co.load_beta_parameters(cp)
+
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
+    # LOAD INPUT PARAMETERS (M, γ, υ, φ, τ); φ AND τ BOUND THE WHOLE PIPELINE, M COMES FROM EACH STAGE
+    co.load_input_parameters(cp)
+
+    # LOAD m BOUNDS (lower, upper)
+    co.load_m_bounds(cp)
+
+    # LOAD R BOUNDS (lower, upper)
+    co.load_R_bounds(cp)
+
+    # LOAD MONETARY UNIT [USD]
+    co.load_monetary_unit(cp)
+
+    # LOAD TIME UNIT [second | minute | hour]
+    co.load_time_unit(cp)
+
+    # LOAD OPTIMIZATION PROBLEM [1 | 2 | 3]
+    co.load_optimization_problem(cp)
+
+    # OPTIMIZE THE PIPELINE
+    optimization_start_time = time()
+    cpo.optimize_pipeline(co)
+    print("Optimized a pipeline of {0} stages in {1} seconds.".format(len(cpo.stages),
+                                                                       time() - optimization_start_time))
+
+    # WRITE THE PLAN
+    cpo.write_plan(co)
+
+    # DELETE CONFIGPARSER OBJECT
+    del cp
+
+    # DELETE CRESP OPTIMIZER OBJECT
+    del co
+
+    # DELETE PIPELINE OPTIMIZER OBJECT
+    del cpo
+
+    # END
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
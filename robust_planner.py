@@ -0,0 +1,345 @@
+from beta_parameters_learner import BetaParametersLearner
+from concurrent.futures import ProcessPoolExecutor
+from configparser import ConfigParser
+from cresp_optimizer import CrespOptimizer, CrespParameters
+from numpy import arange, argmin, array, clip, empty, eye, float64, inf as numpy_inf, int64, ndarray, where
+from numpy.random import SeedSequence, default_rng
+from pathlib import Path
+from time import time
+from sys import exit
+
+
+class CrespRobustPlanner:
+    # CHANCE-CONSTRAINED VERSION OF THE OPTIMIZATION PROBLEM 2: THE β PARAMETERS ARE UNCERTAIN, SO THE ALLOCATION WITH
+    # THE LOWEST EXPECTED COST C(m,R) WHOSE T3(m,R) <= τ FOR AT LEAST A deadline_probability SHARE OF THE β SAMPLES IS
+    # CHOSEN. T3 IS LINEAR IN THE β PARAMETERS, T3(m,R) = Σ βi * xi(m,R), SO EACH TILE OF THE m×R GRID IS EVALUATED
+    # AGAINST ALL THE SAMPLES AS ONE (CELLS × 8) @ (8 × SAMPLES) PRODUCT, AND THE EXPECTED COST ONLY NEEDS THE MEAN β
+
+    def __init__(self) -> None:
+        self.robust_planner_config_file_path = Path("config/robust_planner.cfg")
+        self.beta_samples_source = None
+        self.samples_count = 1000
+        self.deadline_probability = 0.95
+        self.covariance_file_path = None
+        self.seed = None
+        self.beta_samples = None
+        self.plan = None
+        self.nominal_plan = None
+
+    def get_beta_samples_source(self,
+                                config_parser: ConfigParser) -> str:
+        exception_message = "{0}: supported 'beta_samples_source' values: bootstrap | covariance." \
+            .format(self.robust_planner_config_file_path)
+        beta_samples_source = str(config_parser.get("general", "beta_samples_source"))
+        if beta_samples_source not in ["bootstrap", "covariance"]:
+            raise ValueError(exception_message)
+        return beta_samples_source
+
+    def get_samples_count(self,
+                          config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'samples' (number of β samples) must be a integer value higher than zero!" \
+            .format(self.robust_planner_config_file_path)
+        try:
+            samples_count = int(config_parser.get("general", "samples", fallback="1000"))
+            if samples_count <= 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return samples_count
+
+    def get_deadline_probability(self,
+                                 config_parser: ConfigParser) -> float:
+        exception_message = "{0}: 'deadline_probability' (share of β samples meeting τ) " \
+                            "must be a float value higher than zero and lower or equal to one!" \
+            .format(self.robust_planner_config_file_path)
+        try:
+            deadline_probability = float(config_parser.get("general", "deadline_probability", fallback="0.95"))
+            if deadline_probability <= 0.0 or deadline_probability > 1.0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return deadline_probability
+
+    def get_covariance_file_path(self,
+                                 config_parser: ConfigParser) -> Path:
+        exception_message = "{0}: 'covariance_file' must be a valid path file (required by the covariance source)!" \
+            .format(self.robust_planner_config_file_path)
+        covariance_file = str(config_parser.get("general", "covariance_file", fallback=""))
+        if len(covariance_file) == 0:
+            if self.beta_samples_source == "covariance":
+                raise ValueError(exception_message)
+            return None
+        return Path(covariance_file)
+
+    def get_seed(self,
+                 config_parser: ConfigParser) -> int:
+        exception_message = "{0}: 'seed' must be empty or a integer value equal or higher than zero!" \
+            .format(self.robust_planner_config_file_path)
+        seed = str(config_parser.get("general", "seed", fallback=""))
+        if len(seed) == 0:
+            return None
+        try:
+            seed = int(seed)
+            if seed < 0:
+                raise ValueError(exception_message)
+        except ValueError:
+            raise ValueError(exception_message)
+        return seed
+
+    def load_general_settings(self) -> None:
+        cp = ConfigParser()  # INIT CONFIGPARSER OBJECT
+        cp.optionxform = str  # PRESERVE OPTIONS NAMES' CASE
+        cp.read(self.robust_planner_config_file_path, encoding="utf-8")
+        self.beta_samples_source = self.get_beta_samples_source(cp)
+        self.samples_count = self.get_samples_count(cp)
+        self.deadline_probability = self.get_deadline_probability(cp)
+        self.covariance_file_path = self.get_covariance_file_path(cp)
+        self.seed = self.get_seed(cp)
+        del cp  # DELETE CONFIGPARSER OBJECT
+
+    def load_covariance_matrix(self) -> ndarray:
+        # CSV FILE WITH A 'β0, ..., β7' HEADER AND THE 8 ROWS OF THE (SYMMETRIC) COVARIANCE MATRIX OF THE β PARAMETERS
+        exception_message = "{0}: the header must be 'β0, ..., β7', followed by the 8 rows of a symmetric 8×8 matrix!" \
+            .format(self.covariance_file_path)
+        with open(self.covariance_file_path, "r", encoding="utf-8") as covariance_file:
+            header = [column.strip() for column in covariance_file.readline().split(",")]
+            try:
+                covariance_matrix = array([[float(field) for field in line.split(",")]
+                                           for line in covariance_file if len(line.strip()) > 0], dtype=float64)
+            except ValueError:
+                raise ValueError(exception_message)
+        if header != ["β{0}".format(i) for i in range(8)] or covariance_matrix.shape != (8, 8) or \
+                (covariance_matrix != covariance_matrix.T).any():
+            raise ValueError(exception_message)
+        return covariance_matrix
+
+    def draw_beta_samples(self,
+                          cresp_optimizer: CrespOptimizer) -> None:
+        seed_sequence = SeedSequence(self.seed)
+        if self.beta_samples_source == "covariance":
+            # NORMAL AROUND THE β PARAMETERS OF 'cresp_optimizer.cfg', CLIPPED AT ZERO (THEY ARE NON-NEGATIVE)
+            beta_parameters = [cresp_optimizer.betaZero, cresp_optimizer.betaOne, cresp_optimizer.betaTwo,
+                               cresp_optimizer.betaThree, cresp_optimizer.betaFour, cresp_optimizer.betaFive,
+                               cresp_optimizer.betaSix, cresp_optimizer.betaSeven]
+            self.beta_samples = clip(default_rng(seed_sequence).multivariate_normal(beta_parameters,
+                                                                                    self.load_covariance_matrix(),
+                                                                                    self.samples_count),
+                                     0.0,
+                                     None)
+            return
+        # BOOTSTRAP REFITS OF THE EXPERIMENTS OF 'beta_parameters_learner.cfg' (ONLY THOSE OF THE 'model_profile', IF
+        # ANY), SPLIT ACROSS THE WORKER PROCESSES BY THE LEARNER'S OWN RESAMPLING (EXPERIMENTS IN SHARED MEMORY; THE
+        # SAME seed YIELDS THE SAME SAMPLES, WHATEVER THE NUMBER OF WORKERS)
+        bpl = BetaParametersLearner()
+        bpl.load_general_settings()
+        bpl.load_experiments()
+        bpl.load_A_matrix()
+        bpl.load_b_vector()
+        if cresp_optimizer.model_profile is not None:
+            if cresp_optimizer.model_profile not in bpl.profiles:
+                raise ValueError("{0}: there are no experiments of the '{1}' profile ('model_profile') to bootstrap!"
+                                 .format(bpl.experiments_input_file_path, cresp_optimizer.model_profile))
+            is_profile_experiment = bpl.profile_column == bpl.profiles.index(cresp_optimizer.model_profile)
+            bpl.A_matrix = bpl.A_matrix[is_profile_experiment]
+            bpl.b_vector = bpl.b_vector[is_profile_experiment]
+        bpl.resampling_method = "bootstrap"
+        bpl.resamples = self.samples_count
+        bpl.workers = cresp_optimizer.workers
+        bpl.seed = self.seed
+        bpl.estimate_confidence_intervals()
+        self.beta_samples = bpl.beta_samples
+        del bpl
+
+    @staticmethod
+    def get_unit_beta_parameters(cresp_optimizer: CrespOptimizer) -> list:
+        # xi(m,R), IN THE MODEL'S TIME UNIT, IS T3(m,R) WITH βi = 1 AND EVERY OTHER β PARAMETER EQUAL TO ZERO
+        return [cresp_optimizer.get_scenario_parameters(cresp_optimizer.M,
+                                                        cresp_optimizer.Gamma,
+                                                        cresp_optimizer.Upsilon,
+                                                        cresp_optimizer.Phi,
+                                                        cresp_optimizer.Tau,
+                                                        list(unit_beta_parameters))
+                for unit_beta_parameters in eye(8)]
+
+    @staticmethod
+    def get_cheaper_plan(plan: tuple,
+                         parameters: CrespParameters,
+                         cells: ndarray,
+                         m: ndarray,
+                         R: ndarray,
+                         T3: ndarray,
+                         is_feasible: ndarray,
+                         probability: ndarray) -> tuple:
+        # argmin RETURNS THE FIRST (LOWEST m, THEN LOWEST R) CHEAPEST CELL OF THE TILE, AND A LATER TILE ONLY REPLACES
+        # THE PLAN IF STRICTLY CHEAPER, AS THE NESTED LOOP DOES
+        C = parameters.calculate_C(T3, m, R)
+        cell = int(argmin(where(is_feasible, C, numpy_inf)))
+        if not is_feasible[cell] or (plan is not None and not C[cell] < plan[4]):
+            return plan
+        return int(cells[cell]), int(m[cell]), int(R[cell]), float(T3[cell]), float(C[cell]), float(probability[cell])
+
+    @staticmethod
+    def plan_cells(parameters: CrespParameters,
+                   unit_beta_parameters: list,
+                   beta_samples: ndarray,
+                   deadline_probability: float,
+                   first_cell: int,
+                   last_cell: int,
+                   block_size: int) -> tuple:
+        # ROBUST AND NOMINAL PLANS OVER THE [first_cell, last_cell) CELLS OF THE m×R GRID (ROW-MAJOR: LOWEST m, THEN
+        # LOWEST R, FIRST), STREAMED IN TILES WHOSE (CELLS × SAMPLES) PRODUCT HOLDS AT MOST block_size VALUES, THROUGH A
+        # DESIGN MATRIX BUFFER ALLOCATED ONCE (BOUNDED MEMORY, WHATEVER THE m AND R BOUNDS)
+        R_count = parameters.R_upper_bound - parameters.R_lower_bound + 1
+        tile_cells = max(1, block_size // max(8, len(beta_samples)))
+        design_matrix_buffer = empty((tile_cells, 8), dtype=float64, order="F")
+        mean_beta_parameters = beta_samples.mean(axis=0)
+        plan, nominal_plan = None, None
+        for tile_start in range(first_cell, last_cell, tile_cells):
+            cells = arange(tile_start, min(tile_start + tile_cells, last_cell), dtype=int64)
+            m = parameters.m_lower_bound + cells // R_count
+            R = parameters.R_lower_bound + cells % R_count
+            m_float, R_float = m.astype(float64), R.astype(float64)
+            design_matrix = design_matrix_buffer[:len(cells)]
+            for i, unit_parameters in enumerate(unit_beta_parameters):
+                design_matrix[:, i] = unit_parameters.calculate_T3(m_float, R_float)
+            deadlines_met = (design_matrix @ beta_samples.T <= parameters.Tau).sum(axis=1)
+            probability = deadlines_met / len(beta_samples)
+            # C IS LINEAR IN T3, SO THE EXPECTED COST IS THE COST OF THE EXPECTED T3, I.E., OF THE MEAN β
+            plan = CrespRobustPlanner.get_cheaper_plan(plan, parameters, cells, m, R,
+                                                       design_matrix @ mean_beta_parameters,
+                                                       deadlines_met >= deadline_probability * len(beta_samples),
+                                                       probability)
+            # THE NOMINAL (POINT ESTIMATE) PLAN, FOR COMPARISON: THE CHEAPEST ALLOCATION WHOSE T3(m,R) <= τ
+            nominal_T3 = parameters.calculate_T3(m_float, R_float)
+            nominal_plan = CrespRobustPlanner.get_cheaper_plan(nominal_plan, parameters, cells, m, R, nominal_T3,
+                                                               nominal_T3 <= parameters.Tau, probability)
+        return plan, nominal_plan
+
+    def plan_allocation(self,
+                        cresp_optimizer: CrespOptimizer) -> None:
+        parameters = cresp_optimizer.get_scenario_parameters(cresp_optimizer.M,
+                                                             cresp_optimizer.Gamma,
+                                                             cresp_optimizer.Upsilon,
+                                                             cresp_optimizer.Phi,
+                                                             cresp_optimizer.Tau)
+        unit_beta_parameters = self.get_unit_beta_parameters(cresp_optimizer)
+        cells_count = (parameters.m_upper_bound - parameters.m_lower_bound + 1) * \
+                      (parameters.R_upper_bound - parameters.R_lower_bound + 1)
+        # THE GRID IS SPLIT INTO CONTIGUOUS RANGES OF CELLS ACROSS THE WORKER PROCESSES; THEIR PLANS ARE MERGED IN GRID
+        # ORDER, SO THE TIES ARE BROKEN AS WITHOUT THE PROCESS POOL
+        chunks_count = min(cells_count, cresp_optimizer.workers)
+        chunk_bounds = [(i * cells_count) // chunks_count for i in range(chunks_count + 1)]
+        if chunks_count == 1:
+            chunks_plans = [self.plan_cells(parameters, unit_beta_parameters, self.beta_samples,
+                                            self.deadline_probability, 0, cells_count,
+                                            cresp_optimizer.vectorized_block_size)]
+        else:
+            with ProcessPoolExecutor(max_workers=cresp_optimizer.workers) as executor:
+                chunks_plans = list(executor.map(self.plan_cells,
+                                                 [parameters] * chunks_count,
+                                                 [unit_beta_parameters] * chunks_count,
+                                                 [self.beta_samples] * chunks_count,
+                                                 [self.deadline_probability] * chunks_count,
+                                                 chunk_bounds[:-1],
+                                                 chunk_bounds[1:],
+                                                 [cresp_optimizer.vectorized_block_size] * chunks_count))
+        self.plan, self.nominal_plan = None, None
+        for chunk_plan, chunk_nominal_plan in chunks_plans:
+            if chunk_plan is not None and (self.plan is None or chunk_plan[4] < self.plan[4]):
+                self.plan = chunk_plan
+            if chunk_nominal_plan is not None and (self.nominal_plan is None or
+                                                   chunk_nominal_plan[4] < self.nominal_plan[4]):
+                self.nominal_plan = chunk_nominal_plan
+
+    def print_plan(self,
+                   cresp_optimizer: CrespOptimizer) -> None:
+        for description, plan in (("ROBUST", self.plan), ("NOMINAL", self.nominal_plan)):
+            print("-------------------- {0} ({1} β samples, {2}) -------------------"
+                  .format(description, len(self.beta_samples), self.beta_samples_source))
+            if plan is None:
+                print("MODEL IS INFEASIBLE!")
+                continue
+            _, m, R, T3, C, probability = plan
+            print("Estimated Time Cost: {0} {1}(s)".format(T3, cresp_optimizer.time_unit))
+            print("Number of Map Slots (m): {0}".format(m))
+            print("Number of Reduce Slots (R = r): {0}".format(R))
+            print("Number of Nodes/VMs (ν): {0}".format(-(-(m + R) // cresp_optimizer.Gamma)))
+            print("Estimated Monetary Cost: {0} {1}".format(C, cresp_optimizer.monetary_unit))
+            print("Probability of Meeting τ: {0}".format(probability))
+
+
+def main():
+    # INIT ROBUST PLANNER OBJECT
+    crp = CrespRobustPlanner()
+
+    # LOAD GENERAL SETTINGS (β samples source, number of samples, deadline probability, covariance file path, seed)
+    crp.load_general_settings()
+
+    # INIT CRESP OPTIMIZER OBJECT
+    co = CrespOptimizer()
+
+    # INIT CONFIGPARSER OBJECT
+    cp = ConfigParser()
+
+    # PRESERVE OPTIONS NAMES' CASE
+    cp.optionxform = str
+
+    # READ CONFIG FILE
+    cp.read(co.cresp_optimizer_config_file_path, encoding="utf-8")
+
+    # LOAD BETA PARAMETERS (β0, β1, β2, β3, β4, β5, β6, β7), THE POINT ESTIMATE
+    co.load_beta_parameters(cp)
+
+    # LOAD MODEL REGISTRY (OPTIONAL; β PARAMETERS PER APPLICATION PROFILE) AND, IF A MODEL PROFILE IS SET, USE ITS β
+    # PARAMETERS INSTEAD OF THE ONES ABOVE
+    co.load_model_registry(cp)
+
+    # LOAD INPUT PARAMETERS (M, γ, υ, φ, τ)
+    co.load_input_parameters(cp)
+
+    # LOAD m BOUNDS (lower, upper)
+    co.load_m_bounds(cp)
+
+    # LOAD R BOUNDS (lower, upper)
+    co.load_R_bounds(cp)
+
+    # LOAD MONETARY UNIT [USD]
+    co.load_monetary_unit(cp)
+
+    # LOAD TIME UNIT [second | minute | hour]
+    co.load_time_unit(cp)
+
+    # LOAD NUMBER OF WORKER PROCESSES (1: NO PROCESS POOL)
+    co.load_workers(cp)
+
+    # LOAD VECTORIZED BLOCK SIZE (MAXIMUM NUMBER OF CELLS EVALUATED AT ONCE, WHICH BOUNDS THE PEAK MEMORY)
+    co.load_vectorized_block_size(cp)
+
+    # DRAW THE β SAMPLES
+    sampling_start_time = time()
+    crp.draw_beta_samples(co)
+    print("Drew {0} β samples in {1} seconds.".format(crp.samples_count, time() - sampling_start_time))
+
+    # PLAN THE ALLOCATION
+    planning_start_time = time()
+    crp.plan_allocation(co)
+    print("Planned the allocation in {0} seconds.".format(time() - planning_start_time))
+
+    # PRINT THE ROBUST AND THE NOMINAL PLANS
+    crp.print_plan(co)
+
+    # DELETE CONFIGPARSER OBJECT
+    del cp
+
+    # DELETE CRESP OPTIMIZER OBJECT
+    del co
+
+    # DELETE ROBUST PLANNER OBJECT
+    del crp
+
+    # END
+    exit(0)
+
+
+if __name__ == "__main__":
+    main()
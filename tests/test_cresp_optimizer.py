@@ -0,0 +1,272 @@
+from cluster_planner import CrespClusterPlanner
+from cresp_optimizer import CrespOptimizer
+from itertools import product
+from math import ceil
+from pathlib import Path
+from pipeline_optimizer import CrespPipelineOptimizer
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+
+class CrespOptimizerInstanceCatalogueTest(TestCase):
+
+    @staticmethod
+    def get_allocation(result) -> tuple:
+        return result.m, result.R, result.T3, result.C
+
+    def setUp(self) -> None:
+        # THE SCENARIO OF config/cresp_optimizer.cfg, SOLVING THE OPTIMIZATION PROBLEM 3
+        self.co = CrespOptimizer()
+        (self.co.betaZero, self.co.betaOne, self.co.betaTwo, self.co.betaThree,
+         self.co.betaFour, self.co.betaFive, self.co.betaSix, self.co.betaSeven) = \
+            (37.88210733101266, 0.0, 0.3102401281180052, 3.16685357490348,
+             0.0, 0.0, 12.221071966082684, 3.1634565878537826)
+        self.co.M, self.co.Gamma, self.co.Upsilon, self.co.Phi, self.co.Tau = 12, 2, 0.0469, 10.0, 0.5
+        self.co.m_lower_bound, self.co.m_upper_bound = 1, 400
+        self.co.R_lower_bound, self.co.R_upper_bound = 1, 400
+        self.co.monetary_unit, self.co.time_unit = "USD", "second"
+        self.co.convert_time_unit_dependent_variables()
+        self.co.calculate_alfa_constants()
+        self.co.optimization_problem = 3
+        self.co.instance_catalogue = [("small", 2, 1.0), ("big", 64, 31.0)]
+
+    def test_node_count_solves_every_instance_type(self) -> None:
+        # "big" HAS THE LOWEST PRICE PER SLOT, BUT BILLING ITS WHOLE (64 SLOTS) NODE MAKES "small" THE CHEAPEST ONE
+        name, result = self.co.solve_with_instance_catalogue(self.co.get_model_parameters(), "node_count")
+        small_result = self.co.solve(self.co.get_model_parameters()
+                                     .replace(Gamma=2, Upsilon=self.co.get_upsilon_in_time_unit(1.0)), "node_count")
+        self.assertEqual(name, "small")
+        self.assertEqual(self.get_allocation(result), self.get_allocation(small_result))
+
+    def test_brute_force_prunes_by_price_per_slot(self) -> None:
+        name, result = self.co.solve_with_instance_catalogue(self.co.get_model_parameters(), "brute_force")
+        big_result = self.co.solve(self.co.get_model_parameters()
+                                   .replace(Gamma=64, Upsilon=self.co.get_upsilon_in_time_unit(31.0)), "brute_force")
+        self.assertEqual(name, "big")
+        self.assertEqual(self.get_allocation(result), self.get_allocation(big_result))
+
+
+
+class CrespOptimizerBruteForceComparisonTest(TestCase):
+
+    SEEDS = range(100)
+
+    @staticmethod
+    def get_allocation(result) -> tuple:
+        return result.m, result.R, result.T3, result.C
+
+    @staticmethod
+    def get_random_optimizer(seed: int) -> CrespOptimizer:
+        # A SMALL RANDOM SCENARIO (SOME β'S ARE ZEROED, SO THAT TIES AND DEGENERATE MODELS ARE ALSO COVERED)
+        random = Random(seed)
+        co = CrespOptimizer()
+        (co.betaZero, co.betaOne, co.betaTwo, co.betaThree, co.betaFour, co.betaFive, co.betaSix, co.betaSeven) = \
+            (random.choice([0.0, random.uniform(0, 40)]) for _ in range(8))
+        co.M, co.Gamma, co.Upsilon = random.randint(1, 500), random.randint(1, 8), random.uniform(0.01, 1)
+        co.Phi, co.Tau = random.uniform(0.001, 5), random.uniform(0.01, 2)
+        co.m_lower_bound = random.randint(1, 5)
+        co.m_upper_bound = co.m_lower_bound + random.randint(1, 30)
+        co.R_lower_bound = random.randint(1, 5)
+        co.R_upper_bound = co.R_lower_bound + random.randint(1, 30)
+        co.monetary_unit, co.time_unit = "USD", random.choice(["second", "minute", "hour"])
+        co.convert_time_unit_dependent_variables()
+        co.calculate_alfa_constants()
+        co.optimization_problem = random.choice([1, 2, 3])
+        return co
+
+    def assert_mode_matches_brute_force(self,
+                                        mode: str,
+                                        seeds: tuple = ()) -> None:
+        for seed in (*self.SEEDS, *seeds):
+            co = self.get_random_optimizer(seed)
+            with self.subTest(seed=seed, optimization_problem=co.optimization_problem):
+                self.assertEqual(self.get_allocation(co.solve(co.get_model_parameters(), mode)),
+                                 self.get_allocation(co.solve(co.get_model_parameters(), "brute_force")))
+
+    def test_pareto_matches_brute_force(self) -> None:
+        # SEEDS 1442, 2556 AND 2836 HAVE SEVERAL ALLOCATIONS WITH THE MINIMUM C (E.G., m=9, R=10 AND m=18, R=20):
+        # BOTH BREAK THE TIE TOWARDS THE LOWEST m, AND THEN THE LOWEST R
+        self.assert_mode_matches_brute_force("pareto", (1442, 2556, 2836))
+
+    def test_branch_and_bound_matches_brute_force(self) -> None:
+        self.assert_mode_matches_brute_force("branch_and_bound", (1442, 2556, 2836))
+
+    def test_structured_matches_brute_force(self) -> None:
+        self.assert_mode_matches_brute_force("structured")
+
+    def test_solve_in_parallel_matches_brute_force(self) -> None:
+        # THE m RANGES ARE SOLVED ON A PROCESS POOL; THEIR MERGE MUST KEEP THE LOWEST m AMONG TIES (SEEDS 1442, 2556
+        # AND 2836), AS THE BRUTE FORCE DOES
+        for seed in (*self.SEEDS[:20], 1442, 2556, 2836):
+            co = self.get_random_optimizer(seed)
+            co.workers = 3
+            with self.subTest(seed=seed, optimization_problem=co.optimization_problem):
+                self.assertEqual(self.get_allocation(co.solve_in_parallel(co.get_model_parameters(),
+                                                                          "brute_force_vectorized")),
+                                 self.get_allocation(co.solve(co.get_model_parameters(), "brute_force")))
+
+    def test_batch_scenarios_match_brute_force(self) -> None:
+        for seed in self.SEEDS[:20]:
+            co = self.get_random_optimizer(seed)
+            random = Random(seed)
+            M = [random.randint(1, 500) for _ in range(10)]
+            Gamma = [random.randint(1, 8) for _ in range(10)]
+            Upsilon = [random.uniform(0.01, 1) for _ in range(10)]
+            Phi = [random.uniform(0.001, 5) for _ in range(10)]
+            Tau = [random.uniform(0.01, 2) for _ in range(10)]
+            # THREE SCENARIOS PER BLOCK, SO THAT THE LAST BLOCK IS A PARTIAL ONE
+            co.vectorized_block_size = 3 * (co.m_upper_bound - co.m_lower_bound + 1)
+            results = co.optimize_scenarios_batch(M, Gamma, Upsilon, Phi, Tau)
+            for scenario in range(10):
+                result = co.solve(co.get_scenario_parameters(M[scenario], Gamma[scenario], Upsilon[scenario],
+                                                             Phi[scenario], Tau[scenario]), "brute_force")
+                with self.subTest(seed=seed, scenario=scenario, optimization_problem=co.optimization_problem):
+                    self.assertEqual((int(results["m"][scenario]), int(results["R"][scenario]),
+                                      float(results["T3"][scenario]), float(results["C"][scenario]),
+                                      int(results["Nu"][scenario]), bool(results["feasible"][scenario])),
+                                     (*self.get_allocation(result), result.Nu, result.m > 0))
+
+    def test_scipy_matches_brute_force(self) -> None:
+        self.assert_mode_matches_brute_force("scipy")
+
+
+
+class CrespPlannersExhaustiveSearchTest(TestCase):
+
+    SEEDS = range(30)
+
+    @staticmethod
+    def get_random_optimizer(random: Random) -> CrespOptimizer:
+        # A TINY m×R GRID, SO THAT EVERY COMBINATION OF THE JOBS' (OR STAGES') ALLOCATIONS CAN BE ENUMERATED
+        co = CrespOptimizer()
+        (co.betaZero, co.betaOne, co.betaTwo, co.betaThree, co.betaFour, co.betaFive, co.betaSix, co.betaSeven) = \
+            (random.uniform(0, 50) * (random.random() < 0.8) for _ in range(8))
+        co.Gamma, co.Upsilon, co.Phi, co.Tau = random.choice([1, 2, 4]), random.uniform(0.01, 0.5), 1.0, 1.0
+        co.m_lower_bound, co.m_upper_bound = 1, 5
+        co.R_lower_bound, co.R_upper_bound = 1, 4
+        co.monetary_unit, co.time_unit = "USD", "second"
+        return co
+
+    @staticmethod
+    def get_random_beta_parameters(random: Random):
+        return None if random.random() < 0.5 else [random.uniform(0, 50) for _ in range(8)]
+
+    @staticmethod
+    def get_allocations_options(co: CrespOptimizer,
+                                parameters) -> list:
+        # (T3, C, ν) OF EVERY (m, R) OF THE GRID
+        options = []
+        for m, R in product(range(co.m_lower_bound, co.m_upper_bound + 1),
+                            range(co.R_lower_bound, co.R_upper_bound + 1)):
+            T3 = parameters.calculate_T3(m, R)
+            options.append((T3, parameters.calculate_C(T3, m, R), -(-(m + R) // parameters.Gamma)))
+        return options
+
+    def test_cluster_planner_matches_exhaustive_search(self) -> None:
+        for seed in self.SEEDS:
+            random = Random(seed)
+            co = self.get_random_optimizer(random)
+            ccp = CrespClusterPlanner()
+            ccp.objective, ccp.limit = random.choice(["time", "cost"]), random.choice(["nodes", "budget"])
+            ccp.jobs = [("job{0}".format(job), random.randint(5, 300), self.get_random_beta_parameters(random))
+                        for job in range(3)]
+            jobs_options = [self.get_allocations_options(co, co.get_scenario_parameters(M, co.Gamma, co.Upsilon,
+                                                                                        co.Phi, co.Tau,
+                                                                                        beta_parameters))
+                            for _, M, beta_parameters in ccp.jobs]
+            if ccp.limit == "nodes":
+                ccp.limit_value = random.randint(3, 12)
+            else:
+                ccp.limit_value = sum(min(option[1] for option in job_options) for job_options in jobs_options) \
+                    * random.uniform(1.0, 3.0)
+                ccp.budget_steps = 500
+            # THE LOWEST TOTAL OBJECTIVE OF THE COMBINATIONS WITHIN THE LIMIT (A PLAN'S COSTS ARE ROUNDED UP TO THE
+            # BUDGET STEPS, AS IN THE PLANNER)
+            expected_total = None
+            for combination in product(*jobs_options):
+                if ccp.limit == "nodes":
+                    is_within_limit = sum(option[2] for option in combination) <= ccp.limit_value
+                else:
+                    is_within_limit = sum(ceil(option[1] / (ccp.limit_value / ccp.budget_steps))
+                                          for option in combination) <= ccp.budget_steps
+                total = sum(option[0 if ccp.objective == "time" else 1] for option in combination)
+                if is_within_limit and (expected_total is None or total < expected_total):
+                    expected_total = total
+            ccp.plan_jobs(co)
+            with self.subTest(seed=seed, objective=ccp.objective, limit=ccp.limit):
+                if expected_total is None:
+                    self.assertIsNone(ccp.plan)
+                else:
+                    self.assertIsNotNone(ccp.plan)
+                    self.assertAlmostEqual(sum(row[3 if ccp.objective == "time" else 4] for row in ccp.plan),
+                                           expected_total, delta=1e-9 * expected_total)
+
+    def test_cluster_planner_rejects_invalid_beta_parameters(self) -> None:
+        for beta_parameters in ["-1.0,0,0,0,0,0,0,0", "nan,0,0,0,0,0,0,0", "1.0,0,0,0,0,0,0,inf"]:
+            with TemporaryDirectory() as directory, self.subTest(beta_parameters=beta_parameters):
+                ccp = CrespClusterPlanner()
+                ccp.jobs_input_file_path = Path(directory) / "jobs.csv"
+                ccp.jobs_input_file_path.write_text("name,M,β0,β1,β2,β3,β4,β5,β6,β7\nwordcount,12,{0}\n"
+                                                    .format(beta_parameters), encoding="utf-8")
+                with self.assertRaises(ValueError):
+                    ccp.load_jobs()
+
+    def test_pipeline_optimizer_matches_exhaustive_search(self) -> None:
+        # A CHAIN, A JOIN, A FORK AND INDEPENDENT STAGES
+        shapes = [[[], [0], [1]], [[], [], [0, 1]], [[], [0], [0]], [[], [], []]]
+        for seed in self.SEEDS:
+            random = Random(seed)
+            co = self.get_random_optimizer(random)
+            co.optimization_problem = random.choice([1, 2, 3])
+            cpo = CrespPipelineOptimizer()
+            cpo.stages = [("stage{0}".format(stage), random.randint(5, 300), self.get_random_beta_parameters(random))
+                          for stage in range(3)]
+            cpo.predecessors = random.choice(shapes)
+            stages_options = [self.get_allocations_options(co, co.get_scenario_parameters(M, co.Gamma, co.Upsilon,
+                                                                                          co.Phi, co.Tau,
+                                                                                          beta_parameters))
+                              for _, M, beta_parameters in cpo.stages]
+            # (MAKESPAN, TOTAL C) OF EVERY COMBINATION OF THE STAGES' ALLOCATIONS
+            plans = []
+            for combination in product(*stages_options):
+                finish_times = []
+                for stage, option in enumerate(combination):
+                    finish_times.append(max((finish_times[predecessor] for predecessor in cpo.predecessors[stage]),
+                                            default=0.0) + option[0])
+                plans.append((max(finish_times), sum(option[1] for option in combination)))
+            # φ AND τ (IN HOURS) AT ONE OF THE PLANS' VALUES, SO THAT THE CONSTRAINTS ARE TIGHT
+            co.Phi = random.choice(plans)[1]
+            co.Tau = random.choice(plans)[0] / 3600 * random.choice([1.0, 0.999999])
+            parameters = co.get_scenario_parameters(cpo.stages[0][1], co.Gamma, co.Upsilon, co.Phi, co.Tau)
+            if co.optimization_problem == 1:
+                feasible_objectives = [T3 for T3, C in plans if C <= parameters.Phi]
+            elif co.optimization_problem == 2:
+                feasible_objectives = [C for T3, C in plans if T3 <= parameters.Tau]
+            else:
+                feasible_objectives = [C for T3, C in plans]
+            cpo.optimize_pipeline(co)
+            with self.subTest(seed=seed, predecessors=cpo.predecessors, optimization_problem=co.optimization_problem):
+                if len(feasible_objectives) == 0:
+                    self.assertIsNone(cpo.plan)
+                else:
+                    self.assertIsNotNone(cpo.plan)
+                    if co.optimization_problem == 1:
+                        objective = max(row[5] for row in cpo.plan)
+                    else:
+                        objective = sum(row[4] for row in cpo.plan)
+                    self.assertAlmostEqual(objective, min(feasible_objectives), delta=1e-9 * min(feasible_objectives))
+
+    def test_pipeline_optimizer_rejects_invalid_beta_parameters(self) -> None:
+        for beta_parameters in ["-1.0,0,0,0,0,0,0,0", "nan,0,0,0,0,0,0,0", "1.0,0,0,0,0,0,0,inf"]:
+            with TemporaryDirectory() as directory, self.subTest(beta_parameters=beta_parameters):
+                cpo = CrespPipelineOptimizer()
+                cpo.stages_input_file_path = Path(directory) / "stages.csv"
+                cpo.stages_input_file_path.write_text("name,M,after,β0,β1,β2,β3,β4,β5,β6,β7\nmap,12,,{0}\n"
+                                                      .format(beta_parameters), encoding="utf-8")
+                with self.assertRaises(ValueError):
+                    cpo.load_stages()
+
+
+if __name__ == "__main__":
+    main()